@@ -0,0 +1,83 @@
+# benchmarks/bench_agent.py
+"""
+Offline throughput benchmark for the RufusAgent pipeline.
+
+Runs planning, relevance scoring and synthesis over synthetic pages against
+the deterministic fake LLM backend, so no network or API key is needed.
+
+Usage:
+    python benchmarks/bench_agent.py --pages 200 --latency 0.05
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from rufus.agent import FakeBackend, RufusAgent
+
+WORDS = [
+    "tuition", "fees", "financial", "aid", "scholarship", "campus", "housing",
+    "admissions", "deadline", "application", "library", "faculty", "research"
+]
+
+TEMPLATE = "<html><body><main><article class='{kind}'><h1>{title}</h1>{body}</article></main></body></html>"
+
+def make_pages(count: int, blocks: int, seed: int = 0) -> list:
+    """Build synthetic pages from a few templates with text blocks."""
+    rng = random.Random(seed)
+    pages = []
+    for n in range(count):
+        texts = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(10, 60))) for _ in range(blocks)]
+        kind = ("news", "program", "listing")[n % 3]
+        html = TEMPLATE.format(
+            kind=kind,
+            title=f"Page {n}",
+            body="".join(f"<p>{text}</p>" for text in texts)
+        )
+        pages.append((f"https://example.edu/{kind}/{n}", html, texts))
+    return pages
+
+async def run(pages: int, blocks: int, latency: float, concurrency: int) -> dict:
+    """Scrape synthetic pages end to end and return timings and LLM stats."""
+    agent = RufusAgent(
+        "offline",
+        config={"llm_rate_limit": 1000, "llm_burst": 1000, "llm_cache": False},
+        backend=FakeBackend(latency=latency, jitter=latency / 2)
+    )
+    instructions = "Find tuition, fees and financial aid information"
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def scrape(url, html, texts):
+        async with semaphore:
+            strategy = await agent.plan_extraction(url, instructions, html)
+            scores = await agent.score_content(texts, instructions, strategy.get("relevance_criteria"))
+            return [
+                {"type": "p", "content": text, "url": url}
+                for text, score in zip(texts, scores) if score["score"] >= 0.5
+            ]
+    
+    start = time.perf_counter()
+    results = await asyncio.gather(*(scrape(*page) for page in make_pages(pages, blocks)))
+    contents = [item for page in results for item in page]
+    await agent.synthesize_documents(contents, instructions)
+    elapsed = time.perf_counter() - start
+    
+    return {"elapsed": elapsed, "items": len(contents), "llm": agent.llm_stats()}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--blocks", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    
+    result = asyncio.run(run(args.pages, args.blocks, args.latency, args.concurrency))
+    print(
+        f"{args.pages} pages, {result['items']} relevant items: "
+        f"{args.pages / result['elapsed']:,.1f} pages/sec"
+    )
+    print(json.dumps(result["llm"], indent=2))
+
+if __name__ == "__main__":
+    main()
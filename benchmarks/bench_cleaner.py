@@ -0,0 +1,56 @@
+# benchmarks/bench_cleaner.py
+"""
+Throughput benchmark for ContentCleaner.
+
+Usage:
+    python benchmarks/bench_cleaner.py --items 50000 --workers 4
+"""
+import argparse
+import random
+import time
+from rufus.extractors import ContentItem
+from rufus.processors import ContentCleaner
+
+WORDS = [
+    "pricing", "plans", "enterprise", "support", "contact", "careers", "benefits",
+    "San", "Francisco", "HR", "policy", "résumé", "naïve", "2024", "$49/month"
+]
+
+def make_items(count: int, markup_share: float, seed: int = 0) -> list:
+    """Build synthetic items, a share of which still carry markup or entities."""
+    rng = random.Random(seed)
+    items = []
+    for _ in range(count):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 40)))
+        if rng.random() < markup_share:
+            text = f"<p>{text} &amp; <b>more</b></p>"
+        items.append(ContentItem("p", text))
+    return items
+
+def run(items: int, workers: int, markup_share: float) -> float:
+    """Clean a batch and return throughput in items per second."""
+    batch = make_items(items, markup_share)
+    cleaner = ContentCleaner({
+        "clean_workers": workers,
+        "clean_parallel_threshold": 1
+    })
+    
+    start = time.perf_counter()
+    cleaner.clean(batch)
+    return items / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--markup-share", type=float, default=0.02)
+    args = parser.parse_args()
+    
+    rate = run(args.items, args.workers, args.markup_share)
+    print(
+        f"{args.items} items, {args.workers} worker(s), "
+        f"{args.markup_share:.0%} with markup: {rate:,.0f} items/sec"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,475 @@
+# src/api/jobs.py
+import asyncio
+import json
+import os
+import time
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from redis import asyncio as aioredis
+from loguru import logger
+from rufus import RufusClient
+from rufus.utils.serialization import json_default
+
+FINISHED = frozenset(['completed', 'failed', 'cancelled'])
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while too many jobs are waiting."""
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+def new_job(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Create the record of a queued scrape job."""
+    return {
+        'job_id': uuid.uuid4().hex,
+        'status': 'queued',
+        'request': request,
+        'progress': 0,
+        'pages_crawled': 0,
+        'result': None,
+        'error': None,
+        'created_at': _now(),
+        'started_at': None,
+        'finished_at': None
+    }
+
+class JobStore(ABC):
+    """
+    Persistent job records and the queue of jobs waiting for a worker.
+    
+    Records are plain JSON; ``enqueue`` and ``dequeue`` hand job ids to
+    workers, and cancel requests are kept apart from the records so a
+    worker saving progress cannot overwrite them.
+    """
+    
+    @abstractmethod
+    async def save(self, job: Dict[str, Any]) -> None:
+        pass
+    
+    @abstractmethod
+    async def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        pass
+    
+    @abstractmethod
+    async def enqueue(self, job_id: str) -> None:
+        pass
+    
+    @abstractmethod
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        """Wait up to ``timeout`` seconds for a job id."""
+        pass
+    
+    async def ack(self, job_id: str) -> None:
+        """Mark a dequeued job as handled by its worker."""
+    
+    @abstractmethod
+    async def queued(self) -> int:
+        """Number of job ids waiting for a worker."""
+        pass
+    
+    @abstractmethod
+    async def request_cancel(self, job_id: str) -> None:
+        pass
+    
+    @abstractmethod
+    async def cancel_requested(self, job_id: str) -> bool:
+        pass
+    
+    async def recover(self) -> int:
+        """Requeue jobs left unfinished by an earlier process; returns how many."""
+        return 0
+
+class LocalQueueMixin:
+    """
+    In-process job queue and cancel requests for single-process stores.
+    
+    Finished jobs older than ``ttl`` seconds are evicted by ``evict``, which
+    ``save`` runs at most once a minute.
+    """
+    
+    ttl: Optional[float] = None
+    
+    def _init_queue(self) -> None:
+        self._cancelled = set()
+        self._queue: Optional[asyncio.Queue] = None
+        self._last_evicted = time.time()
+    
+    @property
+    def queue(self) -> asyncio.Queue:
+        # Created on first use so it belongs to the running event loop
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+    
+    async def enqueue(self, job_id: str) -> None:
+        self.queue.put_nowait(job_id)
+    
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+    
+    async def queued(self) -> int:
+        return self.queue.qsize()
+    
+    async def request_cancel(self, job_id: str) -> None:
+        self._cancelled.add(job_id)
+    
+    async def cancel_requested(self, job_id: str) -> bool:
+        return job_id in self._cancelled
+    
+    async def _maybe_evict(self) -> None:
+        if self.ttl and time.time() - self._last_evicted >= min(self.ttl, 60):
+            self._last_evicted = time.time()
+            await self.evict()
+    
+    @abstractmethod
+    async def evict(self) -> int:
+        """Remove finished jobs older than ``ttl``; returns how many."""
+        pass
+
+class MemoryJobStore(LocalQueueMixin, JobStore):
+    """Job store living in the API process; jobs are lost on restart."""
+    
+    def __init__(self, ttl: Optional[float] = 24 * 3600):
+        self.ttl = ttl
+        # Job id -> (JSON record, time the job finished)
+        self._jobs: Dict[str, Tuple[str, Optional[float]]] = {}
+        self._init_queue()
+    
+    async def save(self, job: Dict[str, Any]) -> None:
+        finished = time.time() if job['status'] in FINISHED else None
+        self._jobs[job['job_id']] = (json.dumps(job, default=json_default), finished)
+        await self._maybe_evict()
+    
+    async def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        record, finished = self._jobs.get(job_id, (None, None))
+        if record is None or self._expired(finished):
+            return None
+        return json.loads(record)
+    
+    def _expired(self, finished: Optional[float]) -> bool:
+        return bool(self.ttl and finished is not None and time.time() - finished > self.ttl)
+    
+    async def evict(self) -> int:
+        expired = [job_id for job_id, (_, finished) in self._jobs.items() if self._expired(finished)]
+        for job_id in expired:
+            del self._jobs[job_id]
+            self._cancelled.discard(job_id)
+        return len(expired)
+
+class FileJobStore(LocalQueueMixin, JobStore):
+    """
+    Job store keeping one JSON file per job in a directory.
+    
+    The queue stays in the API process, but records survive a restart:
+    ``recover`` requeues jobs that were queued or running. Finished jobs
+    are removed ``ttl`` seconds after their last update.
+    """
+    
+    def __init__(self, directory: str, ttl: Optional[float] = 24 * 3600):
+        self.directory = directory
+        self.ttl = ttl
+        self._init_queue()
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, job_id: str) -> str:
+        return os.path.join(self.directory, f"{job_id}.json")
+    
+    async def save(self, job: Dict[str, Any]) -> None:
+        path = self._path(job['job_id'])
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(job, f, ensure_ascii=False, default=json_default)
+        os.replace(temp_path, path)
+        await self._maybe_evict()
+    
+    async def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        # Ids come from URLs; anything but a generated hex id is unknown
+        if not job_id.isalnum():
+            return None
+        try:
+            with open(self._path(job_id), encoding='utf-8') as f:
+                job = json.load(f)
+        except FileNotFoundError:
+            return None
+        if job['status'] in FINISHED and self._expired(self._path(job_id)):
+            return None
+        return job
+    
+    def _expired(self, path: str) -> bool:
+        return bool(self.ttl and time.time() - os.path.getmtime(path) > self.ttl)
+    
+    def _records(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, encoding='utf-8') as f:
+                    yield path, json.load(f)
+            except Exception as e:
+                logger.error(f"Loading job {name} failed: {str(e)}")
+    
+    async def evict(self) -> int:
+        evicted = 0
+        for path, job in self._records():
+            if job['status'] in FINISHED and self._expired(path):
+                os.remove(path)
+                self._cancelled.discard(job['job_id'])
+                evicted += 1
+        return evicted
+    
+    async def recover(self) -> int:
+        await self.evict()
+        recovered = 0
+        for _, job in self._records():
+            if job['status'] not in FINISHED:
+                job.update(status='queued', started_at=None)
+                await self.save(job)
+                await self.enqueue(job['job_id'])
+                recovered += 1
+        return recovered
+
+class RedisJobStore(JobStore):
+    """
+    Job store in Redis, shared by the API and separate worker processes.
+    
+    Records expire ``ttl`` seconds after their last update. The queue is a
+    Redis list, so any number of workers can consume it; a dequeued id is
+    moved to a processing list until its worker acknowledges it, and ids
+    whose job never started are moved back by ``recover``.
+    """
+    
+    def __init__(self, url: str, prefix: str = 'rufus:jobs', ttl: int = 24 * 3600):
+        self.redis = aioredis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+        self.ttl = ttl
+        self.queue_key = f"{prefix}:queue"
+        self.processing_key = f"{prefix}:processing"
+    
+    async def save(self, job: Dict[str, Any]) -> None:
+        await self.redis.setex(
+            f"{self.prefix}:{job['job_id']}",
+            self.ttl,
+            json.dumps(job, default=json_default)
+        )
+    
+    async def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        record = await self.redis.get(f"{self.prefix}:{job_id}")
+        return json.loads(record) if record else None
+    
+    async def enqueue(self, job_id: str) -> None:
+        await self.redis.lpush(self.queue_key, job_id)
+    
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        return await self.redis.blmove(
+            self.queue_key, self.processing_key, max(1, int(timeout)), 'RIGHT', 'LEFT'
+        )
+    
+    async def ack(self, job_id: str) -> None:
+        await self.redis.lrem(self.processing_key, 1, job_id)
+    
+    async def queued(self) -> int:
+        return await self.redis.llen(self.queue_key)
+    
+    async def request_cancel(self, job_id: str) -> None:
+        await self.redis.setex(f"{self.prefix}:{job_id}:cancel", self.ttl, 1)
+    
+    async def cancel_requested(self, job_id: str) -> bool:
+        return bool(await self.redis.exists(f"{self.prefix}:{job_id}:cancel"))
+    
+    async def recover(self) -> int:
+        # Ids popped by a worker that stopped before starting the job; a
+        # job another worker has just popped is skipped by whichever runs second
+        recovered = 0
+        for job_id in await self.redis.lrange(self.processing_key, 0, -1):
+            job = await self.load(job_id)
+            if job is None or job['status'] != 'queued':
+                continue
+            if await self.redis.lrem(self.processing_key, 1, job_id):
+                await self.enqueue(job_id)
+                recovered += 1
+        return recovered
+
+class JobManager:
+    """
+    Runs queued scrape jobs on a pool of asyncio workers.
+    
+    Each job gets a fresh client from ``client_factory`` and its request
+    is passed to ``RufusClient.scrape``. While a job runs, its record is
+    updated every ``progress_interval`` seconds with the pages crawled so
+    far and checked for cancel requests. With ``workers=0`` jobs are only
+    queued, for worker processes sharing the store to run.
+    """
+    
+    def __init__(
+        self,
+        store: JobStore,
+        client_factory: Callable[[], Any],
+        workers: int = 2,
+        max_queued: int = 1000,
+        progress_interval: float = 1.0
+    ):
+        self.store = store
+        self.client_factory = client_factory
+        self.workers = workers
+        self.max_queued = max_queued
+        self.progress_interval = progress_interval
+        self._workers: List[asyncio.Task] = []
+        self._running: Dict[str, asyncio.Task] = {}
+        self._stopping = False
+    
+    async def start(self) -> None:
+        """Requeue unfinished jobs and start the workers."""
+        self._stopping = False
+        recovered = await self.store.recover()
+        if recovered:
+            logger.info(f"Requeued {recovered} unfinished jobs")
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+    
+    async def stop(self) -> None:
+        """Stop the workers; running jobs are queued again."""
+        self._stopping = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+    
+    async def submit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a scrape and return its job record."""
+        if self.max_queued and await self.store.queued() >= self.max_queued:
+            raise QueueFullError(f"Job queue is full ({self.max_queued} jobs waiting)")
+        job = new_job(request)
+        await self.store.save(job)
+        await self.store.enqueue(job['job_id'])
+        return job
+    
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await self.store.load(job_id)
+    
+    async def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a job.
+        
+        A queued job is cancelled at once. A running job is cancelled by the
+        worker running it, immediately in this process or at its next
+        progress update in another one.
+        """
+        job = await self.store.load(job_id)
+        if job is None or job['status'] in FINISHED:
+            return job
+        
+        await self.store.request_cancel(job_id)
+        if job['status'] == 'queued':
+            job.update(status='cancelled', finished_at=_now())
+            await self.store.save(job)
+        elif job_id in self._running:
+            self._running[job_id].cancel()
+        return job
+    
+    async def _work(self) -> None:
+        while True:
+            job_id = await self.store.dequeue(timeout=self.progress_interval)
+            if job_id is None:
+                continue
+            try:
+                await self._run(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job {job_id} failed: {str(e)}")
+            finally:
+                await self.store.ack(job_id)
+    
+    async def _run(self, job_id: str) -> None:
+        job = await self.store.load(job_id)
+        if job is None or job['status'] != 'queued' or await self.store.cancel_requested(job_id):
+            return
+        
+        job.update(status='running', started_at=_now())
+        await self.store.save(job)
+        client = None
+        task = None
+        
+        try:
+            client = self.client_factory()
+            task = asyncio.create_task(client.scrape(**job['request']))
+            self._running[job_id] = task
+            while not task.done():
+                await asyncio.wait({task}, timeout=self.progress_interval)
+                if task.done():
+                    break
+                if await self.store.cancel_requested(job_id):
+                    task.cancel()
+                    continue
+                self._update_progress(job, client)
+                await self.store.save(job)
+            
+            job['result'] = task.result()
+            job['status'] = 'completed'
+        except asyncio.CancelledError:
+            if task is not None and not task.done():
+                task.cancel()
+            if self._stopping:
+                # Shutting down: leave the job for the next worker
+                job.update(status='queued', started_at=None)
+                await self.store.save(job)
+                await self.store.enqueue(job_id)
+                raise
+            job['status'] = 'cancelled'
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {str(e)}")
+            job.update(status='failed', error=str(e))
+        finally:
+            self._running.pop(job_id, None)
+        
+        self._update_progress(job, client)
+        job['finished_at'] = _now()
+        await self.store.save(job)
+    
+    @staticmethod
+    def _update_progress(job: Dict[str, Any], client: Any) -> None:
+        # The crawl stops after max_depth pages, which bounds the estimate
+        job['pages_crawled'] = len(getattr(client, 'visited_urls', ()))
+        if job['status'] == 'completed':
+            job['progress'] = 100
+        elif job['request'].get('max_depth'):
+            job['progress'] = min(99, int(100 * job['pages_crawled'] / job['request']['max_depth']))
+
+def create_rufus_client() -> RufusClient:
+    """Client for one job, configured from the environment."""
+    api_key = os.getenv("RUFUS_API_KEY")
+    if not api_key:
+        raise ValueError("API key not configured")
+    return RufusClient(api_key=api_key)
+
+def job_store_from_env() -> JobStore:
+    """
+    Build the job store selected by ``RUFUS_JOB_STORE``.
+    
+    ``memory`` (the default) keeps jobs in the API process, ``file`` in
+    ``RUFUS_JOB_PATH`` and ``redis`` at ``REDIS_URL``. Finished jobs are
+    kept for ``RUFUS_JOB_TTL`` seconds.
+    """
+    kind = os.getenv('RUFUS_JOB_STORE', 'memory').lower()
+    ttl = int(os.getenv('RUFUS_JOB_TTL', 24 * 3600))
+    if kind == 'memory':
+        return MemoryJobStore(ttl=ttl)
+    if kind == 'file':
+        return FileJobStore(os.getenv('RUFUS_JOB_PATH', 'jobs'), ttl=ttl)
+    if kind == 'redis':
+        return RedisJobStore(os.getenv('REDIS_URL', 'redis://localhost:6379'), ttl=ttl)
+    raise ValueError(f"Unsupported job store: {kind}")
+
+def job_manager_from_env(workers: Optional[int] = None) -> JobManager:
+    """Job manager with the store and worker count set in the environment."""
+    return JobManager(
+        job_store_from_env(),
+        create_rufus_client,
+        workers=int(os.getenv('RUFUS_JOB_WORKERS', 2)) if workers is None else workers,
+        max_queued=int(os.getenv('RUFUS_JOB_MAX_QUEUED', 1000))
+    )
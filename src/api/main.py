@@ -1,19 +1,35 @@
 # src/api/main.py
-from fastapi import FastAPI, HTTPException, Depends
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from .jobs import JobManager, QueueFullError, job_manager_from_env
+from .streaming import ClosingStreamingResponse, ndjson_lines, sse_messages
 from .models import (
     ScrapeRequest,
     ScrapeResponse,
+    JobResponse,
     ErrorResponse
 )
 from rufus import RufusClient
 from loguru import logger
 import os
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the job workers for the lifetime of the app."""
+    jobs = job_manager_from_env()
+    await jobs.start()
+    app.state.jobs = jobs
+    try:
+        yield
+    finally:
+        await jobs.stop()
+
 app = FastAPI(
     title="Rufus API",
     description="AI-powered web scraping API for RAG systems",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -35,6 +51,10 @@ async def get_rufus_client():
         )
     return RufusClient(api_key=api_key)
 
+# Dependency for the job manager started with the app
+def get_job_manager(request: Request) -> JobManager:
+    return request.app.state.jobs
+
 @app.post(
     "/scrape",
     response_model=ScrapeResponse,
@@ -47,20 +67,114 @@ async def scrape_website(
     """Scrape website content based on provided instructions."""
     try:
         documents = await client.scrape(
-            url=request.url,
+            url=str(request.url),
             instructions=request.instructions,
             max_depth=request.max_depth,
-            output_format=request.output_format
+            output_format=request.output_format,
+            deadline=request.deadline
         )
         
         return ScrapeResponse(
             status="success",
             data=documents
         )
-        
+    
     except Exception as e:
         logger.error(f"Scraping failed: {str(e)}")
         raise HTTPException(
             status_code=400,
             detail=str(e)
-        )
\ No newline at end of file
+        )
+
+@app.post(
+    "/scrape/stream",
+    responses={
+        200: {"content": {"application/x-ndjson": {}, "text/event-stream": {}}},
+        500: {"model": ErrorResponse}
+    }
+)
+async def stream_scrape(
+    request: ScrapeRequest,
+    http_request: Request,
+    client: RufusClient = Depends(get_rufus_client)
+):
+    """
+    Stream each page's content, progress and the final metadata while the crawl runs.
+    
+    Events are sent as NDJSON, or as Server-Sent Events when the client
+    accepts ``text/event-stream``. The crawl is cancelled if the client
+    disconnects.
+    """
+    events = client.scrape_stream(
+        url=str(request.url),
+        instructions=request.instructions,
+        max_depth=request.max_depth,
+        deadline=request.deadline
+    )
+    
+    if "text/event-stream" in http_request.headers.get("accept", ""):
+        return ClosingStreamingResponse(
+            sse_messages(events),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"}
+        )
+    return ClosingStreamingResponse(
+        ndjson_lines(events),
+        media_type="application/x-ndjson"
+    )
+
+@app.post(
+    "/jobs",
+    response_model=JobResponse,
+    status_code=202,
+    responses={503: {"model": ErrorResponse}}
+)
+async def create_job(
+    request: ScrapeRequest,
+    jobs: JobManager = Depends(get_job_manager)
+):
+    """Queue a scrape and return its job id without waiting for the crawl."""
+    try:
+        job = await jobs.submit(request.model_dump(mode="json"))
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e)
+        )
+    return JobResponse(**job)
+
+@app.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    responses={404: {"model": ErrorResponse}}
+)
+async def get_job(
+    job_id: str,
+    jobs: JobManager = Depends(get_job_manager)
+):
+    """Report a job's status and progress, and its result once completed."""
+    job = await jobs.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Job not found"
+        )
+    return JobResponse(**job)
+
+@app.delete(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    responses={404: {"model": ErrorResponse}}
+)
+async def cancel_job(
+    job_id: str,
+    jobs: JobManager = Depends(get_job_manager)
+):
+    """Cancel a queued or running job."""
+    job = await jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Job not found"
+        )
+    return JobResponse(**job)
\ No newline at end of file
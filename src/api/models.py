@@ -1,13 +1,18 @@
 # src/api/models.py
-from pydantic import BaseModel, HttpUrl
-from typing import Dict, Optional, Literal
+from pydantic import BaseModel, Field, HttpUrl
+from typing import Any, Dict, Optional, Literal
 
 class ScrapeRequest(BaseModel):
     """Request model for website scraping."""
     url: HttpUrl
     instructions: str
     max_depth: Optional[int] = 3
-    output_format: Optional[Literal["json", "csv", "markdown"]] = "json"
+    output_format: Optional[Literal["json", "csv", "markdown", "chunks"]] = "json"
+    deadline: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Seconds to wait before returning partial results"
+    )
     
     class Config:
         json_schema_extra = {
@@ -15,7 +20,8 @@ class ScrapeRequest(BaseModel):
                 "url": "https://example.com",
                 "instructions": "Extract FAQ content",
                 "max_depth": 2,
-                "output_format": "json"
+                "output_format": "json",
+                "deadline": 30
             }
         }
 
@@ -24,6 +30,18 @@ class ScrapeResponse(BaseModel):
     status: str
     data: Dict
 
+class JobResponse(BaseModel):
+    """Status, progress and, once completed, result of a scrape job."""
+    job_id: str
+    status: Literal["queued", "running", "completed", "failed", "cancelled"]
+    progress: int = Field(0, description="Estimated percent done")
+    pages_crawled: int = 0
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
 class ErrorResponse(BaseModel):
     """Error response model."""
     detail: str
\ No newline at end of file
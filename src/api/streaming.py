@@ -0,0 +1,52 @@
+# src/api/streaming.py
+import json
+import anyio
+from typing import Any, AsyncIterator, Dict
+from fastapi.responses import StreamingResponse
+from loguru import logger
+from rufus.utils.serialization import json_default
+
+async def _guarded(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+    # Headers are already sent, so failures end the stream with an error event
+    try:
+        async for event in events:
+            yield event
+    except Exception as e:
+        logger.error(f"Streaming scrape failed: {str(e)}")
+        yield {"event": "error", "detail": str(e)}
+    finally:
+        await events.aclose()
+
+async def ndjson_lines(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[str]:
+    """Encode scrape events as newline-delimited JSON."""
+    guarded = _guarded(events)
+    try:
+        async for event in guarded:
+            yield json.dumps(event, default=json_default) + "\n"
+    finally:
+        await guarded.aclose()
+
+async def sse_messages(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[str]:
+    """Encode scrape events as Server-Sent Events named after the event type."""
+    guarded = _guarded(events)
+    try:
+        async for event in guarded:
+            yield f"event: {event['event']}\ndata: {json.dumps(event, default=json_default)}\n\n"
+    finally:
+        await guarded.aclose()
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    Streaming response that closes its iterator however the response ends.
+    
+    Starlette stops reading the iterator when the client disconnects but
+    leaves it open; closing it cancels the crawl that feeds it. The close
+    is shielded because a disconnect cancels the surrounding scope.
+    """
+    
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            with anyio.CancelScope(shield=True):
+                await self.body_iterator.aclose()
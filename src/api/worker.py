@@ -0,0 +1,38 @@
+# src/api/worker.py
+"""
+Standalone worker for scrape jobs queued through the API.
+
+Worker processes share the API's job store, so it must be one that crosses
+processes (``RUFUS_JOB_STORE=redis``). Start the API with
+``RUFUS_JOB_WORKERS=0`` to leave every job to the worker processes.
+
+Usage:
+    python -m src.api.worker --workers 4
+"""
+import argparse
+import asyncio
+import os
+from loguru import logger
+from .jobs import job_manager_from_env
+
+async def run(workers: int) -> None:
+    jobs = job_manager_from_env(workers)
+    await jobs.start()
+    logger.info(f"Running {workers} job workers")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await jobs.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=int(os.getenv("RUFUS_JOB_WORKERS", 2)))
+    args = parser.parse_args()
+    
+    try:
+        asyncio.run(run(args.workers))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
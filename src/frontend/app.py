@@ -3,6 +3,7 @@ import streamlit as st
 import asyncio
 import os
 from typing import Dict, Any
+import io
 import json
 from datetime import datetime
 from dotenv import load_dotenv
@@ -119,11 +120,11 @@ def main():
             if view_mode == "JSON":
                 # Show raw JSON with syntax highlighting
                 st.code(json.dumps(results, indent=2), language="json")
-                
+            
             elif view_mode == "Tree":
                 # Show collapsible JSON tree
                 display_json_tree(results)
-                
+            
             else:  # Formatted view
                 if results["content"].get("title"):
                     st.markdown(f"### {results['content']['title']}")
@@ -160,14 +161,15 @@ def main():
             with col2:
                 # Export as CSV option
                 if st.button("Export as CSV"):
+                    from rufus.processors import CSVSink
+                    
                     # Convert to CSV format
-                    csv_data = "Type,Content\n"
-                    for item_type, items in results["content"].items():
-                        if isinstance(items, list):
-                            for item in items:
-                                csv_data += f"{item_type},{item.replace(',', ' ')}\n"
-                        else:
-                            csv_data += f"{item_type},{str(items).replace(',', ' ')}\n"
+                    buffer = io.StringIO()
+                    with CSVSink(buffer, fields=("type", "content")) as sink:
+                        for item_type, items in results["content"].items():
+                            for item in (items if isinstance(items, list) else [items]):
+                                sink.write({"type": item_type, "content": item})
+                    csv_data = buffer.getvalue()
                     
                     st.download_button(
                         "Download CSV",
@@ -175,7 +177,7 @@ def main():
                         file_name=f"rufus_extraction_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                         mime="text/csv"
                     )
-            
+        
         except Exception as e:
             st.error(f"Extraction failed: {str(e)}")
             st.error("Please check your inputs and try again")
@@ -1,3 +1,21 @@
 from .ai_agent import RufusAgent
+from .backends import (
+    ChatModelBackend,
+    Completion,
+    FakeBackend,
+    LLMBackend,
+    OpenAIBackend,
+    RecordingBackend
+)
+from .strategy_registry import StrategyRegistry
 
-__all__ = ['RufusAgent']
\ No newline at end of file
+__all__ = [
+    'ChatModelBackend',
+    'Completion',
+    'FakeBackend',
+    'LLMBackend',
+    'OpenAIBackend',
+    'RecordingBackend',
+    'RufusAgent',
+    'StrategyRegistry'
+]
\ No newline at end of file
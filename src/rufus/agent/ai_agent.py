@@ -1,23 +1,64 @@
 # src/rufus/agent/ai_agent.py
-from typing import Dict, List, Optional
-from langchain.chat_models import ChatOpenAI
+from itertools import groupby
+from typing import Any, Callable, Dict, List, Optional, Sequence
 from langchain.prompts import ChatPromptTemplate
+import asyncio
 import json
 from loguru import logger
+from ..extractors.fingerprint import template_fingerprint
+from ..processors.chunker import Chunker, estimate_tokens
+from ..search.coverage import structured_coverage
+from ..search.prefilter import RelevancePrefilter
+from ..utils.llm_cache import LLMCache, cache_key
+from ..utils.rate_limiter import RateLimiter
+from ..utils.serialization import json_default
+from .backends import LLMBackend, RecordingBackend, backend_from_config
 from .prompt_templates import (
     STRATEGY_PROMPT,
     RELEVANCE_PROMPT,
-    SYNTHESIS_PROMPT
+    BATCH_RELEVANCE_PROMPT,
+    SYNTHESIS_PROMPT,
+    MERGE_PROMPT
 )
+from .strategy_registry import StrategyRegistry
+
+FAILED_EVALUATION = {"score": 0.0, "explanation": "Evaluation failed"}
+
+def _is_json(text: str) -> bool:
+    try:
+        json.loads(text)
+        return True
+    except json.JSONDecodeError:
+        return False
 
 class RufusAgent:
     """AI agent for intelligent web scraping."""
     
-    def __init__(self, api_key: str, model: str = "gpt-4"):
-        self.llm = ChatOpenAI(
-            model_name=model,
-            temperature=0.1,
-            api_key=api_key
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4",
+        config: Optional[Dict] = None,
+        cache: Optional[LLMCache] = None,
+        backend: Optional[LLMBackend] = None
+    ):
+        self.config = config or {}
+        self.model = model
+        self.temperature = self.config.get('temperature', 0.1)
+        # Every model call is recorded by call type; see llm_stats
+        self.llm = RecordingBackend(
+            backend if backend is not None else backend_from_config(api_key, model, self.config)
+        )
+        
+        # Identical calls are answered from the cache; see LLMCache.from_config
+        self.cache = cache if cache is not None else LLMCache.from_config(self.config)
+        self.prefilter = RelevancePrefilter(self.config)
+        # Strategies are planned once per site template; see StrategyRegistry
+        self.strategies = StrategyRegistry(self.config)
+        self._planning: Dict[str, asyncio.Lock] = {}
+        self.rate_limiter = RateLimiter(
+            requests_per_second=self.config.get('llm_rate_limit', 5),
+            burst_size=self.config.get('llm_burst', 5)
         )
         
         self.strategy_prompt = ChatPromptTemplate.from_messages([
@@ -28,29 +69,96 @@ class RufusAgent:
             ("system", RELEVANCE_PROMPT)
         ])
         
+        self.batch_relevance_prompt = ChatPromptTemplate.from_messages([
+            ("system", BATCH_RELEVANCE_PROMPT)
+        ])
+        
         self.synthesis_prompt = ChatPromptTemplate.from_messages([
             ("system", SYNTHESIS_PROMPT)
         ])
+        
+        self.merge_prompt = ChatPromptTemplate.from_messages([
+            ("system", MERGE_PROMPT)
+        ])
+    
+    async def _generate(
+        self,
+        prompt: ChatPromptTemplate,
+        template: str,
+        variables: Dict[str, Any],
+        call_type: str,
+        validate: Callable[[str], bool] = _is_json,
+        retry: bool = False
+    ) -> str:
+        """
+        Render a prompt and return the model's reply, using the cache.
+        
+        Model calls are paced by the agent's rate limiter. Only replies that
+        pass ``validate`` (by default: parse as JSON) are cached, so a
+        malformed reply is retried on the next call instead of being replayed.
+        """
+        key = None
+        if self.cache is not None:
+            key = cache_key(self.model, template, variables, self.temperature)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.llm.record_cache_hit(call_type)
+                return cached
+        
+        await self.rate_limiter.wait()
+        completion = await self.llm.generate(prompt.format_messages(**variables), call_type, retry)
+        text = completion.text
+        
+        if key is not None and validate(text):
+            self.cache.set(key, text)
+        return text
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return LLM cache hit and miss counters."""
+        return self.cache.stats() if self.cache is not None else {}
+    
+    def llm_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return model calls, tokens, latency, errors, retries and cache hits by call type."""
+        return self.llm.report()
     
     async def plan_extraction(
         self,
         url: str,
-        instructions: str
+        instructions: str,
+        html: Optional[str] = None
     ) -> Dict:
-        """Generate extraction strategy based on instructions."""
-        try:
-            response = await self.llm.agenerate([{
-                "url": url,
-                "instructions": instructions
-            }])
+        """
+        Generate extraction strategy based on instructions.
+        
+        With the page's ``html``, a strategy already planned for a page of the
+        same site and template is reused instead of asking the model again.
+        Concurrent calls for one site wait for a single plan.
+        """
+        fingerprint = template_fingerprint(html) if html is not None else None
+        key = StrategyRegistry.key(url, instructions)
+        
+        async with self._planning.setdefault(key, asyncio.Lock()):
+            strategy = self.strategies.lookup(url, instructions, fingerprint)
+            if strategy is not None:
+                logger.debug(f"Reusing extraction strategy for {url}")
+                return strategy
             
-            strategy = self._parse_strategy(response.generations[0].text)
-            logger.info(f"Generated extraction strategy for {url}")
-            return strategy
+            try:
+                text = await self._generate(self.strategy_prompt, STRATEGY_PROMPT, {
+                    "url": url,
+                    "instructions": instructions
+                }, "strategy")
+                
+                strategy = self._parse_strategy(text)
+                # Fallback strategies are not learned, so the template is planned again
+                if _is_json(text):
+                    self.strategies.store(url, instructions, fingerprint, strategy)
+                logger.info(f"Generated extraction strategy for {url}")
+                return strategy
             
-        except Exception as e:
-            logger.error(f"Strategy generation failed: {str(e)}")
-            return self._get_default_strategy()
+            except Exception as e:
+                logger.error(f"Strategy generation failed: {str(e)}")
+                return self._get_default_strategy()
     
     async def evaluate_content(
         self,
@@ -59,37 +167,347 @@ class RufusAgent:
     ) -> Dict:
         """Evaluate content relevance."""
         try:
-            response = await self.llm.agenerate([{
+            text = await self._generate(self.relevance_prompt, RELEVANCE_PROMPT, {
                 "content": content,
                 "context": context
-            }])
+            }, "relevance")
             
-            evaluation = self._parse_evaluation(response.generations[0].text)
+            evaluation = self._parse_evaluation(text)
             return evaluation
-            
+        
         except Exception as e:
             logger.error(f"Content evaluation failed: {str(e)}")
             return {"score": 0.0, "explanation": "Evaluation failed"}
     
+    async def evaluate_many(
+        self,
+        contents: Sequence[str],
+        context: str,
+        batch_tokens: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Evaluate the relevance of many content blocks.
+        
+        Identical blocks are scored once. Blocks are packed into prompts of
+        up to ``batch_tokens`` estimated tokens and the batches are sent
+        concurrently, at most ``concurrency`` at a time and paced by the rate
+        limiter. A batch whose reply does not score every block is split in
+        half and retried; a single block that still fails gets the same
+        fallback result as ``evaluate_content``.
+        
+        Args:
+            contents: Content blocks to score
+            context: Extraction instructions the blocks are scored against
+            batch_tokens: Token budget per prompt; defaults to the
+                ``evaluation_batch_tokens`` config key
+            concurrency: Batches in flight; defaults to the
+                ``evaluation_concurrency`` config key
+        
+        Returns:
+            One evaluation per block, in input order
+        """
+        batch_tokens = batch_tokens or self.config.get('evaluation_batch_tokens', 3000)
+        semaphore = asyncio.Semaphore(concurrency or self.config.get('evaluation_concurrency', 4))
+        
+        unique = list(dict.fromkeys(contents))
+        batches: List[List[str]] = []
+        tokens = 0
+        for text in unique:
+            cost = estimate_tokens(text) + 8
+            if batches and tokens + cost <= batch_tokens:
+                batches[-1].append(text)
+                tokens += cost
+            else:
+                batches.append([text])
+                tokens = cost
+        
+        results: Dict[str, Dict] = {}
+        await asyncio.gather(*(
+            self._evaluate_batch(batch, context, semaphore, results)
+            for batch in batches
+        ))
+        return [dict(results.get(text, FAILED_EVALUATION)) for text in contents]
+    
+    async def score_content(
+        self,
+        contents: Sequence[str],
+        instructions: str,
+        relevance_criteria: Optional[Sequence[str]] = None
+    ) -> List[Dict]:
+        """
+        Score content relevance, asking the model only about ambiguous blocks.
+        
+        Blocks are first scored lexically against the instructions and the
+        strategy's ``relevance_criteria`` by ``RelevancePrefilter``. Clear
+        matches and clear misses keep their lexical score; the rest are sent
+        to ``evaluate_many``. Each result names the ``stage`` that scored it.
+        
+        Returns:
+            One evaluation per block, in input order
+        """
+        triage = self.prefilter.triage(contents, instructions, relevance_criteria)
+        scores = triage["scores"]
+        results: List[Dict] = [{}] * len(contents)
+        
+        for i in triage["accepted"]:
+            results[i] = {"score": scores[i], "explanation": "Strong lexical match", "stage": "lexical"}
+        for i in triage["rejected"]:
+            results[i] = {"score": scores[i], "explanation": "Below lexical threshold", "stage": "lexical"}
+        
+        ambiguous = triage["ambiguous"]
+        if ambiguous:
+            evaluations = await self.evaluate_many([contents[i] for i in ambiguous], instructions)
+            for i, evaluation in zip(ambiguous, evaluations):
+                results[i] = {**evaluation, "stage": "llm"}
+        
+        logger.info(
+            f"Relevance prefilter: {len(triage['accepted'])} accepted, "
+            f"{len(ambiguous)} sent to the model, {len(triage['rejected'])} rejected"
+        )
+        return results
+    
+    async def _evaluate_batch(
+        self,
+        batch: List[str],
+        context: str,
+        semaphore: asyncio.Semaphore,
+        results: Dict[str, Dict],
+        retry: bool = False
+    ) -> None:
+        """Score one batch, splitting it in half if the reply is unusable."""
+        blocks = "\n\n".join(f"[{i}] {text}" for i, text in enumerate(batch))
+        
+        async with semaphore:
+            try:
+                text = await self._generate(
+                    self.batch_relevance_prompt,
+                    BATCH_RELEVANCE_PROMPT,
+                    {"context": context, "blocks": blocks},
+                    "relevance",
+                    validate=lambda reply: self._parse_batch_evaluation(reply, len(batch)) is not None,
+                    retry=retry
+                )
+                evaluations = self._parse_batch_evaluation(text, len(batch))
+            except Exception as e:
+                logger.error(f"Batch evaluation failed: {str(e)}")
+                evaluations = None
+        
+        if evaluations is not None:
+            results.update(zip(batch, evaluations))
+        elif len(batch) > 1:
+            # Retry outside the semaphore so the halves can take its slots
+            middle = len(batch) // 2
+            await asyncio.gather(
+                self._evaluate_batch(batch[:middle], context, semaphore, results, retry=True),
+                self._evaluate_batch(batch[middle:], context, semaphore, results, retry=True)
+            )
+        else:
+            logger.warning("Evaluation of a single block could not be parsed")
+    
+    def structured_answers(
+        self,
+        contents: Sequence[Dict],
+        instructions: str
+    ) -> Dict[Optional[str], Dict]:
+        """
+        Answer pages from their embedded structured data.
+        
+        A page is answered when the field names and types of its
+        ``structured`` items (JSON-LD, microdata, RDFa, OpenGraph) cover at
+        least ``structured_coverage`` of the instructions' terms. Answered
+        pages need no relevance scoring or synthesis by the model; callers
+        can drop their other items before ``score_content``.
+        
+        Returns:
+            A document per answered page URL
+        """
+        threshold = self.config.get('structured_coverage', 0.75)
+        pages: Dict[Optional[str], List[Dict]] = {}
+        for item in contents:
+            if item.get("type") == "structured":
+                pages.setdefault(item.get("url"), []).append(item)
+        
+        answers = {}
+        for url, items in pages.items():
+            coverage = structured_coverage(items, instructions)
+            if coverage["coverage"] >= threshold:
+                answers[url] = {
+                    "url": url,
+                    "source": "structured_data",
+                    "matched": coverage["matched"],
+                    "items": [
+                        {"format": item.get("format"), "type": item.get("schema_type"), "data": item.get("data")}
+                        for item in items
+                    ]
+                }
+        return answers
+    
     async def synthesize_documents(
         self,
         contents: List[Dict],
         instructions: str
     ) -> Dict:
-        """Synthesize extracted content into structured documents."""
+        """
+        Synthesize extracted content into structured documents.
+        
+        Content that fits in ``synthesis_chunk_tokens`` is synthesized in one
+        call. Larger crawls are synthesized map-reduce style: pages are packed
+        into token-bounded groups (long pages are chunked by section) and
+        synthesized concurrently, then the partial syntheses are merged in a
+        tree, ``synthesis_fan_in`` at a time, until one document remains. At
+        most ``synthesis_concurrency`` calls run at once and every partial
+        result goes through the LLM cache, so repeat runs only pay for
+        groups whose content changed.
+        
+        Pages answered by ``structured_answers`` skip the map step and join
+        the merge as they are; if every page is answered, no model call is
+        made. Set ``structured_fast_path`` to False to synthesize them too.
+        """
         try:
-            response = await self.llm.agenerate([{
-                "content": json.dumps(contents),
-                "instructions": instructions
-            }])
+            budget = self.config.get('synthesis_chunk_tokens', 6000)
+            semaphore = asyncio.Semaphore(self.config.get('synthesis_concurrency', 4))
             
-            synthesis = self._parse_synthesis(response.generations[0].text)
-            return synthesis
+            answers = {}
+            remaining = contents
+            if self.config.get('structured_fast_path', True):
+                answers = self.structured_answers(contents, instructions)
+            if answers:
+                logger.info(f"Answered {len(answers)} pages from structured data")
+                remaining = [item for item in contents if item.get("url") not in answers]
+                if not remaining:
+                    documents = list(answers.values())
+                    return documents[0] if len(documents) == 1 else {
+                        "source": "structured_data",
+                        "documents": documents
+                    }
             
+            groups = self._synthesis_groups(remaining, budget)
+            partials = await asyncio.gather(*(
+                self._synthesize_group(group, instructions, semaphore)
+                for group in groups
+            ))
+            partials = [partial for partial in partials if partial is not None]
+            if len(partials) < len(groups):
+                logger.warning(f"{len(groups) - len(partials)} of {len(groups)} synthesis groups failed")
+            partials = list(answers.values()) + partials
+            if not partials:
+                return {"error": "Synthesis failed", "raw_content": contents}
+            
+            level = 0
+            while len(partials) > 1:
+                level += 1
+                merges = self._merge_groups(partials, budget)
+                logger.info(f"Merging {len(partials)} partial syntheses in {len(merges)} groups (level {level})")
+                partials = await asyncio.gather(*(
+                    self._merge_partials(group, instructions, semaphore)
+                    for group in merges
+                ))
+            
+            return partials[0]
+        
         except Exception as e:
             logger.error(f"Document synthesis failed: {str(e)}")
             return {"error": "Synthesis failed", "raw_content": contents}
     
+    @staticmethod
+    def _tokens(value: Any) -> int:
+        return estimate_tokens(json.dumps(value, default=json_default))
+    
+    def _synthesis_groups(self, contents: List[Dict], budget: int) -> List[List[Dict]]:
+        """Pack content into token-bounded groups, keeping pages together where they fit."""
+        groups: List[List[Dict]] = []
+        current: List[Dict] = []
+        tokens = 0
+        
+        for _, page in groupby(contents, key=lambda item: item.get("url")):
+            page = list(page)
+            page_tokens = sum(self._tokens(item) for item in page)
+            
+            if page_tokens > budget:
+                # Split oversized pages along sections instead of mid-sentence
+                chunker = Chunker({"chunk_size": budget, "chunk_overlap": 0})
+                pieces = [chunk.to_dict() for chunk in chunker.chunk(page)]
+                pieces = [[piece] for piece in pieces]
+            else:
+                pieces = [page]
+            
+            for piece in pieces:
+                piece_tokens = page_tokens if piece is page else self._tokens(piece)
+                if current and tokens + piece_tokens > budget:
+                    groups.append(current)
+                    current, tokens = [], 0
+                current.extend(piece)
+                tokens += piece_tokens
+        
+        if current:
+            groups.append(current)
+        return groups
+    
+    def _merge_groups(self, partials: List[Dict], budget: int) -> List[List[Dict]]:
+        """Group partial syntheses for one merge level."""
+        fan_in = max(2, self.config.get('synthesis_fan_in', 4))
+        groups: List[List[Dict]] = []
+        tokens = 0
+        for partial in partials:
+            partial_tokens = self._tokens(partial)
+            if groups and len(groups[-1]) < fan_in and tokens + partial_tokens <= budget:
+                groups[-1].append(partial)
+                tokens += partial_tokens
+            else:
+                groups.append([partial])
+                tokens = partial_tokens
+        
+        if len(groups) == len(partials):
+            # Partials too large to share a budget are still merged pairwise,
+            # so every level halves the count and the tree terminates
+            groups = [partials[i:i + 2] for i in range(0, len(partials), 2)]
+        return groups
+    
+    async def _synthesize_group(
+        self,
+        group: List[Dict],
+        instructions: str,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[Dict]:
+        """Synthesize one group of content (map step); None if it failed."""
+        try:
+            async with semaphore:
+                text = await self._generate(self.synthesis_prompt, SYNTHESIS_PROMPT, {
+                    "content": json.dumps(group, default=json_default),
+                    "instructions": instructions
+                }, "synthesis")
+        except Exception as e:
+            logger.error(f"Group synthesis failed: {str(e)}")
+            return None
+        
+        synthesis = self._parse_synthesis(text)
+        return None if "error" in synthesis else synthesis
+    
+    async def _merge_partials(
+        self,
+        group: List[Dict],
+        instructions: str,
+        semaphore: asyncio.Semaphore
+    ) -> Dict:
+        """Merge partial syntheses (reduce step), keeping them side by side on failure."""
+        if len(group) == 1:
+            return group[0]
+        
+        try:
+            async with semaphore:
+                text = await self._generate(self.merge_prompt, MERGE_PROMPT, {
+                    "partials": json.dumps(group, default=json_default),
+                    "instructions": instructions
+                }, "synthesis")
+            merged = self._parse_synthesis(text)
+            if "error" not in merged:
+                return merged
+        except Exception as e:
+            logger.error(f"Synthesis merge failed: {str(e)}")
+        
+        return {"sections": group}
+    
     def _parse_strategy(self, strategy_text: str) -> Dict:
         """Parse LLM strategy output into structured format."""
         try:
@@ -105,6 +523,42 @@ class RufusAgent:
         except json.JSONDecodeError:
             return {"score": 0.0, "explanation": "Failed to parse evaluation"}
     
+    def _parse_batch_evaluation(self, evaluation_text: str, count: int) -> Optional[List[Dict]]:
+        """
+        Parse a batch evaluation reply.
+        
+        Returns:
+            One evaluation per block in block order, or None unless the
+            reply scores every block
+        """
+        try:
+            parsed = json.loads(evaluation_text)
+        except json.JSONDecodeError:
+            return None
+        if isinstance(parsed, dict):
+            parsed = parsed.get("evaluations", parsed.get("results"))
+        if not isinstance(parsed, list):
+            return None
+        
+        evaluations: Dict[int, Dict] = {}
+        for entry in parsed:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                block_id = int(entry["id"])
+                score = min(1.0, max(0.0, float(entry["score"])))
+            except (KeyError, TypeError, ValueError):
+                continue
+            evaluations[block_id] = {
+                "score": score,
+                "explanation": str(entry.get("explanation", "")),
+                "key_matches": list(entry.get("key_matches") or [])
+            }
+        
+        if any(i not in evaluations for i in range(count)):
+            return None
+        return [evaluations[i] for i in range(count)]
+    
     def _parse_synthesis(self, synthesis_text: str) -> Dict:
         """Parse LLM synthesis output."""
         try:
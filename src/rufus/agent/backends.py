@@ -0,0 +1,279 @@
+# src/rufus/agent/backends.py
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from ..processors.chunker import estimate_tokens
+
+# Call types the agent reports on
+CALL_TYPES = ('strategy', 'relevance', 'synthesis')
+
+BLOCK_ID = re.compile(r'^\[(\d+)\] (.*)$', re.MULTILINE)
+
+class Completion:
+    """A model reply and its token usage, where the backend reports it."""
+    
+    __slots__ = ('text', 'prompt_tokens', 'completion_tokens')
+    
+    def __init__(
+        self,
+        text: str,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None
+    ):
+        self.text = text
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+
+def _prompt_text(messages: Sequence[Any]) -> str:
+    return "\n".join(str(getattr(message, 'content', message)) for message in messages)
+
+class LLMBackend(ABC):
+    """
+    Interface of the chat models used by ``RufusAgent``.
+    
+    A backend receives the rendered prompt messages, the type of call (one
+    of ``CALL_TYPES``) and whether the call retries part of an earlier one,
+    and returns a ``Completion``.
+    """
+    
+    @abstractmethod
+    async def generate(
+        self,
+        messages: Sequence[Any],
+        call_type: str = 'other',
+        retry: bool = False
+    ) -> Completion:
+        pass
+
+class ChatModelBackend(LLMBackend):
+    """Backend wrapping a LangChain chat model."""
+    
+    def __init__(self, llm):
+        self.llm = llm
+    
+    async def generate(
+        self,
+        messages: Sequence[Any],
+        call_type: str = 'other',
+        retry: bool = False
+    ) -> Completion:
+        response = await self.llm.agenerate([list(messages)])
+        usage = (getattr(response, 'llm_output', None) or {}).get('token_usage') or {}
+        return Completion(
+            response.generations[0][0].text,
+            usage.get('prompt_tokens'),
+            usage.get('completion_tokens')
+        )
+
+class OpenAIBackend(ChatModelBackend):
+    """OpenAI chat models through LangChain."""
+    
+    def __init__(self, api_key: str, model: str = "gpt-4", temperature: float = 0.1):
+        from langchain.chat_models import ChatOpenAI
+        super().__init__(ChatOpenAI(
+            model_name=model,
+            temperature=temperature,
+            api_key=api_key
+        ))
+
+def _fake_score(text: str) -> float:
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=1).digest()
+    return round(digest[0] / 255, 2)
+
+def _fake_strategy(prompt: str) -> str:
+    return json.dumps({
+        "priority_pages": [],
+        "content_patterns": ["article", "main", "p", "h1", "h2"],
+        "relevance_criteria": [],
+        "ignore_patterns": ["nav", "header", "footer"],
+        "extraction_rules": {"text": "getText"}
+    })
+
+def _fake_relevance(prompt: str) -> str:
+    blocks = BLOCK_ID.findall(prompt)
+    if blocks:
+        return json.dumps([
+            {"id": int(block_id), "score": _fake_score(text), "explanation": "fake", "key_matches": []}
+            for block_id, text in blocks
+        ])
+    return json.dumps({"score": _fake_score(prompt), "explanation": "fake", "key_matches": []})
+
+def _fake_synthesis(prompt: str) -> str:
+    return json.dumps({
+        "title": "Synthesized document",
+        "sections": [{"heading": "Summary", "characters": len(prompt)}]
+    })
+
+Responder = Union[str, Callable[[str], str]]
+
+class FakeBackend(LLMBackend):
+    """
+    Deterministic local backend for tests and offline benchmarks.
+    
+    Replies are canned JSON per call type: a fixed strategy, relevance
+    scores derived from a hash of each block, and a small synthesis.
+    ``responses`` overrides the reply for a call type with a string or a
+    function of the prompt text. Every call sleeps ``latency`` seconds plus
+    up to ``jitter`` drawn from a seeded generator.
+    """
+    
+    def __init__(
+        self,
+        responses: Optional[Dict[str, Responder]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int = 0
+    ):
+        self.responses: Dict[str, Responder] = {
+            'strategy': _fake_strategy,
+            'relevance': _fake_relevance,
+            'synthesis': _fake_synthesis
+        }
+        self.responses.update(responses or {})
+        self.latency = latency
+        self.jitter = jitter
+        self.calls = 0
+        self._random = random.Random(seed)
+    
+    async def generate(
+        self,
+        messages: Sequence[Any],
+        call_type: str = 'other',
+        retry: bool = False
+    ) -> Completion:
+        self.calls += 1
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        prompt = _prompt_text(messages)
+        response = self.responses.get(call_type, '{}')
+        text = response(prompt) if callable(response) else response
+        return Completion(text, estimate_tokens(prompt), estimate_tokens(text))
+
+def backend_from_config(api_key: str, model: str, config: Optional[Dict] = None) -> LLMBackend:
+    """
+    Build the backend selected by the ``llm_backend`` config key.
+    
+    ``openai`` (the default) calls the OpenAI API; ``fake`` uses
+    ``FakeBackend`` with ``fake_llm_latency``, ``fake_llm_jitter`` and
+    ``fake_llm_seed``.
+    """
+    config = config or {}
+    kind = config.get('llm_backend', 'openai')
+    if kind == 'openai':
+        return OpenAIBackend(api_key, model, config.get('temperature', 0.1))
+    if kind == 'fake':
+        return FakeBackend(
+            latency=config.get('fake_llm_latency', 0.0),
+            jitter=config.get('fake_llm_jitter', 0.0),
+            seed=config.get('fake_llm_seed', 0)
+        )
+    raise ValueError(f"Unsupported LLM backend: {kind}")
+
+class _CallStats:
+    __slots__ = ('calls', 'cache_hits', 'errors', 'retries', 'prompt_tokens',
+                 'completion_tokens', 'latencies')
+    
+    def __init__(self):
+        self.calls = 0
+        self.cache_hits = 0
+        self.errors = 0
+        self.retries = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.latencies: List[float] = []
+    
+    def report(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        
+        def percentile(share: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(share * len(latencies)))] * 1000, 2)
+        
+        return {
+            'calls': self.calls,
+            'cache_hits': self.cache_hits,
+            'errors': self.errors,
+            'retries': self.retries,
+            'prompt_tokens': self.prompt_tokens,
+            'completion_tokens': self.completion_tokens,
+            'latency_ms_total': round(sum(latencies) * 1000, 2),
+            'latency_ms_p50': percentile(0.5),
+            'latency_ms_p95': percentile(0.95),
+            'latency_ms_max': round(latencies[-1] * 1000, 2) if latencies else 0.0
+        }
+
+class RecordingBackend(LLMBackend):
+    """
+    Backend wrapper recording every call by call type.
+    
+    Records latency, prompt and completion tokens (estimated when the
+    backend does not report them), errors and retries, plus the cache hits
+    the agent reports through ``record_cache_hit``.
+    """
+    
+    def __init__(self, backend: LLMBackend):
+        self.backend = backend
+        self._stats: Dict[str, _CallStats] = defaultdict(_CallStats)
+        self.reset()
+    
+    async def generate(
+        self,
+        messages: Sequence[Any],
+        call_type: str = 'other',
+        retry: bool = False
+    ) -> Completion:
+        stats = self._stats[call_type]
+        stats.calls += 1
+        if retry:
+            stats.retries += 1
+        
+        start = time.perf_counter()
+        try:
+            completion = await self.backend.generate(messages, call_type)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.latencies.append(time.perf_counter() - start)
+        
+        if completion.prompt_tokens is None:
+            completion.prompt_tokens = estimate_tokens(_prompt_text(messages))
+        if completion.completion_tokens is None:
+            completion.completion_tokens = estimate_tokens(completion.text)
+        stats.prompt_tokens += completion.prompt_tokens
+        stats.completion_tokens += completion.completion_tokens
+        return completion
+    
+    def record_cache_hit(self, call_type: str) -> None:
+        self._stats[call_type].cache_hits += 1
+    
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Return counters and latency percentiles per call type, plus a ``total``."""
+        report = {call_type: stats.report() for call_type, stats in self._stats.items()}
+        
+        total = _CallStats()
+        for stats in self._stats.values():
+            total.calls += stats.calls
+            total.cache_hits += stats.cache_hits
+            total.errors += stats.errors
+            total.retries += stats.retries
+            total.prompt_tokens += stats.prompt_tokens
+            total.completion_tokens += stats.completion_tokens
+            total.latencies.extend(stats.latencies)
+        report['total'] = total.report()
+        return report
+    
+    def reset(self) -> None:
+        """Drop all recorded calls."""
+        self._stats.clear()
+        for call_type in CALL_TYPES:
+            self._stats[call_type] = _CallStats()
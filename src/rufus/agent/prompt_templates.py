@@ -1,5 +1,10 @@
 # src/rufus/agent/prompt_templates.py
-"""Prompt templates for the AI agent."""
+"""
+Prompt templates for the AI agent.
+
+Templates are rendered with ``str.format`` semantics, so literal braces in
+JSON examples are doubled.
+"""
 
 STRATEGY_PROMPT = """You are an expert web crawler tasked with extracting specific information.
 
@@ -13,13 +18,13 @@ Create a detailed extraction strategy that includes:
 4. Navigation paths
 
 Strategy should be provided in JSON format with the following structure:
-{
+{{
     "priority_pages": ["list of important pages"],
     "content_patterns": ["CSS selectors for relevant content"],
     "relevance_criteria": ["keywords and patterns"],
     "ignore_patterns": ["patterns to skip"],
-    "extraction_rules": {"element_type": "extraction_rule"}
-}"""
+    "extraction_rules": {{"element_type": "extraction_rule"}}
+}}"""
 
 RELEVANCE_PROMPT = """Evaluate the relevance of the following content:
 
@@ -27,11 +32,11 @@ Content: {content}
 Context: {context}
 
 Rate the relevance on a scale of 0-1 and explain why:
-{
+{{
     "score": 0.0-1.0,
     "explanation": "reason for score",
     "key_matches": ["matched criteria"]
-}"""
+}}"""
 
 SYNTHESIS_PROMPT = """Synthesize the following extracted content into a structured document:
 
@@ -39,4 +44,25 @@ Content: {content}
 Instructions: {instructions}
 
 Organize the content into a clean, structured format suitable for RAG systems.
-Focus on maintaining context and relationships between pieces of information."""
\ No newline at end of file
+Focus on maintaining context and relationships between pieces of information.
+Reply with only the document as a JSON object."""
+
+MERGE_PROMPT = """Merge the following partial syntheses of one website into a single structured document:
+
+Partial syntheses: {partials}
+Instructions: {instructions}
+
+Combine related sections, remove repetition and keep every distinct fact.
+Reply with only the merged document as a JSON object."""
+BATCH_RELEVANCE_PROMPT = """Evaluate the relevance of each numbered content block below.
+
+Context: {context}
+
+Blocks:
+{blocks}
+
+Rate each block on a scale of 0-1. Reply with only a JSON array holding one
+object per block, using the block numbers as ids:
+[
+    {{"id": 0, "score": 0.0-1.0, "explanation": "reason for score", "key_matches": ["matched criteria"]}}
+]"""
@@ -0,0 +1,160 @@
+# src/rufus/agent/strategy_registry.py
+import copy
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+from loguru import logger
+from ..utils.hashing import hamming_distance
+
+class StrategyRegistry:
+    """
+    Learned extraction strategies, reused across pages of the same template.
+    
+    Strategies are stored per domain and instructions, each tagged with the
+    template fingerprint of the page it was planned for. A page reuses the
+    strategy whose fingerprint is within ``strategy_max_distance`` bits of
+    its own, so one plan serves every page built from that template; a page
+    from a new or changed template, or an expired strategy, is planned again.
+    With ``strategy_registry_path`` set, strategies are persisted to a JSON
+    file and reloaded by later runs.
+    """
+    
+    def __init__(self, config: Optional[Dict] = None):
+        config = config or {}
+        self.ttl = config.get('strategy_ttl', 7 * 24 * 3600)
+        self.max_distance = config.get('strategy_max_distance', 8)
+        self.max_templates = config.get('strategy_max_templates', 32)
+        self.path = config.get('strategy_registry_path')
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, List[Dict]] = {}
+        
+        if self.path and os.path.exists(self.path):
+            self.load()
+    
+    @staticmethod
+    def key(url: str, instructions: str) -> str:
+        """Registry key of a site and a set of instructions."""
+        domain = urlparse(url).netloc.lower()
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        digest = hashlib.sha256(" ".join(instructions.split()).encode('utf-8')).hexdigest()[:16]
+        return f"{domain}|{digest}"
+    
+    def lookup(
+        self,
+        url: str,
+        instructions: str,
+        fingerprint: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Return a stored strategy for a page, or None if it must be planned.
+        
+        Without a fingerprint only a strategy stored without one matches.
+        """
+        entries = self._entries.get(self.key(url, instructions), [])
+        now = time.time()
+        best = None
+        best_distance = self.max_distance + 1
+        
+        for entry in entries:
+            if self.ttl and now - entry['created_at'] > self.ttl:
+                continue
+            if fingerprint is None or entry['fingerprint'] is None:
+                distance = 0 if fingerprint is entry['fingerprint'] else best_distance
+            else:
+                distance = hamming_distance(fingerprint, entry['fingerprint'])
+            if distance < best_distance:
+                best, best_distance = entry, distance
+        
+        if best is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        best['hits'] += 1
+        return copy.deepcopy(best['strategy'])
+    
+    def store(
+        self,
+        url: str,
+        instructions: str,
+        fingerprint: Optional[int],
+        strategy: Dict
+    ) -> None:
+        """Remember a strategy for a template, replacing expired or drifted copies."""
+        key = self.key(url, instructions)
+        now = time.time()
+        entries = [
+            entry for entry in self._entries.get(key, [])
+            if not (self.ttl and now - entry['created_at'] > self.ttl)
+            and not self._same_template(entry['fingerprint'], fingerprint)
+        ]
+        entries.append({
+            'fingerprint': fingerprint,
+            'strategy': copy.deepcopy(strategy),
+            'created_at': now,
+            'hits': 0
+        })
+        
+        # Keep the most used templates of a site when over the limit
+        if len(entries) > self.max_templates:
+            entries.sort(key=lambda entry: (entry['hits'], entry['created_at']), reverse=True)
+            del entries[self.max_templates:]
+        
+        self._entries[key] = entries
+        if self.path:
+            self.save()
+    
+    def _same_template(self, a: Optional[int], b: Optional[int]) -> bool:
+        if a is None or b is None:
+            return a is b
+        return hamming_distance(a, b) <= self.max_distance
+    
+    def save(self) -> None:
+        """Write the registry to ``strategy_registry_path`` atomically."""
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    key: [
+                        {**entry, 'fingerprint': None if entry['fingerprint'] is None
+                         else f"{entry['fingerprint']:016x}"}
+                        for entry in entries
+                    ]
+                    for key, entries in self._entries.items()
+                }, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.error(f"Saving strategy registry failed: {str(e)}")
+    
+    def load(self) -> None:
+        """Read strategies saved by an earlier run."""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            self._entries = {
+                key: [
+                    {**entry, 'fingerprint': None if entry['fingerprint'] is None
+                     else int(entry['fingerprint'], 16)}
+                    for entry in entries
+                ]
+                for key, entries in data.items()
+            }
+        except Exception as e:
+            logger.error(f"Loading strategy registry failed: {str(e)}")
+            self._entries = {}
+    
+    def stats(self) -> Dict:
+        """Summarize the registry."""
+        return {
+            'sites': len(self._entries),
+            'templates': sum(len(entries) for entries in self._entries.values()),
+            'hits': self.hits,
+            'misses': self.misses
+        }
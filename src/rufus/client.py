@@ -1,10 +1,21 @@
 # src/rufus/client.py
-from typing import Dict, Optional, Any, List
+from typing import AsyncIterator, Dict, Optional, Any, List, Set, Tuple
 import os
+import asyncio
 import logging
 import aiohttp
 from bs4 import BeautifulSoup
 from datetime import datetime
+from itertools import groupby
+from .extractors.item import ContentItem
+from .extractors.main_content import MainContentDetector
+from .extractors.structured_data import attribute, extract_structured_data
+from .extractors.visitor import HEADING_TAGS, DOMVisitor, VisitContext
+from .processors.boilerplate import BlockFrequencyIndex
+from .processors.chunker import Chunker
+from .search.bm25 import BM25Index
+from .storage.archive import ArchiveWriter
+from .storage.docstore import DocumentStore
 
 try:
     from loguru import logger
@@ -12,6 +23,15 @@ except ImportError:
     logger = logging.getLogger(__name__)
     logging.basicConfig(level=logging.INFO)
 
+TEXT_TAGS = ['p', *sorted(HEADING_TAGS)]
+
+def _pages_of(items: List[ContentItem]) -> List[Tuple[Optional[str], List[ContentItem]]]:
+    """Split items released by the boilerplate filter back into pages."""
+    return [(url, list(page)) for url, page in groupby(items, key=lambda item: item.get('url'))]
+
+def _page_event(url: Optional[str], items: List[ContentItem]) -> Dict[str, Any]:
+    return {"event": "page", "url": url, "items": [item.to_dict() for item in items]}
+
 class RufusClient:
     """Main client interface for Rufus."""
     
@@ -21,8 +41,33 @@ class RufusClient:
             raise ValueError("API key is required")
         
         self.config = config or {}
-        self.visited_urls = set()
+        self.visited_urls: Set[str] = set()
         self.session = None
+        self._content: List[ContentItem] = []
+        self._frontier: Dict[str, None] = {}
+        self._detector: Optional[MainContentDetector] = (
+            MainContentDetector(self.config)
+            if self.config.get('main_content', True) else None
+        )
+        self._visitor = DOMVisitor().on(TEXT_TAGS, self._handle_text)
+        self._archive: Optional[ArchiveWriter] = None
+        self._pages: Optional[asyncio.Queue] = None
+        # Crawl state lives on the client, so one client runs one crawl at a time
+        self._crawl_lock = asyncio.Lock()
+        self._main_content_stats: Dict[str, Any] = self._empty_main_content_stats()
+        
+        # Scraped content is indexed for ``search`` only when asked for: in
+        # memory with ``search_index``, or appended to ``index_path``
+        self.index_path = self.config.get('index_path')
+        self.search_index = self.config.get('search_index', bool(self.index_path))
+        self.index: Optional[BM25Index] = (
+            BM25Index(
+                k1=self.config.get('search_k1', 1.5),
+                b=self.config.get('search_b', 0.75),
+                deduplicate=True
+            )
+            if self.search_index and not self.index_path else None
+        )
     
     async def _init_session(self):
         """Initialize aiohttp session."""
@@ -38,107 +83,414 @@ class RufusClient:
         url: str,
         instructions: str,
         max_depth: int = 2,
-        output_format: str = "json"
+        output_format: str = "json",
+        deadline: Optional[float] = None
     ) -> Dict[str, Any]:
-        """Scrape website content based on instructions."""
-        try:
-            start_time = datetime.now()
-            logger.info(f"Starting scrape for URL: {url}")
-            
-            await self._init_session()
-            content = await self._scrape_url(url, max_depth)
-            
-            # Process and format results
-            processed_content = self._process_content(content, instructions)
+        """
+        Scrape website content based on instructions.
+        
+        A client runs one crawl at a time; concurrent calls on the same
+        client wait for the running crawl to finish.
+        
+        Args:
+            url: Website URL to scrape
+            instructions: Extraction instructions
+            max_depth: Maximum crawl depth
+            output_format: Requested output format; ``chunks`` returns
+                RAG-ready chunks with heading breadcrumbs
+            deadline: Seconds to spend before returning partial results
+        
+        Returns:
+            Processed content and crawl metadata
+        """
+        async with self._crawl_lock:
+            try:
+                start_time = datetime.now()
+                logger.info(f"Starting scrape for URL: {url}")
+                
+                await self._start_crawl(url)
+                partial = False
+                
+                crawl = self._scrape_url(url, max_depth)
+                if deadline is None:
+                    await crawl
+                else:
+                    try:
+                        await asyncio.wait_for(crawl, timeout=deadline)
+                    except asyncio.TimeoutError:
+                        partial = True
+                        logger.warning(
+                            f"Deadline of {deadline}s reached, returning partial results "
+                            f"({len(self._frontier)} URLs unfetched)"
+                        )
+                
+                content, boilerplate = self._finish_crawl(self._content)
+                
+                # Process and format results
+                if output_format == "chunks":
+                    processed_content = {
+                        "chunks": [
+                            chunk.to_dict()
+                            for chunk in Chunker(self.config).chunk(content)
+                        ]
+                    }
+                else:
+                    processed_content = self._process_content(content, instructions)
+                
+                return {
+                    "url": url,
+                    "instructions": instructions,
+                    "content": processed_content,
+                    "metadata": self._crawl_metadata(start_time, content, partial, boilerplate)
+                }
             
-            processing_time = (datetime.now() - start_time).total_seconds()
+            except Exception as e:
+                logger.error(f"Scraping failed: {str(e)}")
+                raise
             
-            return {
-                "url": url,
-                "instructions": instructions,
-                "content": processed_content,
-                "metadata": {
-                    "pages_crawled": len(self.visited_urls),
-                    "content_items": len(content),
-                    "processing_time": f"{processing_time:.1f} seconds",
-                    "extracted_at": datetime.now().isoformat()
+            finally:
+                await self._close_crawl()
+    
+    async def scrape_stream(
+        self,
+        url: str,
+        instructions: str,
+        max_depth: int = 2,
+        deadline: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Scrape a website, yielding results while the crawl runs.
+        
+        Each processed page yields a ``page`` event with its extracted items,
+        followed by a ``progress`` event; a final ``done`` event carries the
+        crawl metadata. At most ``stream_buffer`` pages (8 by default) wait
+        for the consumer, after which the crawl pauses, so a slow consumer
+        slows the crawl down instead of piling results up in memory.
+        Closing the generator cancels the crawl. Like ``scrape``, the stream
+        waits for any crawl already running on the client.
+        
+        With ``boilerplate_threshold`` set, pages pass through a
+        ``BlockFrequencyIndex`` as they are crawled: the first
+        ``boilerplate_warmup`` pages are held back and released together
+        once repeated blocks can be told apart, and later pages are
+        filtered as they arrive.
+        
+        Args:
+            url: Website URL to scrape
+            instructions: Extraction instructions
+            max_depth: Maximum crawl depth
+            deadline: Seconds to spend before ending the stream with partial results
+        """
+        start_time = datetime.now()
+        loop = asyncio.get_running_loop()
+        end = loop.time() + deadline if deadline is not None else None
+        pages: asyncio.Queue = asyncio.Queue(maxsize=self.config.get('stream_buffer', 8))
+        crawl = None
+        partial = False
+        blocks = (
+            BlockFrequencyIndex(self.config)
+            if self.config.get('boilerplate_threshold') is not None else None
+        )
+        streamed: List[ContentItem] = []
+        
+        async with self._crawl_lock:
+            try:
+                logger.info(f"Starting streaming scrape for URL: {url}")
+                await self._start_crawl(url)
+                self._pages = pages
+                crawl = asyncio.create_task(self._scrape_url(url, max_depth))
+                
+                while not (crawl.done() and pages.empty()):
+                    page = asyncio.ensure_future(pages.get())
+                    timeout = None if end is None else max(0.0, end - loop.time())
+                    done, _ = await asyncio.wait(
+                        {page, crawl},
+                        timeout=timeout,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                    
+                    if page in done:
+                        page_url, items = page.result()
+                        released = [(page_url, items)] if blocks is None else _pages_of(blocks.push(items))
+                        for released_url, released_items in released:
+                            streamed.extend(released_items)
+                            yield _page_event(released_url, released_items)
+                        yield {
+                            "event": "progress",
+                            "pages_crawled": len(self.visited_urls),
+                            "content_items": len(self._content),
+                            "unfetched": len(self._frontier)
+                        }
+                        continue
+                    
+                    page.cancel()
+                    if not done:
+                        # Deadline reached: stop crawling, then flush the pages already extracted
+                        partial = True
+                        end = None
+                        logger.warning(
+                            f"Deadline of {deadline}s reached, ending stream with partial results "
+                            f"({len(self._frontier)} URLs unfetched)"
+                        )
+                        crawl.cancel()
+                        await asyncio.gather(crawl, return_exceptions=True)
+                
+                if not crawl.cancelled():
+                    crawl.result()
+                
+                if blocks is not None:
+                    # Pages still held for warm-up when the crawl ended
+                    for released_url, released_items in _pages_of(blocks.flush()):
+                        streamed.extend(released_items)
+                        yield _page_event(released_url, released_items)
+                
+                content, boilerplate = self._finish_crawl(streamed, blocks)
+                yield {
+                    "event": "done",
+                    "url": url,
+                    "instructions": instructions,
+                    "metadata": self._crawl_metadata(start_time, content, partial, boilerplate)
                 }
-            }
             
-        except Exception as e:
-            logger.error(f"Scraping failed: {str(e)}")
-            raise
+            except Exception as e:
+                logger.error(f"Streaming scrape failed: {str(e)}")
+                raise
+            
+            finally:
+                self._pages = None
+                try:
+                    if crawl is not None and not crawl.done():
+                        crawl.cancel()
+                        await asyncio.gather(crawl, return_exceptions=True)
+                finally:
+                    await self._close_crawl()
+    
+    async def _start_crawl(self, url: str) -> None:
+        """Reset the per-crawl state and open the session and archive."""
+        await self._init_session()
+        self.visited_urls = set()
+        self._content = []
+        self._frontier = {url: None}
+        self._main_content_stats = self._empty_main_content_stats()
+        if self.config.get('archive_path'):
+            self._archive = ArchiveWriter(self.config['archive_path'])
+    
+    def _finish_crawl(
+        self,
+        content: List[ContentItem],
+        blocks: Optional[BlockFrequencyIndex] = None
+    ) -> Tuple[List[ContentItem], Optional[Dict]]:
+        """
+        Filter boilerplate from crawled content, then store and index it.
+        
+        Content already filtered while streaming is passed with the
+        ``blocks`` index that filtered it.
+        """
+        boilerplate = None
+        if blocks is not None:
+            boilerplate = blocks.stats()
+        elif self.config.get('boilerplate_threshold') is not None:
+            index = BlockFrequencyIndex(self.config)
+            content = index.filter(content)
+            boilerplate = index.stats()
         
-        finally:
-            if self.session:
-                await self.session.close()
-                self.session = None
+        if self.config.get('store_path'):
+            with DocumentStore(
+                self.config['store_path'],
+                mode='a',
+                compression=self.config.get('store_compression')
+            ) as store:
+                store.extend(content)
+        
+        if self.search_index and self.index_path:
+            BM25Index.append(
+                self.index_path,
+                content,
+                k1=self.config.get('search_k1', 1.5),
+                b=self.config.get('search_b', 0.75)
+            )
+        elif self.index is not None:
+            self.index.add_many(content)
+        
+        return content, boilerplate
+    
+    def _crawl_metadata(
+        self,
+        start_time: datetime,
+        content: List[ContentItem],
+        partial: bool,
+        boilerplate: Optional[Dict]
+    ) -> Dict[str, Any]:
+        processing_time = (datetime.now() - start_time).total_seconds()
+        return {
+            "pages_crawled": len(self.visited_urls),
+            "content_items": len(content),
+            "processing_time": f"{processing_time:.1f} seconds",
+            "extracted_at": datetime.now().isoformat(),
+            "partial": partial,
+            "unfetched": list(self._frontier),
+            "main_content": dict(self._main_content_stats),
+            "boilerplate": boilerplate
+        }
+    
+    async def _close_crawl(self) -> None:
+        if self.session:
+            await self.session.close()
+            self.session = None
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
     
-    async def _scrape_url(self, url: str, max_depth: int) -> List[Dict]:
-        """Scrape content from a URL."""
+    def search(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search content scraped so far.
+        
+        Requires ``search_index`` or ``index_path`` in the config. An index
+        in ``index_path`` is read on the first search and then only the
+        segments added since are read, including those of other clients.
+        
+        Args:
+            query: Free-text query
+            k: Maximum number of results
+        
+        Returns:
+            Matching content blocks with ``score``, ``url`` and
+            ``heading_path``, best first
+        """
+        if self.index_path:
+            if self.index is None:
+                if not os.path.exists(os.path.join(self.index_path, 'meta.json')):
+                    return []
+                self.index = BM25Index.load(self.index_path, deduplicate=True)
+            else:
+                self.index.refresh(self.index_path)
+        if self.index is None:
+            raise ValueError("Search requires the search_index or index_path config key")
+        return self.index.search(query, k)
+    
+    async def _scrape_url(self, url: str, max_depth: int) -> None:
+        """
+        Scrape content from a URL and the pages it links to.
+        
+        Extracted items are appended to ``self._content`` as soon as each page
+        is processed, so they survive cancellation when a deadline expires.
+        URLs stay in ``self._frontier`` until their fetch has finished.
+        """
         if url in self.visited_urls:
-            return []
+            self._frontier.pop(url, None)
+            return
         
         self.visited_urls.add(url)
-        content = []
+        html = None
         
         try:
             async with self.session.get(url) as response:
                 if response.status != 200:
                     logger.warning(f"Failed to fetch {url}: {response.status}")
-                    return []
-                
-                html = await response.text()
-                page_content = self._extract_content(html)
-                content.extend(page_content)
-                
-                # Extract and follow links if needed
-                if len(self.visited_urls) < max_depth:
-                    links = self._extract_links(html, url)
-                    for link in links[:3]:  # Limit to 3 links for testing
-                        if link not in self.visited_urls:
-                            child_content = await self._scrape_url(link, max_depth)
-                            content.extend(child_content)
-                
-                return content
-                
+                else:
+                    html = await response.text()
+                    if self._archive is not None:
+                        self._archive.write_response(
+                            url,
+                            response.status,
+                            dict(response.headers),
+                            await response.read()
+                        )
+        
         except Exception as e:
             logger.error(f"Error scraping {url}: {str(e)}")
-            return []
+        
+        self._frontier.pop(url, None)
+        if html is None:
+            return
+        
+        items = self._extract_content(html, url)
+        self._content.extend(items)
+        if self._pages is not None:
+            # Waits while the stream consumer is behind
+            await self._pages.put((url, items))
+        
+        # Extract and follow links if needed
+        if len(self.visited_urls) < max_depth:
+            links = [
+                link for link in self._extract_links(html, url)[:3]  # Limit to 3 links for testing
+                if link not in self.visited_urls
+            ]
+            self._frontier.update(dict.fromkeys(links))
+            for link in links:
+                await self._scrape_url(link, max_depth)
     
-    def _extract_content(self, html: str) -> List[Dict]:
-        """Extract content from HTML."""
+    def _extract_content(self, html: str, url: Optional[str] = None) -> List[ContentItem]:
+        """
+        Extract content from HTML.
+        
+        Text is taken from the main content region found by
+        ``MainContentDetector``, so navigation, banners and footers are
+        dropped before they are cleaned, stored or sent to the LLM. Set
+        ``main_content`` to False in the config to read the whole body.
+        
+        Embedded JSON-LD, microdata, RDFa and OpenGraph data is read from the
+        whole page as ``structured`` items unless ``structured_data`` is
+        False.
+        """
         try:
             soup = BeautifulSoup(html, 'html.parser')
             content = []
             
             # Extract title
-            if soup.title:
-                content.append({
-                    "type": "title",
-                    "content": soup.title.string.strip()
-                })
+            if soup.title and soup.title.string:
+                content.append(ContentItem("title", soup.title.string.strip(), url=url))
+            
+            if self.config.get('structured_data', True):
+                content.extend(extract_structured_data(soup, url))
             
             # Extract main content
-            main_content = soup.find(['main', 'article']) or soup.find('div', {'class': ['content', 'main']})
-            if not main_content:
-                main_content = soup.body
+            skip = None
+            main_content = soup.body or soup
+            if self._detector is not None:
+                main_content, skip, report = self._detector.detect(soup)
+                self._record_main_content(report)
             
             # Extract text content
-            for element in main_content.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                text = element.get_text(strip=True)
-                if text:
-                    content.append({
-                        "type": element.name,
-                        "content": text
-                    })
+            context = self._visitor.visit(main_content, url, skip)
+            content.extend(context.results)
             
             return content
-            
+        
         except Exception as e:
             logger.error(f"Content extraction error: {str(e)}")
             return []
     
+    @staticmethod
+    def _empty_main_content_stats() -> Dict[str, Any]:
+        return {
+            "pages": 0,
+            "detected": 0,
+            "kept_chars": 0,
+            "total_chars": 0,
+            "kept_ratio": 1.0
+        }
+    
+    def _record_main_content(self, report: Dict) -> None:
+        """Aggregate main content detection reports across crawled pages."""
+        stats = self._main_content_stats
+        stats["pages"] += 1
+        stats["detected"] += int(report["detected"])
+        stats["kept_chars"] += report["kept_chars"]
+        stats["total_chars"] += report["total_chars"]
+        stats["kept_ratio"] = (
+            round(stats["kept_chars"] / stats["total_chars"], 3)
+            if stats["total_chars"] else 1.0
+        )
+    
+    @staticmethod
+    def _handle_text(element, context: VisitContext) -> bool:
+        """Emit a paragraph or heading and skip its descendants."""
+        text = element.get_text(strip=True)
+        if text:
+            context.emit(ContentItem(element.name, text))
+        return False
+    
     def _extract_links(self, html: str, base_url: str) -> List[str]:
         """Extract links from HTML."""
         try:
@@ -146,29 +498,37 @@ class RufusClient:
             links = []
             
             for a in soup.find_all('a', href=True):
-                href = a['href']
+                href = attribute(a, 'href') or ''
                 if href.startswith('http'):
                     links.append(href)
                 elif href.startswith('/'):
                     links.append(f"{base_url.rstrip('/')}{href}")
             
             return links
-            
+        
         except Exception as e:
             logger.error(f"Link extraction error: {str(e)}")
             return []
     
-    def _process_content(self, content: List[Dict], instructions: str) -> Dict:
+    def _process_content(self, content: List[ContentItem], instructions: str) -> Dict:
         """Process extracted content."""
         grouped_content = {
             "title": "",
             "headings": [],
             "paragraphs": [],
+            "structured_data": []
         }
         
         for item in content:
             if item["type"] == "title":
                 grouped_content["title"] = item["content"]
+            elif item["type"] == "structured":
+                grouped_content["structured_data"].append({
+                    "url": item.get("url"),
+                    "format": item["format"],
+                    "type": item.get("schema_type"),
+                    "data": item["data"]
+                })
             elif item["type"].startswith('h'):
                 grouped_content["headings"].append(item["content"])
             elif item["type"] == 'p':
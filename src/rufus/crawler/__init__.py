@@ -1,5 +1,6 @@
 # src/rufus/crawler/__init__.py
 from .async_crawler import AsyncCrawler
 from .js_crawler import JSCrawler
+from .link_filter import LinkFilter
 
-__all__ = ['AsyncCrawler', 'JSCrawler']
\ No newline at end of file
+__all__ = ['AsyncCrawler', 'JSCrawler', 'LinkFilter']
\ No newline at end of file
@@ -2,6 +2,7 @@
 import aiohttp
 from typing import Dict, List, Optional
 from bs4 import BeautifulSoup
+from ..extractors.item import ContentItem
 from .base import BaseCrawler
 from loguru import logger
 import asyncio
@@ -27,17 +28,20 @@ class AsyncCrawler(BaseCrawler):
         url: str,
         max_depth: int = 3,
         selectors: Optional[List[str]] = None
-    ) -> List[Dict]:
+    ) -> List[ContentItem]:
         """Crawl website asynchronously."""
         await self._init_session()
+        self._start_crawl(url)
         
         try:
-            return await self._crawl_recursive(
+            content = await self._crawl_recursive(
                 url,
                 max_depth,
                 selectors,
                 depth=0
             )
+            content.extend(self._flush_deliveries())
+            return content
         finally:
             await self.session.close()
             self.session = None
@@ -48,23 +52,41 @@ class AsyncCrawler(BaseCrawler):
         max_depth: int,
         selectors: Optional[List[str]],
         depth: int
-    ) -> List[Dict]:
+    ) -> List[ContentItem]:
         if depth >= max_depth or url in self.visited_urls:
             return []
         
-        await self.rate_limiter.wait()
+        if not self.budget.reserve_page():
+            return []
+        
         self.visited_urls.add(url)
+        await self.rate_limiter.wait()
+        
+        if self.budget.cancelled():
+            self.budget.release_page()
+            return []
+        
+        remaining = self.budget.remaining_time()
+        
+        request_kwargs = {}
+        if remaining is not None:
+            request_kwargs['timeout'] = aiohttp.ClientTimeout(total=remaining)
         
         try:
-            async with self.session.get(url) as response:
+            async with self.session.get(url, **request_kwargs) as response:
                 if response.status != 200:
                     logger.warning(f"Failed to fetch {url}: {response.status}")
                     return []
                 
+                body = await response.read()
+                self.budget.record_bytes(len(body))
+                self._archive_response(url, response.status, dict(response.headers), body)
                 html = await response.text()
-                content = self._extract_content(html, selectors)
+                content = self._extract_content(html, selectors, url)
                 
-                if depth < max_depth:
+                expand = self._should_expand(content)
+                content = self._deliver(content, depth)
+                if depth < max_depth and expand and not self.budget.exhausted():
                     links = await self.extract_links(html, url)
                     tasks = []
                     
@@ -84,7 +106,7 @@ class AsyncCrawler(BaseCrawler):
                             content.extend(result)
                 
                 return content
-                
+        
         except Exception as e:
             logger.error(f"Error crawling {url}: {str(e)}")
             return []
@@ -92,54 +114,13 @@ class AsyncCrawler(BaseCrawler):
     def _extract_content(
         self,
         html: str,
-        selectors: Optional[List[str]]
-    ) -> List[Dict]:
+        selectors: Optional[List[str]],
+        url: Optional[str] = None
+    ) -> List[ContentItem]:
         """Extract content based on selectors."""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            content = []
-            
-            if not selectors:
-                # Default content extraction
-                for tag in ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                    elements = soup.find_all(tag)
-                    for element in elements:
-                        text = self.validators.sanitize_text(element.get_text())
-                        if text:
-                            content.append({
-                                'type': tag,
-                                'content': text,
-                                'metadata': self._extract_metadata(element)
-                            })
-            else:
-                # Selective content extraction
-                for selector in selectors:
-                    if self.validators.validate_selector(selector):
-                        elements = soup.select(selector)
-                        for element in elements:
-                            text = self.validators.sanitize_text(element.get_text())
-                            if text:
-                                content.append({
-                                    'type': 'selected',
-                                    'content': text,
-                                    'metadata': self._extract_metadata(element)
-                                })
-            
-            return content
-            
+            return self._extract_from_html(html, selectors, url=url)
+        
         except Exception as e:
             logger.error(f"Content extraction error: {str(e)}")
-            return []
-    
-    def _extract_metadata(self, element) -> Dict:
-        """Extract metadata from HTML element."""
-        return {
-            'tag': element.name,
-            'classes': element.get('class', []),
-            'id': element.get('id'),
-            'attributes': {
-                k: v for k, v in element.attrs.items()
-                if k not in ['class', 'id']
-            },
-            'parent_tag': element.parent.name if element.parent else None
-        }
\ No newline at end of file
+            return []
\ No newline at end of file
@@ -1,10 +1,20 @@
 # src/rufus/crawler/base.py
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Set
-from urllib.parse import urljoin, urlparse
+from typing import Dict, List, Optional, Set, Union
 from bs4 import BeautifulSoup
 from loguru import logger
+from ..extractors.item import ContentItem, ElementMeta
+from ..extractors.main_content import MainContentDetector
+from ..extractors.selectors import get_selector_plan
+from ..extractors.visitor import DOMVisitor, text_block_handler
 from ..utils import Validators, RateLimiter
+from .budget import CrawlBudget, NoveltyMonitor
+from .link_filter import LinkFilter
+from ..processors.boilerplate import BlockFrequencyIndex
+from ..processors.sinks import OutputSink
+from ..storage.archive import ArchiveWriter
+
+DEFAULT_CONTENT_TAGS = ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']
 
 class BaseCrawler(ABC):
     """Base crawler class defining the interface for all crawlers."""
@@ -16,6 +26,22 @@ class BaseCrawler(ABC):
             requests_per_second=self.config.get('rate_limit', 2)
         )
         self.validators = Validators()
+        self.budget = CrawlBudget.from_config(self.config)
+        self.novelty = NoveltyMonitor.from_config(self.config)
+        self.link_filter: Optional[LinkFilter] = None
+        self._visitors: Dict[tuple, DOMVisitor] = {}
+        self.main_content: Optional[MainContentDetector] = (
+            MainContentDetector(self.config) if self.config.get('main_content', True) else None
+        )
+        self.main_content_reports: Dict[str, Dict] = {}
+        self.capture_attributes = self.config.get('item_attributes', False)
+        self.sink: Optional[OutputSink] = None
+        self.keep_results = self.config.get('keep_results', True)
+        self.archive: Optional[ArchiveWriter] = None
+        self.block_index: Optional[BlockFrequencyIndex] = (
+            BlockFrequencyIndex(self.config)
+            if self.config.get('boilerplate_threshold') is not None else None
+        )
     
     @abstractmethod
     async def crawl(
@@ -23,22 +49,152 @@ class BaseCrawler(ABC):
         url: str,
         max_depth: int = 3,
         selectors: Optional[List[str]] = None
-    ) -> List[Dict]:
+    ) -> List[ContentItem]:
         """Crawl the website and extract content."""
         pass
     
-    def is_valid_url(self, url: str, base_url: str) -> bool:
-        """Check if URL is valid and belongs to the same domain."""
-        if not self.validators.validate_url(url):
+    def _start_crawl(self, url: str) -> None:
+        """Reset per-crawl state and compile the link filter for the crawl root."""
+        self.budget.start()
+        self.novelty.reset()
+        if self.block_index is not None:
+            self.block_index.reset()
+        self.main_content_reports = {}
+        self.link_filter = LinkFilter.from_config(url, self.config)
+    
+    def _should_expand(self, content: List[ContentItem]) -> bool:
+        """
+        Record a page's novelty and decide whether to follow its links.
+        
+        Stops the whole crawl once recent pages stop adding new text.
+        """
+        if not self.novelty.enabled:
+            return True
+        
+        novelty = self.novelty.observe(
+            item['content'] for item in content
+            if isinstance(item.get('content'), str)
+        )
+        if self.novelty.saturated():
+            logger.info("Stopping crawl: novelty dropped below threshold")
+            self.budget.stop("novelty")
             return False
-            
+        
+        return self.novelty.is_novel(novelty)
+    
+    def _deliver(self, content: List[ContentItem], depth: int) -> List[ContentItem]:
+        """
+        Hand a page's items to the output sink as soon as they are extracted.
+        
+        Items are stamped with the crawl depth of their page. With
+        ``boilerplate_threshold`` set, blocks repeated across pages are
+        suppressed first; pages in the warm-up window are held back and
+        released later. With ``keep_results`` disabled, items are only
+        written to the sink and the crawl result stays empty, so memory does
+        not grow with the crawl.
+        """
+        for item in content:
+            item['depth'] = depth
+        
+        if self.block_index is not None:
+            content = self.block_index.push(content)
+        return self._emit(content)
+    
+    def _flush_deliveries(self) -> List[ContentItem]:
+        """Release pages still held back for boilerplate warm-up at the end of a crawl."""
+        if self.block_index is None:
+            return []
+        return self._emit(self.block_index.flush())
+    
+    def _emit(self, content: List[ContentItem]) -> List[ContentItem]:
+        """Write items to the sink and return those kept in the crawl result."""
+        if self.sink is not None:
+            self.sink.write_many(content)
+            if not self.keep_results:
+                return []
+        return content
+    
+    def _archive_response(
+        self,
+        url: str,
+        status: int,
+        headers: Dict[str, str],
+        body: Union[bytes, str]
+    ) -> None:
+        """
+        Record a raw response in the archive, if one is attached.
+        
+        Archived crawls can be re-extracted offline with
+        ``rufus.storage.reprocess``.
+        """
+        if self.archive is None:
+            return
         try:
-            parsed = urlparse(url)
-            base_parsed = urlparse(base_url)
-            return parsed.netloc == base_parsed.netloc
+            self.archive.write_response(url, status, headers, body)
         except Exception as e:
-            logger.error(f"URL validation error: {e}")
-            return False
+            logger.error(f"Archiving {url} failed: {str(e)}")
+    
+    def _get_visitor(self, tags: List[str] = DEFAULT_CONTENT_TAGS) -> DOMVisitor:
+        """Return the single-pass visitor for default extraction, built once per tag set."""
+        key = tuple(tags)
+        visitor = self._visitors.get(key)
+        if visitor is None:
+            visitor = DOMVisitor().on(
+                tags,
+                text_block_handler(self.validators.sanitize_text, self._extract_metadata)
+            )
+            self._visitors[key] = visitor
+        return visitor
+    
+    def _extract_from_html(
+        self,
+        html: str,
+        selectors: Optional[List[str]],
+        tags: List[str] = DEFAULT_CONTENT_TAGS,
+        url: Optional[str] = None
+    ) -> List[ContentItem]:
+        """
+        Extract content items from HTML in a single document walk.
+        
+        Selectors are validated and compiled once into a cached plan shared
+        across pages and crawls. Without selectors, and with ``main_content``
+        enabled, only the detected main content region is walked.
+        
+        Args:
+            html: Page HTML
+            selectors: Optional CSS selectors; defaults to block-level tags
+            tags: Tags extracted when no selectors are given
+            url: Page URL attached to every item when given
+        
+        Returns:
+            Content items in document order
+        """
+        if selectors:
+            return get_selector_plan(selectors).extract(
+                BeautifulSoup(html, 'html.parser'),
+                self.validators.sanitize_text,
+                self._extract_metadata,
+                url=url
+            )
+        
+        visitor = self._get_visitor(tags)
+        if self.main_content is None:
+            return visitor.visit_html(html, url).results
+        
+        region, skip, report = self.main_content.detect_html(html)
+        if url:
+            self.main_content_reports[url] = report
+        return visitor.visit(region, url, skip).results
+    
+    def _extract_metadata(self, element) -> ElementMeta:
+        """
+        Extract metadata from HTML element.
+        
+        Tag and class names are interned and other attributes are only
+        copied when ``item_attributes`` is enabled, which keeps metadata
+        from outweighing the extracted text on large crawls.
+        """
+        return ElementMeta.from_element(element, self.capture_attributes)
     
     async def extract_links(
         self,
@@ -48,16 +204,12 @@ class BaseCrawler(ABC):
         """Extract valid links from HTML content."""
         try:
             soup = BeautifulSoup(html, 'html.parser')
-            links = set()
-            
-            for anchor in soup.find_all('a', href=True):
-                href = anchor['href']
-                absolute_url = urljoin(base_url, href)
-                
-                if self.is_valid_url(absolute_url, base_url):
-                    links.add(absolute_url)
+            link_filter = self.link_filter or LinkFilter.from_config(base_url, self.config)
             
-            return list(links)
+            return link_filter.filter(
+                (anchor['href'] for anchor in soup.find_all('a', href=True)),
+                base_url
+            )
         except Exception as e:
             logger.error(f"Link extraction error: {e}")
             return []
\ No newline at end of file
@@ -0,0 +1,169 @@
+import time
+from collections import deque
+from typing import Dict, Iterable, Optional, Set
+from ..utils import block_hash
+
+class CrawlBudget:
+    """Page, byte and wall-clock limits for a single crawl."""
+    
+    def __init__(
+        self,
+        max_pages: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        time_limit: Optional[float] = None
+    ):
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.time_limit = time_limit
+        self.start()
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> "CrawlBudget":
+        """Build a budget from crawler configuration."""
+        return cls(
+            max_pages=config.get('max_pages'),
+            max_bytes=config.get('max_bytes'),
+            time_limit=config.get('time_limit')
+        )
+    
+    def start(self) -> None:
+        """Reset counters at the beginning of a crawl."""
+        self.pages = 0
+        self.bytes = 0
+        self.started_at = time.monotonic()
+        self.stop_reason: Optional[str] = None
+        self.stopped = False
+    
+    def remaining_time(self) -> Optional[float]:
+        """Seconds left before the deadline, or None without a deadline."""
+        if self.time_limit is None:
+            return None
+        return max(0.0, self.time_limit - (time.monotonic() - self.started_at))
+    
+    def exhausted(self) -> bool:
+        """Check whether any limit has been reached."""
+        if self.stop_reason:
+            return True
+        
+        if self.max_pages is not None and self.pages >= self.max_pages:
+            self.stop_reason = "max_pages"
+        elif self.max_bytes is not None and self.bytes >= self.max_bytes:
+            self.stop_reason = "max_bytes"
+        elif self.remaining_time() == 0.0:
+            self.stop_reason = "deadline"
+        
+        return self.stop_reason is not None
+    
+    def reserve_page(self) -> bool:
+        """
+        Claim a page slot before fetching.
+        
+        Reserving before the request keeps concurrent fetches from
+        overshooting max_pages.
+        
+        Returns:
+            False if the budget is exhausted
+        """
+        if self.exhausted():
+            return False
+        self.pages += 1
+        return True
+    
+    def release_page(self) -> None:
+        """Return a reserved page slot that was never fetched."""
+        self.pages -= 1
+    
+    def cancelled(self) -> bool:
+        """Check whether pending fetches should be abandoned."""
+        return self.stopped or self.remaining_time() == 0.0
+    
+    def record_bytes(self, size: int) -> None:
+        """Account for a downloaded response body."""
+        self.bytes += size
+    
+    def stop(self, reason: str) -> None:
+        """Stop the crawl early for an external reason."""
+        if not self.stop_reason:
+            self.stop_reason = reason
+        self.stopped = True
+    
+    def stats(self) -> Dict:
+        """Summarize budget usage."""
+        return {
+            'pages': self.pages,
+            'bytes': self.bytes,
+            'elapsed': time.monotonic() - self.started_at,
+            'stop_reason': self.stop_reason
+        }
+
+class NoveltyMonitor:
+    """
+    Track how much new text each page contributes.
+    
+    Novelty of a page is the fraction of its text blocks that have not been
+    seen earlier in the crawl. A page below the threshold ends its branch;
+    a sliding-window average below the threshold ends the whole crawl.
+    """
+    
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        window: int = 5,
+        min_pages: int = 3
+    ):
+        self.threshold = threshold
+        self.window = window
+        self.min_pages = min_pages
+        self.reset()
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> "NoveltyMonitor":
+        """Build a monitor from crawler configuration."""
+        return cls(
+            threshold=config.get('novelty_threshold'),
+            window=config.get('novelty_window', 5),
+            min_pages=config.get('novelty_min_pages', 3)
+        )
+    
+    @property
+    def enabled(self) -> bool:
+        return self.threshold is not None
+    
+    def reset(self) -> None:
+        """Forget everything seen so far."""
+        self.seen: Set[int] = set()
+        self.history: deque = deque(maxlen=self.window)
+        self.pages = 0
+    
+    def observe(self, blocks: Iterable[str]) -> float:
+        """
+        Record a page's text blocks.
+        
+        Args:
+            blocks: Text blocks extracted from the page
+        
+        Returns:
+            Fraction of the page's unique blocks that were new
+        """
+        hashes = {block_hash(block) for block in blocks if block}
+        if hashes:
+            novelty = len(hashes - self.seen) / len(hashes)
+            self.seen.update(hashes)
+        else:
+            novelty = 0.0
+        
+        self.pages += 1
+        self.history.append(novelty)
+        return novelty
+    
+    def is_novel(self, novelty: float) -> bool:
+        """Check whether a page is novel enough to expand its links."""
+        if not self.enabled or self.pages <= self.min_pages:
+            return True
+        return novelty >= self.threshold
+    
+    def saturated(self) -> bool:
+        """Check whether recent pages stopped adding information."""
+        if not self.enabled or self.pages < max(self.min_pages, self.window):
+            return False
+        return sum(self.history) / len(self.history) < self.threshold
@@ -3,7 +3,11 @@ from typing import Dict, List, Optional
 from playwright.async_api import async_playwright
 from bs4 import BeautifulSoup
 from loguru import logger
-from .base import BaseCrawler
+from ..extractors.item import ContentItem
+from .base import BaseCrawler, DEFAULT_CONTENT_TAGS
+from .link_filter import LinkFilter
+
+JS_CONTENT_TAGS = DEFAULT_CONTENT_TAGS + ['article']
 
 class JSCrawler(BaseCrawler):
     """Crawler capable of handling JavaScript-rendered content."""
@@ -13,7 +17,7 @@ class JSCrawler(BaseCrawler):
         url: str,
         max_depth: int = 3,
         selectors: Optional[List[str]] = None
-    ) -> List[Dict]:
+    ) -> List[ContentItem]:
         """
         Crawl JavaScript-rendered website content.
         
@@ -21,10 +25,12 @@ class JSCrawler(BaseCrawler):
             url: Website URL to crawl
             max_depth: Maximum crawl depth
             selectors: Optional CSS selectors for content extraction
-            
+        
         Returns:
             List of extracted content items
         """
+        self._start_crawl(url)
+        
         async with async_playwright() as p:
             browser = await p.chromium.launch()
             context = await browser.new_context(
@@ -32,13 +38,15 @@ class JSCrawler(BaseCrawler):
             )
             
             try:
-                return await self._crawl_recursive(
+                content = await self._crawl_recursive(
                     context,
                     url,
                     max_depth,
                     selectors,
                     depth=0
                 )
+                content.extend(self._flush_deliveries())
+                return content
             finally:
                 await browser.close()
     
@@ -49,7 +57,7 @@ class JSCrawler(BaseCrawler):
         max_depth: int,
         selectors: Optional[List[str]],
         depth: int
-    ) -> List[Dict]:
+    ) -> List[ContentItem]:
         """
         Recursively crawl pages and extract content.
         
@@ -59,25 +67,40 @@ class JSCrawler(BaseCrawler):
             max_depth: Maximum crawl depth
             selectors: CSS selectors for content extraction
             depth: Current crawl depth
-            
+        
         Returns:
             List of extracted content items
         """
         if depth >= max_depth or url in self.visited_urls:
             return []
         
-        await self.rate_limiter.wait()
+        if not self.budget.reserve_page():
+            return []
+        
         self.visited_urls.add(url)
+        await self.rate_limiter.wait()
+        
+        if self.budget.cancelled():
+            self.budget.release_page()
+            return []
+        
+        remaining = self.budget.remaining_time()
+        
+        goto_kwargs = {}
+        if remaining is not None:
+            goto_kwargs['timeout'] = remaining * 1000
         
         try:
             page = await context.new_page()
-            await page.goto(url, wait_until='networkidle')
+            response = await page.goto(url, wait_until='networkidle', **goto_kwargs)
             
             # Extract content
-            content = await self._extract_content(page, selectors)
+            content = await self._extract_content(page, selectors, response)
             
             # Find and crawl links if needed
-            if depth < max_depth:
+            expand = self._should_expand(content)
+            content = self._deliver(content, depth)
+            if depth < max_depth and expand and not self.budget.exhausted():
                 links = await self._extract_js_links(page)
                 for link in links:
                     if link not in self.visited_urls:
@@ -91,7 +114,7 @@ class JSCrawler(BaseCrawler):
                         content.extend(child_content)
             
             return content
-            
+        
         except Exception as e:
             logger.error(f"Error crawling {url}: {str(e)}")
             return []
@@ -103,54 +126,39 @@ class JSCrawler(BaseCrawler):
     async def _extract_content(
         self,
         page,
-        selectors: Optional[List[str]]
-    ) -> List[Dict]:
+        selectors: Optional[List[str]],
+        response=None
+    ) -> List[ContentItem]:
         """
         Extract content from page using selectors.
         
         Args:
             page: Playwright page object
             selectors: CSS selectors for content extraction
-            
+            response: Navigation response, archived with the rendered HTML
+        
         Returns:
             List of extracted content items
         """
         try:
             # Get page content after JavaScript execution
             html_content = await page.content()
-            soup = BeautifulSoup(html_content, 'html.parser')
-            content = []
-            
-            if not selectors:
-                # Default content extraction
-                for tag in ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'article']:
-                    elements = soup.find_all(tag)
-                    for element in elements:
-                        text = self.validators.sanitize_text(element.get_text())
-                        if text:
-                            content.append({
-                                'type': tag,
-                                'content': text,
-                                'metadata': self._extract_metadata(element),
-                                'url': page.url
-                            })
-            else:
-                # Selective content extraction
-                for selector in selectors:
-                    if self.validators.validate_selector(selector):
-                        elements = soup.select(selector)
-                        for element in elements:
-                            text = self.validators.sanitize_text(element.get_text())
-                            if text:
-                                content.append({
-                                    'type': 'selected',
-                                    'content': text,
-                                    'metadata': self._extract_metadata(element),
-                                    'url': page.url
-                                })
-            
-            return content
+            self.budget.record_bytes(len(html_content.encode('utf-8')))
+            if response is not None:
+                self._archive_response(
+                    page.url,
+                    response.status,
+                    dict(response.headers),
+                    html_content
+                )
             
+            return self._extract_from_html(
+                html_content,
+                selectors,
+                tags=JS_CONTENT_TAGS,
+                url=page.url
+            )
+        
         except Exception as e:
             logger.error(f"Content extraction error: {str(e)}")
             return []
@@ -161,7 +169,7 @@ class JSCrawler(BaseCrawler):
         
         Args:
             page: Playwright page object
-            
+        
         Returns:
             List of extracted URLs
         """
@@ -174,34 +182,9 @@ class JSCrawler(BaseCrawler):
             """)
             
             # Filter valid links
-            valid_links = []
-            for link in links:
-                if self.is_valid_url(link, page.url):
-                    valid_links.append(link)
-            
-            return valid_links
-            
+            link_filter = self.link_filter or LinkFilter.from_config(page.url, self.config)
+            return link_filter.filter(links, page.url)
+        
         except Exception as e:
             logger.error(f"Link extraction error: {str(e)}")
             return []
-    
-    def _extract_metadata(self, element) -> Dict:
-        """
-        Extract metadata from HTML element.
-        
-        Args:
-            element: BeautifulSoup element
-            
-        Returns:
-            Dictionary of element metadata
-        """
-        return {
-            'tag': element.name,
-            'classes': element.get('class', []),
-            'id': element.get('id'),
-            'attributes': {
-                k: v for k, v in element.attrs.items()
-                if k not in ['class', 'id']
-            },
-            'parent_tag': element.parent.name if element.parent else None
-        }
\ No newline at end of file
@@ -0,0 +1,180 @@
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence
+from urllib.parse import urljoin, urlsplit
+
+SCOPES = ('domain', 'subdomains', 'prefix', 'any')
+
+def _glob_to_regex(glob: str) -> str:
+    """Translate a shell-style glob into an unanchored regex."""
+    return re.escape(glob).replace(r'\*', '.*').replace(r'\?', '.')
+
+def rule_to_regex(rule: str) -> str:
+    """
+    Compile a single allow/deny rule into a regex matched against a URL.
+    
+    Supported rule forms:
+        re:<pattern>   raw regular expression searched anywhere in the URL
+        /path/prefix   path prefix, may contain * and ? wildcards
+        *.pdf or .pdf  file extension of the URL path
+        *glob*         wildcard pattern over the whole URL
+        text           plain substring of the URL
+    """
+    if rule.startswith('re:'):
+        return rule[3:]
+    if rule.startswith('/'):
+        return r'^[a-zA-Z][a-zA-Z0-9+.-]*://[^/?]*' + _glob_to_regex(rule)
+    if re.fullmatch(r'\*?\.[A-Za-z0-9]+', rule):
+        return re.escape(rule.lstrip('*')) + r'(?:\?|$)'
+    if '*' in rule or '?' in rule:
+        return '^' + _glob_to_regex(rule) + '$'
+    return re.escape(rule)
+
+def is_url_pattern(pattern: str) -> bool:
+    """Check whether an agent ignore pattern describes URLs rather than DOM nodes."""
+    return pattern.startswith(('/', 're:', '*.', 'http://', 'https://'))
+
+def _combine(rules: Sequence[str]) -> Optional[Pattern]:
+    if not rules:
+        return None
+    return re.compile(
+        '|'.join(f'(?:{rule_to_regex(rule)})' for rule in rules),
+        re.IGNORECASE
+    )
+
+class LinkFilter:
+    """
+    Link filter compiled once per crawl.
+    
+    The crawl root is parsed a single time and every allow/deny rule is folded
+    into one combined regex, so checking a link costs one ``urlsplit`` and at
+    most two regex searches.
+    """
+    
+    def __init__(
+        self,
+        base_url: str,
+        scope: str = 'domain',
+        allow: Optional[Sequence[str]] = None,
+        deny: Optional[Sequence[str]] = None,
+        max_length: int = 2048
+    ):
+        if scope not in SCOPES:
+            raise ValueError(f"Unsupported link scope: {scope}")
+        
+        base = urlsplit(base_url)
+        self.base_url = base_url
+        self.scope = scope
+        self.netloc = base.netloc.lower()
+        self.host = (base.hostname or '').lower()
+        self.path_prefix = base.path.rsplit('/', 1)[0] + '/'
+        self.max_length = max_length
+        self.allow = _combine(list(allow or []))
+        self.deny = _combine(list(deny or []))
+    
+    @classmethod
+    def from_config(cls, base_url: str, config: Dict) -> "LinkFilter":
+        """
+        Build a filter from crawler configuration.
+        
+        Reads ``link_scope``, ``allow_patterns``, ``deny_patterns``,
+        ``deny_extensions`` and the URL-shaped entries of ``ignore_patterns``.
+        """
+        deny = list(config.get('deny_patterns', []))
+        deny.extend(f".{ext.lstrip('.')}" for ext in config.get('deny_extensions', []))
+        deny.extend(p for p in config.get('ignore_patterns', []) if is_url_pattern(p))
+        
+        return cls(
+            base_url,
+            scope=config.get('link_scope', 'domain'),
+            allow=config.get('allow_patterns'),
+            deny=deny
+        )
+    
+    def _in_scope(self, netloc: str, path: str) -> bool:
+        if self.scope == 'any':
+            return True
+        if self.scope == 'subdomains':
+            host = netloc.rsplit('@', 1)[-1].split(':', 1)[0]
+            return host == self.host or host.endswith('.' + self.host)
+        if netloc != self.netloc:
+            return False
+        return self.scope == 'domain' or path.startswith(self.path_prefix)
+    
+    def accept(self, url: str) -> bool:
+        """Check an absolute, defragmented URL against scope and rules."""
+        if len(url) >= self.max_length:
+            return False
+        
+        try:
+            parsed = urlsplit(url)
+        except ValueError:
+            return False
+        
+        if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+            return False
+        return self._accept_parts(url, parsed.netloc.lower(), parsed.path)
+    
+    def _accept_parts(self, url: str, netloc: str, path: str) -> bool:
+        if not self._in_scope(netloc, path):
+            return False
+        if self.deny is not None and self.deny.search(url):
+            return False
+        return self.allow is None or self.allow.search(url) is not None
+    
+    def filter(self, hrefs: Iterable[str], page_url: str) -> List[str]:
+        """
+        Resolve and filter raw hrefs found on a page.
+        
+        Root-relative hrefs on an http(s) page are resolved without going
+        through ``urljoin``/``urlsplit``, which covers most links on
+        link-dense pages.
+        
+        Args:
+            hrefs: Raw href attribute values
+            page_url: URL of the page the hrefs were found on
+        
+        Returns:
+            Unique accepted URLs in document order, without fragments
+        """
+        page = urlsplit(page_url)
+        page_netloc = page.netloc.lower()
+        origin = f"{page.scheme}://{page.netloc}"
+        fast_path = page.scheme in ('http', 'https') and bool(page.netloc)
+        
+        seen = set()
+        links = []
+        
+        for href in hrefs:
+            href = href.strip()
+            if not href or href.startswith(('#', 'mailto:', 'javascript:', 'tel:')):
+                continue
+            
+            href = href.split('#', 1)[0]
+            if (
+                fast_path and href.startswith('/') and not href.startswith('//')
+                and '/.' not in href
+            ):
+                url = origin + href
+                if url in seen:
+                    continue
+                seen.add(url)
+                if (
+                    len(url) < self.max_length and
+                    self._accept_parts(url, page_netloc, href.split('?', 1)[0])
+                ):
+                    links.append(url)
+                continue
+            
+            if href.startswith(('http://', 'https://')):
+                url = href
+            else:
+                url = urljoin(page_url, href).split('#', 1)[0]
+            
+            if url in seen:
+                continue
+            seen.add(url)
+            
+            if self.accept(url):
+                links.append(url)
+        
+        return links
@@ -1,5 +1,19 @@
 # src/rufus/extractors/__init__.py
 from .content import ContentExtractor
+from .fingerprint import skeleton_paths, template_fingerprint
+from .item import ContentItem, ElementMeta
+from .main_content import MainContentDetector
 from .structured import StructuredExtractor
+from .structured_data import StructuredDataHandlers, extract_structured_data
 
-__all__ = ['ContentExtractor', 'StructuredExtractor']
\ No newline at end of file
+__all__ = [
+    'ContentExtractor',
+    'ContentItem',
+    'ElementMeta',
+    'MainContentDetector',
+    'StructuredDataHandlers',
+    'StructuredExtractor',
+    'extract_structured_data',
+    'skeleton_paths',
+    'template_fingerprint'
+]
\ No newline at end of file
@@ -1,21 +1,23 @@
 # src/rufus/extractors/base.py
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
+from bs4 import Tag
 from loguru import logger
+from .item import ContentItem, ElementMeta
 
 class BaseExtractor(ABC):
     """Base class for content extractors."""
     
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
+        self.capture_attributes = self.config.get('item_attributes', False)
     
     @abstractmethod
     async def extract(
         self,
         content: str,
         selectors: Optional[List[str]] = None
-    ) -> List[Dict]:
+    ) -> List[ContentItem]:
         """Extract content based on selectors."""
         pass
     
@@ -23,11 +25,11 @@ class BaseExtractor(ABC):
         """Clean and normalize extracted text."""
         return " ".join(text.split())
     
-    def _extract_metadata(self, element: BeautifulSoup) -> Dict:
-        """Extract metadata from element."""
-        return {
-            "tag": element.name,
-            "classes": element.get("class", []),
-            "id": element.get("id"),
-            "attributes": dict(element.attrs)
-        }
+    def _extract_metadata(self, element: Tag) -> ElementMeta:
+        """
+        Extract metadata from element.
+        
+        Attributes other than class and id are only copied when
+        ``item_attributes`` is enabled in the config.
+        """
+        return ElementMeta.from_element(element, self.capture_attributes)
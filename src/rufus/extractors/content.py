@@ -1,7 +1,10 @@
 # src/rufus/extractors/content.py
-from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
+from typing import List, Optional
+from bs4 import BeautifulSoup, Tag
 from .base import BaseExtractor
+from .item import ContentItem
+from .selectors import get_selector_plan
+from .visitor import DOMVisitor, text_block_handler
 from loguru import logger
 
 class ContentExtractor(BaseExtractor):
@@ -11,35 +14,33 @@ class ContentExtractor(BaseExtractor):
         self,
         content: str,
         selectors: Optional[List[str]] = None
-    ) -> List[Dict]:
+    ) -> List[ContentItem]:
         """Extract content using provided selectors."""
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            results = []
-            
-            if not selectors:
-                # Default content extraction
-                for tag in ['p', 'h1', 'h2', 'h3', 'article']:
-                    elements = soup.find_all(tag)
-                    for element in elements:
-                        results.append(self._process_element(element))
-            else:
+            if selectors:
                 # Selective extraction
-                for selector in selectors:
-                    elements = soup.select(selector)
-                    for element in elements:
-                        results.append(self._process_element(element))
-            
-            return [r for r in results if r["content"].strip()]
+                return get_selector_plan(selectors).extract(
+                    BeautifulSoup(content, 'html.parser'),
+                    self._clean_text,
+                    self._extract_metadata,
+                    item_type="text"
+                )
             
+            # Default content extraction
+            visitor = DOMVisitor().on(
+                ['p', 'h1', 'h2', 'h3', 'article'],
+                text_block_handler(self._clean_text, self._extract_metadata, item_type="text")
+            )
+            return visitor.visit_html(content).results
+        
         except Exception as e:
             logger.error(f"Content extraction failed: {str(e)}")
             return []
     
-    def _process_element(self, element: BeautifulSoup) -> Dict:
+    def _process_element(self, element: Tag) -> ContentItem:
         """Process a single HTML element."""
-        return {
-            "type": "text",
-            "content": self._clean_text(element.get_text()),
-            "metadata": self._extract_metadata(element)
-        }
+        return ContentItem(
+            "text",
+            self._clean_text(element.get_text()),
+            self._extract_metadata(element)
+        )
@@ -0,0 +1,46 @@
+# src/rufus/extractors/fingerprint.py
+import re
+from typing import Set, Union
+from bs4 import BeautifulSoup, Tag
+from ..utils.hashing import simhash
+
+# Elements whose contents say nothing about the page template
+SKIP_TAGS = frozenset(['script', 'style', 'noscript', 'template', 'svg', 'iframe'])
+DIGITS = re.compile(r'\d+')
+
+def _step(element: Tag) -> str:
+    classes = element.get('class') or []
+    if isinstance(classes, str):
+        classes = classes.split()
+    # Generated class names such as post-1234 are normalized to post-#
+    names = sorted({DIGITS.sub('#', name) for name in classes})[:2]
+    return element.name + ''.join(f'.{name}' for name in names)
+
+def skeleton_paths(document: Union[str, Tag], max_depth: int = 12) -> Set[str]:
+    """
+    Collect the distinct tag paths of a page.
+    
+    Each path names the tags and up to two classes from the root down to an
+    element. Text, attributes other than classes, and how often an element
+    repeats are ignored, so pages built from the same template share nearly
+    all of their paths.
+    """
+    root = BeautifulSoup(document, 'html.parser') if isinstance(document, str) else document
+    paths: Set[str] = set()
+    stack = [(root, '', 0)]
+    
+    while stack:
+        element, path, depth = stack.pop()
+        for child in element.children:
+            if not isinstance(child, Tag) or child.name in SKIP_TAGS:
+                continue
+            child_path = f"{path}/{_step(child)}"
+            paths.add(child_path)
+            if depth + 1 < max_depth:
+                stack.append((child, child_path, depth + 1))
+    
+    return paths
+
+def template_fingerprint(document: Union[str, Tag], max_depth: int = 12) -> int:
+    """Return a 64-bit SimHash of a page's DOM skeleton."""
+    return simhash(skeleton_paths(document, max_depth))
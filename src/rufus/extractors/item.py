@@ -0,0 +1,223 @@
+import sys
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple, Union
+from bs4 import Tag
+
+_CORE_KEYS = ('type', 'content', 'metadata', 'url', 'depth', 'heading_path')
+_PLAIN_KEYS = ('type', 'content', 'url', 'depth')
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+def flatten_data(data: Any, prefix: str = '') -> Iterator[Tuple[str, str]]:
+    """Yield ``(dotted.key, value)`` pairs for every leaf value of structured data."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from flatten_data(value, f"{prefix}.{key}" if prefix else key)
+    elif isinstance(data, list):
+        for value in data:
+            yield from flatten_data(value, prefix)
+    elif data is not None and data != '':
+        yield prefix, str(data)
+
+def item_text(item: Mapping[str, Any]) -> str:
+    """
+    Return the text of any content item.
+    
+    Text items carry it in ``content``; tables are flattened to tab-separated
+    rows, lists to one entry per line and structured data to one
+    ``key: value`` line per value.
+    """
+    content = item.get('content')
+    if isinstance(content, str):
+        return content
+    if item.get('type') == 'table':
+        rows = [item.get('headers') or []] + list(item.get('rows') or [])
+        return "\n".join("\t".join(row) for row in rows if row)
+    if item.get('type') == 'list':
+        return "\n".join(item.get('items') or [])
+    if item.get('type') == 'structured':
+        return "\n".join(f"{key}: {value}" for key, value in flatten_data(item.get('data')))
+    return ''
+
+class ElementMeta:
+    """
+    Compact element metadata.
+    
+    Tag names and classes are interned so every item on every page shares the
+    same string objects, and the attribute copy is only taken when requested.
+    The familiar metadata dict is only built when an item's metadata is read.
+    """
+    
+    __slots__ = ('tag', 'id', 'classes', 'parent_tag', 'attributes')
+    
+    def __init__(
+        self,
+        tag: str,
+        id: Optional[str] = None,
+        classes: Tuple[str, ...] = (),
+        parent_tag: Optional[str] = None,
+        attributes: Optional[Dict] = None
+    ):
+        self.tag = _intern(tag)
+        self.id = id
+        self.classes = classes
+        self.parent_tag = _intern(parent_tag)
+        self.attributes = attributes
+    
+    @classmethod
+    def from_element(cls, element: Tag, attributes: bool = False) -> "ElementMeta":
+        """
+        Capture metadata from an element.
+        
+        Args:
+            element: Source element
+            attributes: Also copy the element's other attributes
+        """
+        attrs = element.attrs
+        classes = attrs.get('class')
+        names = classes.split() if isinstance(classes, str) else classes or ()
+        element_id = attrs.get('id')
+        
+        captured = None
+        if attributes:
+            captured = {k: v for k, v in attrs.items() if k not in ('class', 'id')}
+        
+        parent = element.parent
+        return cls(
+            element.name,
+            element_id if isinstance(element_id, str) else None,
+            tuple(sys.intern(c) for c in names),
+            parent.name if parent is not None else None,
+            captured or None
+        )
+    
+    def to_dict(self) -> Dict:
+        """Return metadata in the plain dict shape."""
+        return {
+            'tag': self.tag,
+            'classes': list(self.classes),
+            'id': self.id,
+            'attributes': dict(self.attributes) if self.attributes else {},
+            'parent_tag': self.parent_tag
+        }
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ElementMeta):
+            other = other.to_dict()
+        return self.to_dict() == other
+    
+    def __repr__(self) -> str:
+        return f"ElementMeta({self.to_dict()!r})"
+
+Metadata = Union[ElementMeta, Dict, None]
+
+class ContentItem(MutableMapping[str, Any]):
+    """
+    A single extracted content item.
+    
+    Items keep their common fields in slots and only allocate a dict for
+    uncommon keys such as table rows or matched selectors, while still
+    behaving like the plain dicts earlier versions returned: ``item['content']``,
+    ``item.get('url')``, ``item.update(...)`` and comparisons with dicts all
+    work, and ``to_dict`` converts to that shape for serialization.
+    """
+    
+    __slots__ = ('type', 'content', 'meta', 'url', 'depth', 'heading_path', '_extra')
+    
+    def __init__(
+        self,
+        type: str,
+        content: Optional[str] = None,
+        meta: Metadata = None,
+        url: Optional[str] = None,
+        heading_path: Optional[Sequence[str]] = None,
+        depth: Optional[int] = None,
+        **extra: Any
+    ):
+        self.type = _intern(type)
+        self.content = content
+        self.meta = meta
+        self.url = url
+        self.depth = depth
+        self.heading_path = tuple(heading_path) if heading_path is not None else None
+        self._extra: Optional[Dict[str, Any]] = extra or None
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ContentItem":
+        """Build an item from its plain dict shape, e.g. after deserialization."""
+        data = dict(data)
+        return cls(
+            data.pop('type', None),
+            data.pop('content', None),
+            data.pop('metadata', None),
+            data.pop('url', None),
+            data.pop('heading_path', None),
+            data.pop('depth', None),
+            **data
+        )
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == 'metadata':
+            meta = self.meta
+            if meta is None:
+                raise KeyError(key)
+            if isinstance(meta, ElementMeta):
+                # Materialize once so callers may update the metadata in place
+                meta = self.meta = meta.to_dict()
+            return meta
+        if key == 'heading_path':
+            if self.heading_path is None:
+                raise KeyError(key)
+            return list(self.heading_path)
+        if key in _PLAIN_KEYS:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == 'metadata':
+            self.meta = value
+        elif key == 'heading_path':
+            self.heading_path = tuple(value) if value is not None else None
+        elif key in _PLAIN_KEYS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+    
+    def __delitem__(self, key: str) -> None:
+        self[key]
+        if key == 'metadata':
+            self.meta = None
+        elif key in _CORE_KEYS:
+            setattr(self, key, None)
+        elif self._extra is not None:
+            del self._extra[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        for key in _CORE_KEYS:
+            if getattr(self, 'meta' if key == 'metadata' else key) is not None:
+                yield key
+        if self._extra:
+            yield from self._extra
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __contains__(self, key: Any) -> bool:
+        if key in _CORE_KEYS:
+            return getattr(self, 'meta' if key == 'metadata' else key) is not None
+        return self._extra is not None and key in self._extra
+    
+    def to_dict(self) -> Dict:
+        """Return the item as a plain dict."""
+        return {key: self[key] for key in self}
+    
+    def __repr__(self) -> str:
+        return f"ContentItem({self.to_dict()!r})"
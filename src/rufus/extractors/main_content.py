@@ -0,0 +1,219 @@
+import re
+from typing import Dict, List, Optional, Set, Tuple
+from bs4 import BeautifulSoup, NavigableString, Tag
+from .visitor import HEADING_TAGS
+
+POSITIVE_HINTS = re.compile(
+    r'article|body|content|entry|main|page|post|story|text|blog',
+    re.IGNORECASE
+)
+NEGATIVE_HINTS = re.compile(
+    r'nav|menu|footer|header|masthead|sidebar|aside|comment|cookie|consent|'
+    r'banner|advert|\bads?\b|promo|related|share|social|sponsor|subscribe|'
+    r'newsletter|breadcrumb|widget|popup|modal|pagination',
+    re.IGNORECASE
+)
+
+BOILERPLATE_TAGS = frozenset(['nav', 'aside', 'footer', 'form', 'noscript', 'iframe'])
+IGNORED_TAGS = frozenset(['script', 'style', 'template', 'svg', 'head', 'title'])
+PARAGRAPH_TAGS = frozenset(['p', 'pre', 'td', 'blockquote'])
+TAG_WEIGHTS = {
+    'article': 10, 'main': 10, 'section': 5, 'div': 5,
+    'pre': 3, 'td': 3, 'blockquote': 3,
+    'ol': -3, 'ul': -3, 'dl': -3, 'li': -3, 'form': -3,
+    'h1': -5, 'h2': -5, 'h3': -5, 'h4': -5, 'h5': -5, 'h6': -5, 'th': -5
+}
+
+class MainContentDetector:
+    """
+    Locate the main content region of a page.
+    
+    Blocks are scored in a single post-order pass in the style of
+    readability: every paragraph with enough text adds a score based on its
+    length and commas to its parent and grandparent, and candidates are then
+    weighted by link density and class/id hints. The best candidate is kept,
+    together with sibling blocks that score comparably and the headings
+    that precede it, and link-heavy or boilerplate blocks inside it are
+    pruned.
+    """
+    
+    def __init__(self, config: Optional[Dict] = None):
+        config = config or {}
+        self.min_paragraph_length = config.get('main_content_min_paragraph', 25)
+        self.max_link_density = config.get('main_content_max_link_density', 0.5)
+        self.sibling_ratio = config.get('main_content_sibling_ratio', 0.2)
+    
+    def _class_weight(self, element: Tag) -> int:
+        hints = " ".join(element.get('class', [])) + " " + (element.get('id') or '')
+        if not hints.strip():
+            return 0
+        weight = 0
+        if NEGATIVE_HINTS.search(hints):
+            weight -= 25
+        if POSITIVE_HINTS.search(hints):
+            weight += 25
+        return weight
+    
+    def _collect(self, root: Tag) -> Tuple[Dict[int, List], Dict[int, float], List[Tag]]:
+        """
+        Gather text statistics bottom-up and accumulate paragraph scores.
+        
+        Returns:
+            Per-node [text, link text, commas], raw candidate scores and the
+            visited elements in post-order
+        """
+        stats: Dict[int, List] = {}
+        scores: Dict[int, float] = {}
+        order: List[Tag] = []
+        stack: List[Tuple[Tag, bool]] = [(root, False)]
+        
+        while stack:
+            element, children_done = stack.pop()
+            if not children_done:
+                stack.append((element, True))
+                stack.extend(
+                    (child, False) for child in reversed(element.contents)
+                    if isinstance(child, Tag) and child.name not in IGNORED_TAGS
+                )
+                continue
+            
+            text = links = commas = 0
+            for child in element.contents:
+                if type(child) is NavigableString:
+                    stripped = child.strip()
+                    text += len(stripped)
+                    commas += stripped.count(',')
+                elif isinstance(child, Tag) and id(child) in stats:
+                    child_text, child_links, child_commas = stats[id(child)]
+                    text += child_text
+                    links += child_links
+                    commas += child_commas
+            
+            if element.name == 'a':
+                links = text
+            stats[id(element)] = [text, links, commas]
+            order.append(element)
+            
+            if element.name in PARAGRAPH_TAGS and text >= self.min_paragraph_length:
+                score = 1 + commas + min(text / 100, 3)
+                parent = element.parent
+                if parent is not None:
+                    scores[id(parent)] = scores.get(id(parent), 0) + score
+                    grandparent = parent.parent
+                    if grandparent is not None:
+                        scores[id(grandparent)] = scores.get(id(grandparent), 0) + score / 2
+        
+        return stats, scores, order
+    
+    def _link_density(self, stats: Dict[int, List], element: Tag) -> float:
+        text, links, _ = stats.get(id(element), (0, 0, 0))
+        return links / text if text else 0.0
+    
+    def detect(self, soup: Tag) -> Tuple[Tag, Set[int], Dict]:
+        """
+        Find the main content region of a parsed page.
+        
+        Args:
+            soup: Parsed document
+        
+        Returns:
+            Root element of the region, ids of elements to skip inside it,
+            and a report describing what was kept
+        """
+        body = soup.find('body') or soup
+        stats, raw_scores, order = self._collect(body)
+        total = stats.get(id(body), [0, 0, 0])[0]
+        
+        elements = {id(element): element for element in order}
+        best: Optional[Tag] = None
+        best_score = 0.0
+        final_scores: Dict[int, float] = {}
+        
+        for key, raw in raw_scores.items():
+            element = elements.get(key)
+            if element is None or element.name in BOILERPLATE_TAGS:
+                continue
+            score = raw + TAG_WEIGHTS.get(element.name, 0) + self._class_weight(element)
+            score *= 1 - self._link_density(stats, element)
+            final_scores[key] = score
+            if score > best_score:
+                best, best_score = element, score
+        
+        skip: Set[int] = set()
+        region = best if best is not None else body
+        
+        # Merge comparably scored siblings so content split across blocks
+        # survives, and keep the title and headings placed before the region
+        if best is not None and best is not body and best.parent is not None:
+            threshold = max(10.0, best_score * self.sibling_ratio)
+            siblings = [child for child in best.parent.contents if isinstance(child, Tag)]
+            position = siblings.index(best)
+            keep = [
+                child for index, child in enumerate(siblings)
+                if child is best
+                or final_scores.get(id(child), 0) >= threshold
+                or (index < position and self._is_heading_block(child, stats))
+            ]
+            if len(keep) > 1:
+                region = best.parent
+                skip.update(id(child) for child in siblings if child not in keep)
+        
+        # Prune boilerplate and link lists inside the region, top-down so
+        # only the outermost pruned block of a subtree is recorded
+        pruned_chars = sum(stats.get(key, [0])[0] for key in skip)
+        stack = [
+            child for child in region.contents
+            if isinstance(child, Tag) and id(child) not in skip and id(child) in stats
+        ]
+        while stack:
+            element = stack.pop()
+            if self._is_boilerplate(element, stats):
+                skip.add(id(element))
+                pruned_chars += stats[id(element)][0]
+                continue
+            stack.extend(
+                child for child in element.contents
+                if isinstance(child, Tag) and id(child) in stats
+            )
+        
+        kept = stats.get(id(region), [0, 0, 0])[0] - pruned_chars
+        report = {
+            'tag': region.name,
+            'id': region.get('id'),
+            'classes': list(region.get('class', [])),
+            'score': round(best_score, 2),
+            'detected': best is not None,
+            'pruned_blocks': len(skip),
+            'kept_chars': kept,
+            'total_chars': total,
+            'kept_ratio': round(kept / total, 3) if total else 1.0
+        }
+        return region, skip, report
+    
+    def _is_heading_block(self, element: Tag, stats: Dict[int, List]) -> bool:
+        """Check whether a block is a heading, or a header wrapping one, rather than chrome."""
+        if element.name in HEADING_TAGS:
+            return self._link_density(stats, element) <= self.max_link_density
+        if element.name in BOILERPLATE_TAGS or self._class_weight(element) < 0:
+            return False
+        return (
+            element.find(list(HEADING_TAGS)) is not None and
+            self._link_density(stats, element) <= self.max_link_density
+        )
+    
+    def _is_boilerplate(self, element: Tag, stats: Dict[int, List]) -> bool:
+        """Check whether a block inside the main region is navigation or chrome."""
+        if element.name in BOILERPLATE_TAGS:
+            return True
+        if element.name in PARAGRAPH_TAGS:
+            return False
+        if self._class_weight(element) < 0:
+            return True
+        return (
+            stats[id(element)][0] > 0 and
+            self._link_density(stats, element) > self.max_link_density
+        )
+    
+    def detect_html(self, html: str) -> Tuple[Tag, Set[int], Dict]:
+        """Parse HTML and detect its main content region."""
+        return self.detect(BeautifulSoup(html, 'html.parser'))
@@ -0,0 +1,185 @@
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence, Tuple
+from bs4 import Tag
+import soupsieve
+from loguru import logger
+
+try:
+    # Reusing one matcher per document avoids soupsieve rebuilding its match
+    # state for every element. This is a private API: if it moves or its
+    # signature changes, the public ``SoupSieve.match`` is used instead.
+    from soupsieve.css_match import CSSMatch
+    _use_private_matcher = True
+except Exception:  # pragma: no cover
+    _use_private_matcher = False
+from ..utils.validators import Validators
+from .item import ContentItem, Metadata
+from .visitor import HEADING_TAGS, VisitContext
+
+@lru_cache(maxsize=512)
+def compile_selector(selector: str) -> Optional[soupsieve.SoupSieve]:
+    """
+    Validate and compile a CSS selector.
+    
+    Compiled selectors are shared process-wide through an LRU cache.
+    
+    Returns:
+        Compiled selector, or None if the selector is invalid
+    """
+    if not Validators.validate_selector(selector):
+        logger.warning(f"Ignoring invalid selector: {selector}")
+        return None
+    
+    try:
+        return soupsieve.compile(selector)
+    except Exception as e:
+        logger.warning(f"Ignoring invalid selector {selector}: {e}")
+        return None
+
+class SelectorPlan:
+    """
+    A validated, compiled set of selectors evaluated together.
+    
+    All selectors are merged into one selector list so a page is matched in a
+    single traversal; the individual selectors are only consulted for elements
+    the merged selector already matched, to tag each match with its sources.
+    """
+    
+    def __init__(self, selectors: Sequence[str]):
+        compiled = [(s, compile_selector(s)) for s in dict.fromkeys(selectors)]
+        self.selectors: Tuple[str, ...] = tuple(s for s, c in compiled if c is not None)
+        self._compiled = [c for _, c in compiled if c is not None]
+        
+        if len(self._compiled) == 1:
+            self._merged: Optional[soupsieve.SoupSieve] = self._compiled[0]
+        elif self._compiled:
+            self._merged = compile_selector(", ".join(self.selectors))
+        else:
+            self._merged = None
+    
+    def __bool__(self) -> bool:
+        return bool(self.selectors)
+    
+    def _matchers(self, root: Tag) -> List[Callable[[Tag], bool]]:
+        """Build per-selector match functions for one document."""
+        global _use_private_matcher
+        if _use_private_matcher:
+            try:
+                matchers: List[Callable[[Tag], bool]] = [
+                    CSSMatch(c.selectors, root, c.namespaces, c.flags).match
+                    for c in self._compiled
+                ]
+                # Probe once so an incompatible soupsieve fails here, not per element
+                for match in matchers:
+                    match(root)
+                return matchers
+            except Exception as e:
+                logger.warning(f"Falling back to public soupsieve matching: {e}")
+                _use_private_matcher = False
+        return [compiled.match for compiled in self._compiled]
+    
+    def _tag(self, element: Tag, matchers: List[Callable[[Tag], bool]]) -> List[str]:
+        """Name the selectors behind an element the merged selector matched."""
+        if len(self.selectors) == 1:
+            return list(self.selectors)
+        return [
+            selector for selector, match in zip(self.selectors, matchers)
+            if match(element)
+        ]
+    
+    def matches(self, element: Tag) -> List[str]:
+        """Return the selectors that match an element."""
+        if self._merged is None or not self._merged.match(element):
+            return []
+        return self._tag(element, [compiled.match for compiled in self._compiled])
+    
+    def select(self, root: Tag) -> List[Tuple[Tag, List[str]]]:
+        """
+        Select matching elements in document order.
+        
+        Returns:
+            (element, matching selectors) pairs
+        """
+        if self._merged is None:
+            return []
+        
+        matchers = self._matchers(root)
+        return [
+            (element, self._tag(element, matchers))
+            for element in self._merged.select(root)
+        ]
+    
+    def extract(
+        self,
+        root: Tag,
+        clean: Callable[[str], str],
+        metadata: Callable[[Tag], Metadata],
+        url: Optional[str] = None,
+        item_type: str = 'selected'
+    ) -> List[ContentItem]:
+        """
+        Extract text items for every matched element.
+        
+        Matching is one traversal of the merged selector. Heading context is
+        then recovered with a plain descendant scan that stops at the last
+        match, which is far cheaper than evaluating selectors per element.
+        
+        Args:
+            root: Parsed document
+            clean: Text normalization function
+            metadata: Element metadata function
+            url: Source URL recorded on every item
+            item_type: Item type of emitted items
+        
+        Returns:
+            Items in document order, tagged with heading context and the
+            selectors that matched them
+        """
+        if self._merged is None:
+            return []
+        
+        selected = {id(element) for element in self._merged.select(root)}
+        remaining = len(selected)
+        matchers = self._matchers(root) if len(self.selectors) > 1 else []
+        context = VisitContext(url)
+        
+        for node in root.descendants:
+            if not remaining:
+                break
+            
+            if not isinstance(node, Tag):
+                continue
+            
+            name = node.name
+            is_heading = name in HEADING_TAGS
+            is_selected = id(node) in selected
+            if not (is_heading or is_selected):
+                continue
+            
+            if is_heading:
+                level = int(name[1])
+                context.enter_heading(level)
+            
+            text = clean(node.get_text())
+            if is_selected:
+                remaining -= 1
+                if text:
+                    context.emit(ContentItem(
+                        item_type,
+                        text,
+                        metadata(node),
+                        selectors=self._tag(node, matchers)
+                    ))
+            
+            if is_heading:
+                context.push_heading(level, text)
+        
+        return context.results
+
+@lru_cache(maxsize=128)
+def _cached_plan(selectors: Tuple[str, ...]) -> SelectorPlan:
+    return SelectorPlan(selectors)
+
+def get_selector_plan(selectors: Sequence[str]) -> SelectorPlan:
+    """Return a cached plan for a sequence of selectors."""
+    return _cached_plan(tuple(selectors))
@@ -1,8 +1,11 @@
 # src/rufus/extractors/structured.py
-from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
-import json
+from typing import Any, Dict, List, Optional
+from bs4 import Tag
 from .base import BaseExtractor
+from .item import ContentItem
+from .structured_data import StructuredDataHandlers
+from .tables import TableGrid
+from .visitor import DOMVisitor, VisitContext, text_excluding
 from loguru import logger
 
 class StructuredExtractor(BaseExtractor):
@@ -12,103 +15,112 @@ class StructuredExtractor(BaseExtractor):
         self,
         content: str,
         selectors: Optional[List[str]] = None
-    ) -> List[Dict]:
-        """Extract structured data like tables, lists, and forms."""
+    ) -> List[ContentItem]:
+        """
+        Extract structured data like tables, lists, and forms.
+        
+        Embedded JSON-LD, microdata, RDFa-lite and OpenGraph meta tags are
+        extracted in the same walk as ``structured`` items unless
+        ``structured_data`` is False in the config.
+        """
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            results = []
-            
-            # Extract tables
-            results.extend(self._extract_tables(soup))
-            
-            # Extract lists
-            results.extend(self._extract_lists(soup))
-            
-            # Extract forms
-            results.extend(self._extract_forms(soup))
+            visitor = DOMVisitor()
+            visitor.on(['table'], self._handle_table)
+            visitor.on(['ul', 'ol'], self._handle_list)
+            visitor.on(['form'], self._handle_form)
             
-            return results
+            handlers = None
+            if self.config.get('structured_data', True):
+                handlers = StructuredDataHandlers(self._extract_metadata)
+                handlers.register(visitor)
             
+            context = visitor.visit_html(content)
+            if handlers is not None:
+                handlers.finish(context)
+            return context.results
+        
         except Exception as e:
             logger.error(f"Structured extraction failed: {str(e)}")
             return []
     
-    def _extract_tables(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extract table data."""
-        results = []
-        for table in soup.find_all('table'):
-            try:
-                headers = []
-                for th in table.find_all('th'):
-                    headers.append(self._clean_text(th.get_text()))
-                
-                rows = []
-                for tr in table.find_all('tr'):
-                    row = []
-                    for td in tr.find_all('td'):
-                        row.append(self._clean_text(td.get_text()))
-                    if row:
-                        rows.append(row)
-                
-                results.append({
-                    "type": "table",
-                    "headers": headers,
-                    "rows": rows,
-                    "metadata": self._extract_metadata(table)
-                })
-                
-            except Exception as e:
-                logger.error(f"Table extraction failed: {str(e)}")
-                continue
+    def _handle_table(self, table: Tag, context: VisitContext) -> bool:
+        """Emit a table; nested tables are reached by the walk on their own."""
+        try:
+            context.emit(self._extract_table(table))
+        except Exception as e:
+            logger.error(f"Table extraction failed: {str(e)}")
+        return True
+    
+    def _handle_list(self, list_tag: Tag, context: VisitContext) -> bool:
+        """Emit a list; nested lists are reached by the walk on their own."""
+        try:
+            context.emit(self._extract_list(list_tag))
+        except Exception as e:
+            logger.error(f"List extraction failed: {str(e)}")
+        return True
+    
+    def _handle_form(self, form: Tag, context: VisitContext) -> bool:
+        """Emit a form."""
+        try:
+            context.emit(self._extract_form(form))
+        except Exception as e:
+            logger.error(f"Form extraction failed: {str(e)}")
+        return True
+    
+    def _extract_table(self, table: Tag) -> ContentItem:
+        """
+        Extract table data, leaving nested tables out of cell text.
+        
+        Spanning cells are expanded into a grid; ``headers`` holds one label
+        per column and ``rows`` the body rows. Unless ``table_types`` is
+        False, ``columns`` holds each body column converted to a typed
+        array, see ``TableColumn``.
+        """
+        grid = TableGrid.from_element(
+            table,
+            lambda cell: self._clean_text(text_excluding(cell, ('table',)))
+        )
+        extra: Dict[str, Any] = {}
+        if self.config.get('table_types', True) and grid.header_rows < len(grid.rows):
+            extra['columns'] = grid.columns(self.config.get('table_type_threshold', 0.8))
         
-        return results
+        return ContentItem(
+            "table",
+            meta=self._extract_metadata(table),
+            headers=grid.headers,
+            rows=grid.body,
+            **extra
+        )
     
-    def _extract_lists(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extract list data."""
-        results = []
-        for list_tag in soup.find_all(['ul', 'ol']):
-            try:
-                items = []
-                for li in list_tag.find_all('li'):
-                    items.append(self._clean_text(li.get_text()))
-                
-                results.append({
-                    "type": "list",
-                    "list_type": list_tag.name,
-                    "items": items,
-                    "metadata": self._extract_metadata(list_tag)
-                })
-                
-            except Exception as e:
-                logger.error(f"List extraction failed: {str(e)}")
-                continue
+    def _extract_list(self, list_tag: Tag) -> ContentItem:
+        """Extract list data, leaving nested lists out of item text."""
+        items = [
+            self._clean_text(text_excluding(li, ('ul', 'ol')))
+            for li in list_tag.find_all('li', recursive=False)
+        ]
         
-        return results
+        return ContentItem(
+            "list",
+            meta=self._extract_metadata(list_tag),
+            list_type=list_tag.name,
+            items=items
+        )
     
-    def _extract_forms(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_form(self, form: Tag) -> ContentItem:
         """Extract form data."""
-        results = []
-        for form in soup.find_all('form'):
-            try:
-                fields = []
-                for input_tag in form.find_all(['input', 'select', 'textarea']):
-                    fields.append({
-                        "type": input_tag.get('type', input_tag.name),
-                        "name": input_tag.get('name', ''),
-                        "id": input_tag.get('id', ''),
-                        "required": input_tag.get('required') is not None
-                    })
-                
-                results.append({
-                    "type": "form",
-                    "action": form.get('action', ''),
-                    "method": form.get('method', 'get'),
-                    "fields": fields,
-                    "metadata": self._extract_metadata(form)
-                })
-                
-            except Exception as e:
-                logger.error(f"Form extraction failed: {str(e)}")
-                continue
+        fields = []
+        for input_tag in form.find_all(['input', 'select', 'textarea']):
+            fields.append({
+                "type": input_tag.get('type', input_tag.name),
+                "name": input_tag.get('name', ''),
+                "id": input_tag.get('id', ''),
+                "required": input_tag.get('required') is not None
+            })
         
-        return results
\ No newline at end of file
+        return ContentItem(
+            "form",
+            meta=self._extract_metadata(form),
+            action=form.get('action', ''),
+            method=form.get('method', 'get'),
+            fields=fields
+        )
\ No newline at end of file
@@ -0,0 +1,245 @@
+# src/rufus/extractors/structured_data.py
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Union
+from bs4 import BeautifulSoup, Tag
+from loguru import logger
+from .item import ContentItem, ElementMeta, Metadata
+from .visitor import DOMVisitor, VisitContext
+
+SCHEMA_PREFIX = re.compile(r'^https?://(www\.)?schema\.org/', re.IGNORECASE)
+SCHEMA_ENUMERATION = re.compile(r'^https?://(www\.)?schema\.org/[A-Z][A-Za-z0-9]*$')
+JSON_LD_OPENING = re.compile(r'^(?:\s*(?:<!--|<!\[CDATA\[))+')
+JSON_LD_CLOSING = re.compile(r'(?:(?:-->|\]\]>)\s*)+$')
+JSON_LD_TYPES = frozenset(['application/ld+json', 'application/json+ld'])
+
+# OpenGraph and similar page-level meta tags; og: is dropped from keys
+META_PREFIXES = ('og:', 'twitter:', 'article:', 'product:', 'book:', 'profile:', 'music:', 'video:')
+META_NAMES = frozenset(['description', 'keywords', 'author'])
+
+# Properties whose values are links, kept verbatim even when they point at schema.org
+URL_KEYS = frozenset(['@id', 'url', 'sameAs', 'image', 'logo', 'mainEntityOfPage'])
+
+# Where microdata and RDFa read a property's value, by tag
+URL_ATTRIBUTES = {
+    'a': 'href', 'area': 'href', 'link': 'href',
+    'img': 'src', 'audio': 'src', 'video': 'src', 'source': 'src',
+    'iframe': 'src', 'embed': 'src', 'track': 'src', 'object': 'data'
+}
+
+def normalize_type(value: Any) -> Any:
+    """Strip the schema.org namespace from a type, unwrapping single-item lists."""
+    if isinstance(value, list):
+        value = [normalize_type(item) for item in value]
+        return value[0] if len(value) == 1 else value
+    if isinstance(value, str):
+        return SCHEMA_PREFIX.sub('', value.strip())
+    return value
+
+def normalize_node(value: Any, key: Optional[str] = None) -> Any:
+    """
+    Normalize a JSON-LD value.
+    
+    ``@context`` is dropped, types and enumeration members lose their
+    schema.org namespace and strings are whitespace-normalized, so
+    JSON-LD, microdata and RDFa describing the same thing compare equal.
+    Values of link properties such as ``url`` and ``sameAs`` are kept.
+    """
+    if isinstance(value, dict):
+        node = {}
+        for key, item in value.items():
+            if key == '@context':
+                continue
+            key = SCHEMA_PREFIX.sub('', key)
+            node[key] = normalize_type(item) if key == '@type' else normalize_node(item, key)
+        return node
+    if isinstance(value, list):
+        return [normalize_node(item, key) for item in value]
+    if isinstance(value, str):
+        value = " ".join(value.split())
+        # Enumeration members such as https://schema.org/InStock become InStock
+        if key not in URL_KEYS and SCHEMA_ENUMERATION.match(value):
+            return SCHEMA_PREFIX.sub('', value)
+        return value
+    return value
+
+def parse_json_ld(text: str) -> List[Dict]:
+    """
+    Parse a JSON-LD script into normalized top-level nodes.
+    
+    Arrays and ``@graph`` containers are flattened. Scripts that do not
+    parse, even after stripping leading and trailing HTML comment and
+    CDATA wrappers, yield nothing.
+    """
+    text = JSON_LD_CLOSING.sub('', JSON_LD_OPENING.sub('', text.strip()))
+    try:
+        data = json.loads(text)
+    except ValueError:
+        logger.debug("Skipping JSON-LD script that does not parse")
+        return []
+    
+    nodes = []
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(reversed(value))
+        elif isinstance(value, dict):
+            if '@graph' in value:
+                stack.extend(reversed(value['@graph'] if isinstance(value['@graph'], list) else [value['@graph']]))
+            else:
+                nodes.append(normalize_node(value))
+    return nodes
+
+def attribute(element: Tag, name: str) -> Optional[str]:
+    """Read an attribute as a string, joining multi-valued ones such as ``rel``."""
+    value = element.get(name)
+    return " ".join(value) if isinstance(value, list) else value
+
+def property_value(element: Tag, content_attribute: bool = False) -> str:
+    """Read the value of a microdata or RDFa property element."""
+    content = attribute(element, 'content')
+    if content_attribute and content is not None:
+        return " ".join(content.split())
+    name = element.name
+    if name == 'meta':
+        return " ".join((content or '').split())
+    url = attribute(element, URL_ATTRIBUTES[name]) if name in URL_ATTRIBUTES else None
+    if url:
+        return url.strip()
+    value = attribute(element, 'value')
+    if name in ('data', 'meter') and value is not None:
+        return value.strip()
+    timestamp = attribute(element, 'datetime')
+    if name == 'time' and timestamp:
+        return timestamp.strip()
+    return " ".join(element.get_text().split())
+
+def _add(node: Dict, key: str, value: Any) -> None:
+    if key not in node:
+        node[key] = value
+    elif isinstance(node[key], list):
+        node[key].append(value)
+    else:
+        node[key] = [node[key], value]
+
+def scoped_item(element: Tag, property_attribute: str, scope: Callable[[Tag], bool], type_attribute: str) -> Dict:
+    """
+    Collect the properties of a microdata or RDFa item.
+    
+    Properties of nested items belong to those items, which become the
+    value of the property that holds them.
+    """
+    node: Dict[str, Any] = {}
+    item_type = attribute(element, type_attribute)
+    if item_type:
+        types = [normalize_type(name) for name in item_type.split()]
+        node['@type'] = types[0] if len(types) == 1 else types
+    
+    rdfa = property_attribute == 'property'
+    stack = [child for child in reversed(element.contents) if isinstance(child, Tag)]
+    while stack:
+        child = stack.pop()
+        names = attribute(child, property_attribute)
+        nested = scope(child)
+        if names:
+            value = (
+                scoped_item(child, property_attribute, scope, type_attribute)
+                if nested else property_value(child, rdfa)
+            )
+            for name in names.split():
+                _add(node, SCHEMA_PREFIX.sub('', name), value)
+        if not nested:
+            stack.extend(child for child in reversed(child.contents) if isinstance(child, Tag))
+    return node
+
+def _is_microdata_scope(element: Tag) -> bool:
+    return element.get('itemscope') is not None
+
+def _is_rdfa_scope(element: Tag) -> bool:
+    return element.get('typeof') is not None
+
+class StructuredDataHandlers:
+    """
+    Visitor handlers collecting embedded structured data.
+    
+    JSON-LD scripts, top-level microdata and RDFa-lite items and page-level
+    meta tags (OpenGraph, Twitter cards, description) are collected in the
+    same walk that extracts the rest of a page. Each source becomes a
+    ``structured`` item with its ``format``, ``schema_type`` and normalized
+    ``data``; call ``finish`` after the walk to emit the meta tags.
+    """
+    
+    def __init__(self, metadata: Optional[Callable[[Tag], Metadata]] = None):
+        self.metadata = metadata or ElementMeta.from_element
+        self.meta: Dict[str, Any] = {}
+    
+    def register(self, visitor: DOMVisitor) -> DOMVisitor:
+        """Add the handlers to a visitor."""
+        visitor.on(['script'], self.handle_script)
+        visitor.on(['meta'], self.handle_meta)
+        return visitor.on_any(self.handle_scope)
+    
+    def _emit(self, context: VisitContext, element: Tag, data_format: str, data: Dict) -> None:
+        context.emit(ContentItem(
+            "structured",
+            meta=self.metadata(element),
+            format=data_format,
+            schema_type=data.get('@type'),
+            data=data
+        ))
+    
+    def handle_script(self, script: Tag, context: VisitContext) -> bool:
+        """Emit the nodes of a JSON-LD script."""
+        if (attribute(script, 'type') or '').split(';')[0].strip().lower() in JSON_LD_TYPES:
+            for node in parse_json_ld(script.get_text()):
+                self._emit(context, script, 'json-ld', node)
+        return False
+    
+    def handle_scope(self, element: Tag, context: VisitContext) -> bool:
+        """Emit top-level microdata and RDFa items; nested items are part of their parent."""
+        try:
+            if _is_microdata_scope(element) and element.get('itemprop') is None:
+                self._emit(context, element, 'microdata', scoped_item(
+                    element, 'itemprop', _is_microdata_scope, 'itemtype'
+                ))
+            elif _is_rdfa_scope(element) and element.get('property') is None:
+                self._emit(context, element, 'rdfa', scoped_item(
+                    element, 'property', _is_rdfa_scope, 'typeof'
+                ))
+        except Exception as e:
+            logger.error(f"Structured data extraction failed: {str(e)}")
+        return True
+    
+    def handle_meta(self, element: Tag, context: VisitContext) -> bool:
+        """Collect a page-level meta tag."""
+        key = (attribute(element, 'property') or attribute(element, 'name') or '').strip().lower()
+        content = attribute(element, 'content')
+        if content is None or element.get('itemprop') is not None:
+            return False
+        if key.startswith(META_PREFIXES) or key in META_NAMES:
+            _add(self.meta, key[3:] if key.startswith('og:') else key, " ".join(content.split()))
+        return False
+    
+    def finish(self, context: VisitContext) -> None:
+        """Emit the collected meta tags as one item."""
+        if self.meta:
+            data = dict(self.meta)
+            if 'type' in data:
+                data['@type'] = data.pop('type')
+            context.results.append(ContentItem(
+                "structured",
+                url=context.url,
+                heading_path=(),
+                format='meta',
+                schema_type=data.get('@type'),
+                data=data
+            ))
+
+def extract_structured_data(document: Union[str, Tag], url: Optional[str] = None) -> List[ContentItem]:
+    """Extract the structured data embedded in a page or parsed document."""
+    root = BeautifulSoup(document, 'html.parser') if isinstance(document, str) else document
+    handlers = StructuredDataHandlers()
+    context = handlers.register(DOMVisitor()).visit(root, url)
+    handlers.finish(context)
+    return context.results
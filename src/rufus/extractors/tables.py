@@ -0,0 +1,344 @@
+# src/rufus/extractors/tables.py
+import math
+import re
+from array import array
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from bs4 import Tag
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Limits from the HTML specification
+MAX_COLSPAN = 1000
+MAX_ROWSPAN = 65534
+
+CURRENCY_SYMBOLS = {'$': 'USD', '€': 'EUR', '£': 'GBP', '¥': 'JPY', '₹': 'INR'}
+CURRENCY_CODES = frozenset(['USD', 'EUR', 'GBP', 'JPY', 'INR', 'CAD', 'AUD', 'CHF', 'CNY'])
+
+NUMBER = re.compile(r'^([+-])?\(?((?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?|\.\d+)\)?$')
+PERCENT = re.compile(r'^(.+?)\s*%$')
+CURRENCY = re.compile(
+    r'^([+-])?\s*(?:([$€£¥₹])|([A-Z]{3})\s)?\s*([\d.,()]+)\s*([A-Z]{3})?'
+    r'(?:\s*(?:/|per\s)\s*[a-z]+)?$'
+)
+ISO_DATE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})(?:[T ].*)?$')
+SLASH_DATE = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')
+DATE_FORMATS = ('%B %d, %Y', '%b %d, %Y', '%d %B %Y', '%d %b %Y', '%b. %d, %Y')
+
+EPOCH = date(1970, 1, 1)
+# Missing dates in ``array('q')`` columns, matching numpy's NaT
+NAT_DAYS = -2 ** 63
+
+class Cell:
+    """A grid position; spanning cells occupy several positions with one object."""
+    
+    __slots__ = ('text', 'header')
+    
+    def __init__(self, text: str, header: bool = False):
+        self.text = text
+        self.header = header
+
+EMPTY = Cell('')
+
+def own_rows(table: Tag) -> Iterator[Tag]:
+    """Yield the rows that belong to a table, skipping nested tables."""
+    for child in table.children:
+        if not isinstance(child, Tag):
+            continue
+        if child.name == 'tr':
+            yield child
+        elif child.name in ('thead', 'tbody', 'tfoot'):
+            yield from child.find_all('tr', recursive=False)
+
+def _span(value: Any, limit: int, default: int = 1) -> int:
+    try:
+        span = int(str(value).strip())
+    except (TypeError, ValueError):
+        return default
+    return min(span, limit) if span >= 0 else default
+
+class TableGrid:
+    """
+    Rectangular grid of a table's cells.
+    
+    ``colspan`` and ``rowspan`` are expanded so every row has one entry per
+    column. Rows in ``thead``, and leading rows made only of ``th`` cells,
+    are header rows; the rest are body rows. Nested tables are left out of
+    cell text and are extracted as tables of their own.
+    """
+    
+    def __init__(self, rows: List[List[Cell]], header_rows: int):
+        self.rows = rows
+        self.header_rows = header_rows
+        self.width = max((len(row) for row in rows), default=0)
+    
+    @classmethod
+    def from_element(cls, table: Tag, text: Callable[[Tag], str]) -> "TableGrid":
+        """
+        Build the grid of a table element.
+        
+        Args:
+            table: ``table`` element
+            text: Function returning the text of a ``td`` or ``th`` element
+        """
+        trs = list(own_rows(table))
+        rows: List[List[Cell]] = []
+        # Column -> [rows still covered, cell] for cells spanning down
+        pending: Dict[int, List] = {}
+        thead_rows = 0
+        
+        for index, tr in enumerate(trs):
+            if tr.parent is not None and tr.parent.name == 'thead' and thead_rows == index:
+                thead_rows += 1
+            
+            row: List[Cell] = []
+            
+            def fill_pending() -> None:
+                while len(row) in pending:
+                    column = len(row)
+                    remaining, cell = pending[column]
+                    row.append(cell)
+                    if remaining > 1:
+                        pending[column][0] -= 1
+                    else:
+                        del pending[column]
+            
+            for td in tr.find_all(['td', 'th'], recursive=False):
+                fill_pending()
+                cell = Cell(text(td), td.name == 'th')
+                colspan = max(1, _span(td.get('colspan'), MAX_COLSPAN))
+                rowspan = _span(td.get('rowspan'), MAX_ROWSPAN)
+                if rowspan == 0:
+                    # rowspan="0" spans the rest of the table
+                    rowspan = len(trs) - index
+                for _ in range(colspan):
+                    if rowspan > 1:
+                        pending[len(row)] = [rowspan - 1, cell]
+                    row.append(cell)
+            
+            fill_pending()
+            # Cells spanning down into columns past this row's own cells
+            for column in sorted(c for c in pending if c > len(row)):
+                row.extend([EMPTY] * (column - len(row)))
+                fill_pending()
+            rows.append(row)
+        
+        header_rows = thead_rows
+        if not header_rows:
+            while header_rows < len(rows) and all(cell.header for cell in rows[header_rows]):
+                header_rows += 1
+        # A table of nothing but header cells has no header
+        if header_rows == len(rows):
+            header_rows = 0 if not thead_rows else header_rows
+        
+        grid = cls(rows, header_rows)
+        for row in rows:
+            row.extend([EMPTY] * (grid.width - len(row)))
+        return grid
+    
+    @property
+    def headers(self) -> List[str]:
+        """Column labels; stacked header rows are joined with " / "."""
+        labels = []
+        for column in range(self.width if self.header_rows else 0):
+            parts: List[str] = []
+            for row in self.rows[:self.header_rows]:
+                text = row[column].text
+                if text and text not in parts:
+                    parts.append(text)
+            labels.append(" / ".join(parts))
+        return labels
+    
+    @property
+    def body(self) -> List[List[str]]:
+        """Cell texts of the body rows."""
+        return [[cell.text for cell in row] for row in self.rows[self.header_rows:]]
+    
+    def columns(self, threshold: float = 0.8) -> List["TableColumn"]:
+        """Typed columns of the body rows; see ``TableColumn.infer``."""
+        headers = self.headers
+        body = self.body
+        return [
+            TableColumn.infer(
+                headers[i] if i < len(headers) and headers[i] else f"column_{i + 1}",
+                [row[i] for row in body],
+                threshold
+            )
+            for i in range(self.width)
+        ]
+
+def _parse_number(text: str) -> Optional[str]:
+    match = NUMBER.match(text.replace(' ', '').replace('\u00a0', ''))
+    if not match:
+        return None
+    sign, digits = match.groups()
+    negative = sign == '-' or (text.strip().startswith('(') and text.strip().endswith(')'))
+    return ('-' if negative else '') + digits.replace(',', '')
+
+def _parse_percent(text: str) -> Optional[str]:
+    match = PERCENT.match(text)
+    return _parse_number(match.group(1)) if match else None
+
+def _parse_currency(text: str) -> Optional[Tuple[str, str]]:
+    match = CURRENCY.match(text.replace('\u00a0', ' ').strip())
+    if not match:
+        return None
+    sign, symbol, prefix_code, amount, suffix_code = match.groups()
+    code = CURRENCY_SYMBOLS.get(symbol) if symbol else prefix_code or suffix_code
+    if code not in CURRENCY_CODES:
+        return None
+    number = _parse_number(amount)
+    if number is None:
+        return None
+    if sign == '-' and not number.startswith('-'):
+        number = '-' + number
+    return number, code
+
+def _parse_date(text: str) -> Optional[str]:
+    match = ISO_DATE.match(text)
+    if match:
+        year, month, day = (int(part) for part in match.groups())
+    else:
+        match = SLASH_DATE.match(text)
+        if match:
+            first, second, year = (int(part) for part in match.groups())
+            # Month first unless that is impossible
+            month, day = (first, second) if first <= 12 else (second, first)
+        else:
+            for fmt in DATE_FORMATS:
+                try:
+                    parsed = datetime.strptime(text, fmt)
+                    break
+                except ValueError:
+                    continue
+            else:
+                return None
+            year, month, day = parsed.year, parsed.month, parsed.day
+    try:
+        return date(year, month, day).isoformat()
+    except ValueError:
+        return None
+
+class TableColumn:
+    """
+    A typed table column.
+    
+    ``values`` is a compact array: numpy ``int64``, ``float64`` or
+    ``datetime64[D]`` when numpy is installed, otherwise ``array('q')`` of
+    integers or of days since 1970-01-01 for dates, or ``array('d')``.
+    Missing or unparseable cells are NaN (NaT for dates); an integer column
+    with missing cells is stored as floats. Percentages are stored as
+    fractions and currency amounts in their stated unit, with the ISO code
+    in ``unit``. Columns that are not typed keep their strings.
+    """
+    
+    __slots__ = ('name', 'type', 'values', 'unit')
+    
+    def __init__(self, name: str, type: str, values: Any, unit: Optional[str] = None):
+        self.name = name
+        self.type = type
+        self.values = values
+        self.unit = unit
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    @classmethod
+    def infer(cls, name: str, texts: Sequence[str], threshold: float = 0.8) -> "TableColumn":
+        """
+        Infer a column's type and convert its values.
+        
+        The first of percent, currency, number and date that parses at
+        least ``threshold`` of the non-empty cells is used; otherwise the
+        column stays a string column.
+        """
+        present = [text for text in texts if text]
+        if not present:
+            return cls(name, 'string', list(texts))
+        needed = max(1, math.ceil(len(present) * threshold))
+        
+        for type_name, parser in (
+            ('percent', _parse_percent),
+            ('currency', _parse_currency),
+            ('number', _parse_number),
+            ('date', _parse_date)
+        ):
+            parsed = [parser(text) if text else None for text in texts]
+            if sum(value is not None for value in parsed) < needed:
+                continue
+            
+            unit = None
+            if type_name == 'currency':
+                units = {value[1] for value in parsed if value is not None}
+                if len(units) > 1:
+                    continue
+                unit = units.pop()
+                parsed = [value[0] if value is not None else None for value in parsed]
+            
+            if type_name == 'date':
+                return cls(name, 'date', _to_dates(parsed))
+            
+            values = _to_numbers(parsed)
+            if type_name == 'percent':
+                values = _scale(values, 0.01)
+                unit = '%'
+            elif type_name == 'number' and _is_integral(parsed):
+                try:
+                    values = _to_integers(parsed)
+                    type_name = 'integer'
+                except (OverflowError, ValueError):
+                    pass
+            return cls(name, type_name, values, unit)
+        
+        return cls(name, 'string', list(texts))
+    
+    def to_list(self) -> List[Any]:
+        """Plain Python values, with None for missing cells and ISO strings for dates."""
+        if self.type == 'string':
+            return list(self.values)
+        if self.type == 'date':
+            if np is not None:
+                return [None if np.isnat(value) else str(value) for value in self.values]
+            return [None if value == NAT_DAYS else date.fromordinal(EPOCH.toordinal() + value).isoformat()
+                    for value in self.values]
+        values = self.values.tolist()
+        return [None if isinstance(value, float) and value != value else value for value in values]
+    
+    def to_dict(self) -> Dict:
+        return {'name': self.name, 'type': self.type, 'unit': self.unit, 'values': self.to_list()}
+    
+    def __repr__(self) -> str:
+        return f"TableColumn({self.name!r}, {self.type!r}, {len(self)} values)"
+
+def _is_integral(parsed: Sequence[Optional[str]]) -> bool:
+    present = [value for value in parsed if value is not None]
+    return len(present) == len(parsed) and all('.' not in value for value in present)
+
+def _to_numbers(parsed: Sequence[Optional[str]]):
+    # Strings are converted to floats in one pass by numpy, or by array
+    strings = [value if value is not None else 'nan' for value in parsed]
+    if np is not None:
+        return np.array(strings).astype(np.float64)
+    return array('d', map(float, strings))
+
+def _to_integers(parsed: Sequence[str]):
+    if np is not None:
+        return np.array(parsed).astype(np.int64)
+    return array('q', map(int, parsed))
+
+def _scale(values, factor: float):
+    if np is not None:
+        return values * factor
+    return array('d', (value * factor for value in values))
+
+def _to_dates(parsed: Sequence[Optional[str]]):
+    if np is not None:
+        return np.array([value or 'NaT' for value in parsed], dtype='datetime64[D]')
+    epoch = EPOCH.toordinal()
+    return array('q', (
+        date.fromisoformat(value).toordinal() - epoch if value else NAT_DAYS
+        for value in parsed
+    ))
@@ -0,0 +1,177 @@
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from bs4 import BeautifulSoup, NavigableString, Tag
+from .item import ContentItem, Metadata
+
+HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+CONTAINER_TAGS = frozenset(['article', 'section', 'main', 'div'])
+
+class VisitContext:
+    """State carried through a single document walk."""
+    
+    def __init__(self, url: Optional[str] = None):
+        self.url = url
+        self.results: List[ContentItem] = []
+        self._headings: List[Tuple[int, str]] = []
+        self._path: Optional[Tuple[str, ...]] = ()
+    
+    @property
+    def heading_path(self) -> List[str]:
+        """Texts of the headings enclosing the current element."""
+        return [text for _, text in self._headings]
+    
+    def enter_heading(self, level: int) -> None:
+        """Close every open heading at the same or a deeper level."""
+        while self._headings and self._headings[-1][0] >= level:
+            self._headings.pop()
+            self._path = None
+    
+    def push_heading(self, level: int, text: str) -> None:
+        """Open a heading that encloses the elements that follow."""
+        if text:
+            self._headings.append((level, text))
+            self._path = None
+    
+    def emit(self, item: ContentItem) -> None:
+        """Append an extracted item, tagged with its source and heading context."""
+        if self._path is None:
+            self._path = tuple(text for _, text in self._headings)
+        
+        # Items under the same heading share one path tuple
+        if item.url is None:
+            item.url = self.url
+        if item.heading_path is None:
+            item.heading_path = self._path
+        self.results.append(item)
+
+Handler = Callable[[Tag, VisitContext], Optional[bool]]
+
+class DOMVisitor:
+    """
+    Walk a document once and dispatch each element to registered handlers.
+    
+    Handlers receive the element and the visit context and may return False
+    to keep the walk out of the element's subtree, which is how structures
+    such as paragraphs avoid being counted again through their descendants.
+    """
+    
+    def __init__(self):
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._any: List[Handler] = []
+    
+    def on(self, tags: Iterable[str], handler: Handler) -> "DOMVisitor":
+        """Register a handler for the given tag names."""
+        for tag in tags:
+            self._handlers.setdefault(tag, []).append(handler)
+        return self
+    
+    def on_any(self, handler: Handler) -> "DOMVisitor":
+        """Register a handler called for every element."""
+        self._any.append(handler)
+        return self
+    
+    def visit(
+        self,
+        root: Tag,
+        url: Optional[str] = None,
+        skip: Optional[Set[int]] = None
+    ) -> VisitContext:
+        """
+        Visit every element under root in document order.
+        
+        Args:
+            root: Document or element to walk
+            url: Source URL recorded on the context
+            skip: ids of elements whose subtrees are left out of the walk
+        
+        Returns:
+            Context holding the emitted items
+        """
+        context = VisitContext(url)
+        handlers = self._handlers
+        any_handlers = self._any
+        stack = [child for child in reversed(root.contents) if isinstance(child, Tag)]
+        
+        while stack:
+            element = stack.pop()
+            if skip and id(element) in skip:
+                continue
+            name = element.name
+            
+            is_heading = name in HEADING_TAGS
+            if is_heading:
+                level = int(name[1])
+                context.enter_heading(level)
+            
+            descend = True
+            for handler in handlers.get(name, ()):
+                if handler(element, context) is False:
+                    descend = False
+            for handler in any_handlers:
+                if handler(element, context) is False:
+                    descend = False
+            
+            if is_heading:
+                context.push_heading(level, " ".join(element.get_text().split()))
+            
+            if descend:
+                stack.extend(
+                    child for child in reversed(element.contents)
+                    if isinstance(child, Tag)
+                )
+        
+        return context
+    
+    def visit_html(self, html: str, url: Optional[str] = None) -> VisitContext:
+        """Parse HTML and visit the resulting document."""
+        return self.visit(BeautifulSoup(html, 'html.parser'), url)
+
+def text_block_handler(
+    clean: Callable[[str], str],
+    metadata: Callable[[Tag], Metadata],
+    item_type: Optional[str] = None,
+    extra: Optional[Dict] = None
+) -> Handler:
+    """
+    Build a handler that emits one text item per block element.
+    
+    Container elements such as ``article`` are only emitted when they hold
+    no paragraphs or headings of their own; otherwise the walk descends and
+    their text is picked up block by block instead of twice.
+    
+    Args:
+        clean: Text normalization function
+        metadata: Element metadata function
+        item_type: Item type, defaults to the tag name
+        extra: Additional keys copied into every item
+    """
+    def handle(element: Tag, context: VisitContext) -> Optional[bool]:
+        if element.name in CONTAINER_TAGS and element.find(['p', *HEADING_TAGS]):
+            return True
+        
+        text = clean(element.get_text())
+        if text:
+            context.emit(ContentItem(
+                item_type or element.name,
+                text,
+                metadata(element),
+                **(extra or {})
+            ))
+        return False
+    
+    return handle
+
+def text_excluding(element: Tag, excluded: Iterable[str]) -> str:
+    """Collect an element's text, skipping the subtrees of excluded tags."""
+    excluded = frozenset(excluded)
+    parts = []
+    stack = list(reversed(element.contents))
+    
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Tag):
+            if node.name not in excluded:
+                stack.extend(reversed(node.contents))
+        elif type(node) is NavigableString:
+            parts.append(str(node))
+    
+    return "".join(parts)
@@ -1,5 +1,22 @@
 # src/rufus/processors/__init__.py
+from .boilerplate import BlockFrequencyIndex
+from .chunker import Chunker
 from .cleaner import ContentCleaner
+from .columnar import ArrowSink, read_columnar
+from .sinks import CSVSink, JSONLinesSink, MarkdownSink, OutputSink, TextSink, open_sink
 from .synthesizer import ContentSynthesizer
 
-__all__ = ['ContentCleaner', 'ContentSynthesizer']
\ No newline at end of file
+__all__ = [
+    'ArrowSink',
+    'BlockFrequencyIndex',
+    'CSVSink',
+    'Chunker',
+    'ContentCleaner',
+    'ContentSynthesizer',
+    'JSONLinesSink',
+    'MarkdownSink',
+    'OutputSink',
+    'TextSink',
+    'open_sink',
+    'read_columnar'
+]
\ No newline at end of file
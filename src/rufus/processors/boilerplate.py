@@ -0,0 +1,159 @@
+# src/rufus/processors/boilerplate.py
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+from ..extractors.item import ContentItem, item_text
+from ..utils.hashing import block_hash
+
+MODES = ('suppress', 'reference')
+
+class BlockFrequencyIndex:
+    """
+    Crawl-scoped index of repeated text blocks.
+    
+    Every page's text blocks are hashed and counted once per page. A block
+    that appears on more than ``boilerplate_threshold`` of the pages seen so
+    far is boilerplate: its first occurrence is kept and later ones are
+    dropped (``suppress``) or replaced by a small ``boilerplate_ref`` item
+    pointing at the block id (``reference``).
+    
+    In streaming mode the first ``boilerplate_warmup`` pages are held back
+    until enough pages have been counted to tell templates from content.
+    """
+    
+    def __init__(self, config: Optional[Dict] = None):
+        config = config or {}
+        self.threshold = config.get('boilerplate_threshold', 0.5)
+        self.min_pages = config.get('boilerplate_min_pages', 3)
+        self.warmup = config.get('boilerplate_warmup', 5)
+        self.mode = config.get('boilerplate_mode', 'suppress')
+        
+        if self.mode not in MODES:
+            raise ValueError(f"Unsupported boilerplate mode: {self.mode}")
+        
+        self.reset()
+    
+    def reset(self) -> None:
+        """Forget all counts, e.g. at the start of a new crawl."""
+        self.counts: Dict[int, int] = {}
+        self.pages = 0
+        self.suppressed = 0
+        self._emitted: Set[int] = set()
+        self._pending: Optional[List[Tuple[List[ContentItem], List]]] = (
+            [] if self.warmup > 0 else None
+        )
+    
+    @staticmethod
+    def _hash(item: Mapping[str, Any]) -> Optional[int]:
+        text = item_text(item)
+        return block_hash(text) if text.strip() else None
+    
+    def observe(self, page: List[ContentItem]) -> List[Optional[int]]:
+        """
+        Count the distinct blocks of one page.
+        
+        Returns:
+            Block hash of every item, None for items without text
+        """
+        keys = [self._hash(item) for item in page]
+        counts = self.counts
+        for key in set(keys):
+            if key is not None:
+                counts[key] = counts.get(key, 0) + 1
+        self.pages += 1
+        return keys
+    
+    def is_boilerplate(self, key: int) -> bool:
+        """Check whether a block repeats on more than the threshold share of pages."""
+        return (
+            self.pages >= self.min_pages and
+            self.counts.get(key, 0) > self.threshold * self.pages
+        )
+    
+    def _filter_page(self, page: List[ContentItem], keys: List[Optional[int]]) -> List[ContentItem]:
+        """Drop or reference repeated occurrences of boilerplate blocks."""
+        kept = []
+        for item, key in zip(page, keys):
+            if key is None or not self.is_boilerplate(key):
+                kept.append(item)
+                continue
+            
+            block_id = f"{key:016x}"
+            if key not in self._emitted:
+                self._emitted.add(key)
+                if self.mode == 'reference':
+                    item['block'] = block_id
+                kept.append(item)
+                continue
+            
+            self.suppressed += 1
+            if self.mode == 'reference':
+                kept.append(ContentItem(
+                    'boilerplate_ref',
+                    url=item.get('url'),
+                    heading_path=item.get('heading_path'),
+                    depth=item.get('depth'),
+                    block=block_id
+                ))
+        
+        return kept
+    
+    def push(self, page: List[ContentItem]) -> List[ContentItem]:
+        """
+        Count a page and return the items that are ready to be emitted.
+        
+        During warm-up nothing is returned; once the warm-up window is full
+        all held pages are released together, filtered with the counts
+        gathered so far.
+        """
+        keys = self.observe(page)
+        
+        if self._pending is None:
+            return self._filter_page(page, keys)
+        
+        self._pending.append((page, keys))
+        if len(self._pending) < self.warmup:
+            return []
+        return self.flush()
+    
+    def flush(self) -> List[ContentItem]:
+        """Release pages still held in the warm-up window."""
+        pending, self._pending = self._pending or [], None
+        return [item for page, keys in pending for item in self._filter_page(page, keys)]
+    
+    def stream(self, items: Iterable[ContentItem]) -> Iterator[ContentItem]:
+        """
+        Filter a stream of items in crawl order.
+        
+        Consecutive items with the same ``url`` are treated as one page.
+        """
+        page: List[ContentItem] = []
+        url = None
+        for item in items:
+            if page and item.get('url') != url:
+                yield from self.push(page)
+                page = []
+            url = item.get('url')
+            page.append(item)
+        
+        if page:
+            yield from self.push(page)
+        yield from self.flush()
+    
+    def filter(self, items: Iterable[ContentItem]) -> List[ContentItem]:
+        """Filter a complete crawl, counting every page before filtering any."""
+        pages: Dict[Optional[str], List[ContentItem]] = {}
+        for item in items:
+            pages.setdefault(item.get('url'), []).append(item)
+        
+        observed = [(page, self.observe(page)) for page in pages.values()]
+        self._pending = None
+        
+        return [item for page, keys in observed for item in self._filter_page(page, keys)]
+    
+    def stats(self) -> Dict:
+        """Summarize the index."""
+        return {
+            'pages': self.pages,
+            'blocks': len(self.counts),
+            'boilerplate_blocks': sum(1 for key in self.counts if self.is_boilerplate(key)),
+            'suppressed': self.suppressed
+        }
@@ -0,0 +1,217 @@
+# src/rufus/processors/chunker.py
+import math
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+from ..extractors.item import ContentItem, item_text
+
+TokenCounter = Callable[[str], int]
+
+WORD_PATTERN = re.compile(r'\S+')
+HEADING_TYPES = frozenset(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+def estimate_tokens(text: str, chars_per_token: float = 4.0) -> int:
+    """Estimate a token count from the text length."""
+    return math.ceil(len(text) / chars_per_token) if text else 0
+
+def cached_counter(counter: TokenCounter, maxsize: int = 65536) -> TokenCounter:
+    """Wrap a token counter in an LRU cache keyed by text."""
+    return lru_cache(maxsize=maxsize)(counter)
+
+def tiktoken_counter(encoding: str = "cl100k_base") -> TokenCounter:
+    """
+    Build a cached counter backed by a tiktoken encoding.
+    
+    Raises:
+        ImportError: If tiktoken is not installed
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        raise ImportError(
+            "tiktoken_counter requires tiktoken. Install it with "
+            "`pip install tiktoken` or use the default estimate."
+        )
+    
+    encoder = tiktoken.get_encoding(encoding)
+    return cached_counter(lambda text: len(encoder.encode(text)))
+
+class _Piece:
+    """A unit of chunk text: a whole item, or a window of a long item."""
+    
+    __slots__ = ('text', 'tokens', 'start', 'end', 'path', 'unit')
+    
+    def __init__(
+        self,
+        text: str,
+        tokens: int,
+        start: int,
+        end: int,
+        path: Tuple[str, ...],
+        unit: int
+    ):
+        self.text = text
+        self.tokens = tokens
+        self.start = start
+        self.end = end
+        self.path = path
+        self.unit = unit
+
+class Chunker:
+    """
+    Split crawl output into retrieval-sized chunks.
+    
+    Items are consumed as a stream in page order and each chunk is emitted as
+    soon as it is full, so chunking is linear in the size of the crawl and only
+    one chunk is held in memory. Chunks never span pages or major sections
+    and carry the heading path, source url and character offsets of the text
+    they cover; offsets refer to the page's item texts joined by blank lines.
+    """
+    
+    def __init__(
+        self,
+        config: Optional[Dict] = None,
+        token_counter: Optional[TokenCounter] = None
+    ):
+        config = config or {}
+        self.chunk_size = config.get('chunk_size', 512)
+        self.overlap = config.get('chunk_overlap', 64)
+        self.section_level = config.get('chunk_section_level', 2)
+        
+        if self.overlap >= self.chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        
+        # Estimates are cheap; only tokenizer-backed counters are worth caching
+        self.count_tokens = token_counter or estimate_tokens
+    
+    def chunk(self, items: Iterable[Mapping[str, Any]]) -> Iterator[ContentItem]:
+        """
+        Chunk content items.
+        
+        Args:
+            items: Content items in crawl order
+        
+        Yields:
+            ``chunk`` items with ``tokens``, ``start``, ``end`` and a
+            per-page ``chunk_index``
+        """
+        url = None
+        offset = 0
+        index = 0
+        current: List[_Piece] = []
+        tokens = 0
+        
+        for unit, item in enumerate(items):
+            text = item_text(item)
+            if not text:
+                continue
+            
+            item_url = item.get('url')
+            path = tuple(item.get('heading_path') or ())
+            item_type = item.get('type', '')
+            is_heading = item_type in HEADING_TYPES
+            if is_heading:
+                path = path + (text,)
+            
+            if item_url != url:
+                if current:
+                    yield self._emit(current, url, index)
+                current, tokens, offset, index, url = [], 0, 0, 0, item_url
+            elif is_heading and int(item_type[1]) <= self.section_level and current:
+                yield self._emit(current, url, index)
+                index += 1
+                current, tokens = [], 0
+            
+            for piece in self._pieces(text, offset, path, unit):
+                if current and tokens + piece.tokens > self.chunk_size:
+                    yield self._emit(current, url, index)
+                    index += 1
+                    current = self._overlap(current, self.chunk_size - piece.tokens)
+                    tokens = sum(p.tokens for p in current)
+                current.append(piece)
+                tokens += piece.tokens
+            
+            offset += len(text) + 2
+        
+        if current:
+            yield self._emit(current, url, index)
+    
+    def _pieces(
+        self,
+        text: str,
+        offset: int,
+        path: Tuple[str, ...],
+        unit: int
+    ) -> Iterator[_Piece]:
+        """
+        Yield an item as one piece, or as overlapping word windows if it
+        exceeds the chunk size on its own.
+        """
+        tokens = self.count_tokens(text)
+        if tokens <= self.chunk_size:
+            yield _Piece(text, tokens, offset, offset + len(text), path, unit)
+            return
+        
+        window: Deque[Tuple[int, int, int]] = deque()
+        window_tokens = 0
+        for match in WORD_PATTERN.finditer(text):
+            word_tokens = self.count_tokens(match.group())
+            if window and window_tokens + word_tokens > self.chunk_size:
+                yield self._window(text, window, window_tokens, offset, path, unit)
+                
+                # Keep the tail of the window as the overlap of the next one
+                keep = kept = 0
+                for _, _, kept_tokens in reversed(window):
+                    if kept + kept_tokens > self.overlap:
+                        break
+                    kept += kept_tokens
+                    keep += 1
+                while len(window) > keep:
+                    window_tokens -= window.popleft()[2]
+            window.append((match.start(), match.end(), word_tokens))
+            window_tokens += word_tokens
+        
+        if window:
+            yield self._window(text, window, window_tokens, offset, path, unit)
+    
+    @staticmethod
+    def _window(
+        text: str,
+        window: Deque[Tuple[int, int, int]],
+        tokens: int,
+        offset: int,
+        path: Tuple[str, ...],
+        unit: int
+    ) -> _Piece:
+        start, end = window[0][0], window[-1][1]
+        return _Piece(text[start:end], tokens, offset + start, offset + end, path, unit)
+    
+    def _overlap(self, pieces: List[_Piece], room: int) -> List[_Piece]:
+        """Return the trailing pieces carried into the next chunk."""
+        budget = min(self.overlap, room)
+        carried: Deque[_Piece] = deque()
+        used = 0
+        for piece in reversed(pieces):
+            if used + piece.tokens > budget:
+                break
+            carried.appendleft(piece)
+            used += piece.tokens
+        return list(carried)
+    
+    def _emit(self, pieces: List[_Piece], url: Optional[str], index: int) -> ContentItem:
+        parts = [pieces[0].text]
+        for previous, piece in zip(pieces, pieces[1:]):
+            parts.append(" " if piece.unit == previous.unit else "\n\n")
+            parts.append(piece.text)
+        
+        return ContentItem(
+            "chunk",
+            "".join(parts),
+            url=url,
+            heading_path=pieces[0].path,
+            tokens=sum(piece.tokens for piece in pieces),
+            start=pieces[0].start,
+            end=pieces[-1].end,
+            chunk_index=index
+        )
@@ -1,77 +1,132 @@
 # src/rufus/processors/cleaner.py
 import re
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List
 from bs4 import BeautifulSoup
 from loguru import logger
 
+# Only text that may contain a tag or character reference is parsed as HTML
+MARKUP_PATTERN = re.compile(r'<[A-Za-z/!?]|&(?:[A-Za-z]|#[0-9xX])')
+
+# Characters removed from cleaned text, and characters counted as special
+# when validating it. ASCII text is handled by translate tables built from
+# the same classes, non-ASCII text falls back to the regexes.
+STRIP_PATTERN = re.compile(r'[^\w\s\-.,?!]')
+SPECIAL_PATTERN = re.compile(r'[^\w\s]')
+STRIP_TABLE = str.maketrans(
+    {chr(i): None for i in range(128) if STRIP_PATTERN.match(chr(i))}
+)
+SPECIAL_TABLE = str.maketrans(
+    {chr(i): None for i in range(128) if SPECIAL_PATTERN.match(chr(i))}
+)
+
+def clean_text(text: str) -> str:
+    """
+    Strip markup, drop special characters and normalize whitespace.
+    
+    Plain text, which is nearly all text taken from a parsed page, skips
+    HTML parsing entirely; a parse only happens when a tag or character
+    reference may be present.
+    """
+    if ('<' in text or '&' in text) and MARKUP_PATTERN.search(text):
+        text = BeautifulSoup(text, "html.parser").get_text()
+    
+    if text.isascii():
+        text = text.translate(STRIP_TABLE)
+    else:
+        text = STRIP_PATTERN.sub('', text)
+    
+    return " ".join(text.split())
+
+def clean_texts(texts: List[str]) -> List[str]:
+    """Clean a batch of strings."""
+    return [clean_text(text) for text in texts]
+
+def special_ratio(text: str) -> float:
+    """Return the share of characters that are neither word nor whitespace."""
+    if not text:
+        return 0.0
+    if text.isascii():
+        special = len(text) - len(text.translate(SPECIAL_TABLE))
+    else:
+        special = SPECIAL_PATTERN.subn('', text)[1]
+    return special / len(text)
+
 class ContentCleaner:
     """Clean and normalize extracted content."""
     
     def __init__(self, config: Dict = None):
         self.config = config or {}
+        self.workers = self.config.get('clean_workers', 1)
+        self.parallel_threshold = self.config.get('clean_parallel_threshold', 20000)
     
     def clean(self, content: List[Dict]) -> List[Dict]:
-        """Clean and normalize content."""
+        """
+        Clean and normalize a batch of content items.
+        
+        All strings in the batch are cleaned together, across a process pool
+        when ``clean_workers`` is above one and the batch holds at least
+        ``clean_parallel_threshold`` strings. Invalid items are dropped.
+        """
         try:
-            cleaned = []
+            cleaned = iter(self._clean_strings(list(self._strings(content))))
+            
             for item in content:
-                cleaned_item = self._clean_item(item)
-                if cleaned_item:
-                    cleaned.append(cleaned_item)
-            return cleaned
+                if isinstance(item.get("content"), str):
+                    item["content"] = next(cleaned)
+                
+                if item.get("type") == "table":
+                    item["headers"] = [next(cleaned) for _ in item.get("headers", [])]
+                    item["rows"] = [
+                        [next(cleaned) for _ in row]
+                        for row in item.get("rows", [])
+                    ]
+            
+            return [item for item in content if self._is_valid_content(item)]
+        
         except Exception as e:
             logger.error(f"Content cleaning failed: {str(e)}")
             return content
     
+    def _strings(self, content: List[Dict]) -> Iterator[str]:
+        """Yield every string to clean, in the order ``clean`` assigns them back."""
+        for item in content:
+            if isinstance(item.get("content"), str):
+                yield item["content"]
+            
+            if item.get("type") == "table":
+                yield from item.get("headers", [])
+                for row in item.get("rows", []):
+                    yield from row
+    
+    def _clean_strings(self, texts: List[str]) -> List[str]:
+        """Clean strings in process, or across a worker pool for large batches."""
+        if self.workers <= 1 or len(texts) < self.parallel_threshold:
+            return clean_texts(texts)
+        
+        size = -(-len(texts) // (self.workers * 4))
+        chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return [text for chunk in pool.map(clean_texts, chunks) for text in chunk]
+    
     def _clean_item(self, item: Dict) -> Dict:
         """Clean individual content item."""
-        try:
-            if "content" in item:
-                item["content"] = self._clean_text(item["content"])
-            
-            if "type" in item and item["type"] == "table":
-                item["headers"] = [
-                    self._clean_text(h) for h in item.get("headers", [])
-                ]
-                item["rows"] = [
-                    [self._clean_text(cell) for cell in row]
-                    for row in item.get("rows", [])
-                ]
-            
-            return item if self._is_valid_content(item) else None
-            
-        except Exception as e:
-            logger.error(f"Item cleaning failed: {str(e)}")
-            return None
+        cleaned = self.clean([item])
+        return cleaned[0] if cleaned else None
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
-        try:
-            # Remove HTML tags
-            text = BeautifulSoup(text, "html.parser").get_text()
-            
-            # Normalize whitespace
-            text = re.sub(r'\s+', ' ', text)
-            
-            # Remove special characters
-            text = re.sub(r'[^\w\s\-.,?!]', '', text)
-            
-            return text.strip()
-            
-        except Exception as e:
-            logger.error(f"Text cleaning failed: {str(e)}")
-            return text
+        return clean_text(text)
     
     def _is_valid_content(self, item: Dict) -> bool:
         """Check if cleaned content is valid."""
         if not item:
             return False
-            
-        content = item.get("content", "")
+        
+        # Structured items such as tables carry no text content of their own
+        content = item.get("content")
         if isinstance(content, str):
             # Check minimum content length and maximum ratio of special characters
-            return (
-                len(content) >= 3 and
-                len(re.findall(r'[^\w\s]', content)) / len(content) < 0.3
-            )
-        return True
\ No newline at end of file
+            return len(content) >= 3 and special_ratio(content) < 0.3
+        return True
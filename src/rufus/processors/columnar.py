@@ -0,0 +1,192 @@
+# src/rufus/processors/columnar.py
+import os
+from typing import Any, Dict, List, Mapping, Optional, Union
+from ..extractors.item import ContentItem, ElementMeta, item_text
+from ..utils.hashing import block_hash
+from .sinks import OutputSink
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+FORMATS = ('parquet', 'feather')
+
+# Columns with few distinct values are dictionary encoded
+DICTIONARY_COLUMNS = ('url', 'type', 'tag')
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "Columnar output requires pyarrow. Install it with "
+            "`pip install pyarrow` or use the jsonl/csv/markdown formats."
+        )
+
+def content_schema() -> "pa.Schema":
+    """Arrow schema of exported content items."""
+    _require_pyarrow()
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ('url', category),
+        ('depth', pa.int16()),
+        ('type', category),
+        ('tag', category),
+        ('heading_path', pa.list_(pa.string())),
+        ('text', pa.string()),
+        ('content_hash', pa.uint64())
+    ])
+
+def _item_tag(item: Mapping[str, Any]) -> Optional[str]:
+    """Read an item's tag without materializing its metadata dict."""
+    if isinstance(item, ContentItem):
+        meta = item.meta
+        if isinstance(meta, ElementMeta):
+            return meta.tag
+    metadata = item.get('metadata')
+    return metadata.get('tag') if isinstance(metadata, dict) else None
+
+class _DictionaryEncoder:
+    """
+    Dictionary shared by every batch of one Feather column.
+    
+    New values are appended, so each batch's dictionary extends the last one
+    and the IPC writer only has to emit the new entries as a delta. Parquet
+    stores a dictionary per row group, so Parquet batches are encoded on
+    their own instead.
+    """
+    
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        self._values: List[str] = []
+    
+    def encode(self, values: List[Optional[str]]) -> "pa.DictionaryArray":
+        index = self._index
+        indices = []
+        for value in values:
+            if value is None:
+                indices.append(None)
+                continue
+            code = index.get(value)
+            if code is None:
+                code = index[value] = len(self._values)
+                self._values.append(value)
+            indices.append(code)
+        
+        return pa.DictionaryArray.from_arrays(
+            pa.array(indices, type=pa.int32()),
+            pa.array(self._values, type=pa.string())
+        )
+
+def _encode_batch(values: List[Optional[str]]) -> "pa.DictionaryArray":
+    """Dictionary encode one batch with only the values it contains."""
+    return pa.array(values, type=pa.string()).dictionary_encode()
+
+class ArrowSink(OutputSink):
+    """
+    Write content items as Arrow record batches to Parquet or Feather.
+    
+    Items are buffered column by column and written as a record batch every
+    ``batch_size`` rows, so a crawl is exported incrementally in bounded
+    memory. ``url``, ``type`` and ``tag`` are dictionary encoded. Feather
+    files are uncompressed Arrow IPC files that ``read_columnar`` can
+    memory-map.
+    """
+    
+    def __init__(
+        self,
+        target: Union[str, os.PathLike],
+        format: str = 'parquet',
+        batch_size: int = 10000,
+        compression: Optional[str] = None
+    ):
+        _require_pyarrow()
+        if format not in FORMATS:
+            raise ValueError(f"Unsupported columnar format: {format}")
+        
+        super().__init__()
+        self.format = format
+        self.batch_size = batch_size
+        self.schema = content_schema()
+        # Parquet writes each batch's dictionary into its row group, so a
+        # cumulative dictionary would grow the file quadratically
+        self._encoders = (
+            {name: _DictionaryEncoder() for name in DICTIONARY_COLUMNS}
+            if format == 'feather' else {}
+        )
+        self._columns: Dict[str, List] = {name: [] for name in self.schema.names}
+        
+        if format == 'parquet':
+            self._writer = pq.ParquetWriter(
+                target,
+                self.schema,
+                compression=compression or 'snappy'
+            )
+        else:
+            self._file = pa.OSFile(os.fspath(target), 'wb')
+            self._writer = ipc.new_file(
+                self._file,
+                self.schema,
+                options=ipc.IpcWriteOptions(
+                    compression=compression,
+                    emit_dictionary_deltas=True
+                )
+            )
+    
+    def _write_item(self, item: Mapping[str, Any]) -> None:
+        columns = self._columns
+        text = item_text(item)
+        heading_path = item.get('heading_path')
+        
+        columns['url'].append(item.get('url'))
+        columns['depth'].append(item.get('depth'))
+        columns['type'].append(item.get('type'))
+        columns['tag'].append(_item_tag(item))
+        columns['heading_path'].append(
+            list(heading_path) if heading_path is not None else None
+        )
+        columns['text'].append(text)
+        columns['content_hash'].append(block_hash(text) if text else None)
+        
+        if len(columns['text']) >= self.batch_size:
+            self.flush()
+    
+    def _encode(self, name: str, values: List) -> "pa.Array":
+        if name in self._encoders:
+            return self._encoders[name].encode(values)
+        if name in DICTIONARY_COLUMNS:
+            return _encode_batch(values)
+        return pa.array(values, type=self.schema.field(name).type)
+    
+    def flush(self) -> None:
+        """Write buffered rows as one record batch."""
+        columns = self._columns
+        if not columns['text']:
+            return
+        
+        arrays = [self._encode(name, columns[name]) for name in self.schema.names]
+        self._writer.write_batch(pa.record_batch(arrays, schema=self.schema))
+        
+        for values in columns.values():
+            values.clear()
+    
+    def _close_target(self) -> None:
+        self._writer.close()
+        if self.format == 'feather':
+            self._file.close()
+
+def read_columnar(path: Union[str, os.PathLike]) -> "pa.Table":
+    """
+    Load an exported Parquet or Feather file.
+    
+    The format is detected from the file's magic bytes. Feather files are
+    memory-mapped, so their columns are not copied into memory.
+    """
+    _require_pyarrow()
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+    
+    if magic == b'PAR1':
+        return pq.read_table(path, memory_map=True)
+    return ipc.open_file(pa.memory_map(os.fspath(path), 'r')).read_all()
@@ -0,0 +1,268 @@
+# src/rufus/processors/sinks.py
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, IO, Iterable, List, Mapping, Optional, Sequence, Union
+from ..utils.serialization import json_default
+
+Target = Union[str, os.PathLike, IO[str]]
+
+class OutputSink(ABC):
+    """
+    Incremental writer for extracted content items.
+    
+    Items are handed over one at a time or a page at a time and written
+    as they arrive, so an export never needs the whole crawl in memory.
+    """
+    
+    def __init__(self):
+        self.items_written = 0
+        self.closed = False
+        self._started = False
+    
+    def _start(self) -> None:
+        """Write any header before the first item."""
+        pass
+    
+    def _finish(self) -> None:
+        """Write any footer before closing."""
+        pass
+    
+    @abstractmethod
+    def _write_item(self, item: Mapping[str, Any]) -> None:
+        """Format a single item into the buffer."""
+        pass
+    
+    def flush(self) -> None:
+        """Write buffered output to the target."""
+        pass
+    
+    def _close_target(self) -> None:
+        """Release the underlying file or stream."""
+        pass
+    
+    def write(self, item: Mapping[str, Any]) -> None:
+        """Write a single content item."""
+        if not self._started:
+            self._started = True
+            self._start()
+        self._write_item(item)
+        self.items_written += 1
+    
+    def write_many(self, items: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Write items from any iterable, including generators.
+        
+        Returns:
+            Number of items written
+        """
+        count = 0
+        for item in items:
+            self.write(item)
+            count += 1
+        return count
+    
+    def close(self) -> None:
+        """Finish the output and close the target if the sink opened it."""
+        if self.closed:
+            return
+        
+        try:
+            if not self._started:
+                self._started = True
+                self._start()
+            self._finish()
+            self.flush()
+        finally:
+            self.closed = True
+            self._close_target()
+    
+    def __enter__(self) -> "OutputSink":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+class TextSink(OutputSink):
+    """
+    Sink for text formats, written through a bounded buffer.
+    
+    At most ``buffer_size`` characters of output are held before they are
+    written out. Text sinks accept a path, which they open and close, or any
+    text stream such as an open file or a response body.
+    """
+    
+    def __init__(self, target: Target, buffer_size: int = 64 * 1024):
+        super().__init__()
+        if isinstance(target, (str, os.PathLike)):
+            self._stream = open(target, 'w', encoding='utf-8', newline='')
+            self._owns_stream = True
+        else:
+            self._stream = target
+            self._owns_stream = False
+        
+        self.buffer_size = buffer_size
+        self._buffer: List[str] = []
+        self._buffered = 0
+    
+    def _emit(self, text: str) -> None:
+        """Queue formatted output, flushing once the buffer is full."""
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write buffered output to the target."""
+        if self._buffer:
+            self._stream.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+        if hasattr(self._stream, 'flush'):
+            self._stream.flush()
+    
+    def _close_target(self) -> None:
+        if self._owns_stream:
+            self._stream.close()
+
+class _BufferWriter:
+    """File-like adapter that lets ``csv.writer`` write into a sink's buffer."""
+    
+    __slots__ = ('write',)
+    
+    def __init__(self, write):
+        self.write = write
+
+class JSONLinesSink(TextSink):
+    """Write one JSON object per item."""
+    
+    def _write_item(self, item: Mapping[str, Any]) -> None:
+        self._emit(json.dumps(item, ensure_ascii=False, default=json_default))
+        self._emit("\n")
+
+class CSVSink(TextSink):
+    """
+    Write items as RFC 4180 CSV.
+    
+    Fields are quoted when needed and records end in CRLF. Lists such as the
+    heading path are joined with `` > ``; other non-string values are JSON
+    encoded. Tables and lists are written as one ``table_row`` record per row
+    or one ``list_item`` record per entry.
+    """
+    
+    DEFAULT_FIELDS = ('type', 'content', 'url', 'heading_path')
+    
+    def __init__(
+        self,
+        target: Target,
+        fields: Sequence[str] = DEFAULT_FIELDS,
+        buffer_size: int = 64 * 1024
+    ):
+        super().__init__(target, buffer_size)
+        self.fields = tuple(fields)
+        self._writer = csv.writer(_BufferWriter(self._emit), lineterminator='\r\n')
+    
+    def _start(self) -> None:
+        self._writer.writerow(self.fields)
+    
+    def _value(self, value) -> str:
+        if value is None:
+            return ''
+        if isinstance(value, str):
+            return value
+        if isinstance(value, (list, tuple)) and all(isinstance(v, str) for v in value):
+            return ' > '.join(value)
+        return json.dumps(value, ensure_ascii=False, default=json_default)
+    
+    def _write_record(self, item: Mapping[str, Any], **overrides) -> None:
+        self._writer.writerow([
+            self._value(overrides[f] if f in overrides else item.get(f))
+            for f in self.fields
+        ])
+    
+    def _write_item(self, item: Mapping[str, Any]) -> None:
+        if 'content' not in item:
+            if item.get('type') == 'table':
+                for row in item.get('rows', []):
+                    self._write_record(
+                        item,
+                        type='table_row',
+                        content=json.dumps(row, ensure_ascii=False)
+                    )
+                return
+            if item.get('type') == 'list':
+                for entry in item.get('items', []):
+                    self._write_record(item, type='list_item', content=entry)
+                return
+        
+        self._write_record(item)
+
+class MarkdownSink(TextSink):
+    """Write items as Markdown, with a source comment whenever the page changes."""
+    
+    def __init__(self, target: Target, buffer_size: int = 64 * 1024):
+        super().__init__(target, buffer_size)
+        self._url: Optional[str] = None
+    
+    @staticmethod
+    def _cell(text) -> str:
+        return str(text).replace('|', '\\|').replace('\n', ' ')
+    
+    def _write_item(self, item: Mapping[str, Any]) -> None:
+        url = item.get('url')
+        if url and url != self._url:
+            self._url = url
+            self._emit(f"<!-- source: {url} -->\n\n")
+        
+        item_type = item.get('type', '')
+        if item_type == 'table':
+            self._write_table(item)
+        elif item_type == 'list':
+            marker = '1.' if item.get('list_type') == 'ol' else '-'
+            for entry in item.get('items', []):
+                self._emit(f"{marker} {entry}\n")
+            self._emit("\n")
+        elif len(item_type) == 2 and item_type[0] == 'h' and item_type[1].isdigit():
+            self._emit(f"{'#' * int(item_type[1])} {item.get('content', '')}\n\n")
+        elif item.get('content'):
+            self._emit(f"{item['content']}\n\n")
+    
+    def _write_table(self, item: Mapping[str, Any]) -> None:
+        headers = item.get('headers') or []
+        rows = item.get('rows') or []
+        width = max([len(headers)] + [len(row) for row in rows]) if (headers or rows) else 0
+        if not width:
+            return
+        
+        headers = list(headers) + [''] * (width - len(headers))
+        self._emit("| " + " | ".join(self._cell(h) for h in headers) + " |\n")
+        self._emit("|" + " --- |" * width + "\n")
+        for row in rows:
+            cells = list(row) + [''] * (width - len(row))
+            self._emit("| " + " | ".join(self._cell(c) for c in cells) + " |\n")
+        self._emit("\n")
+
+SINKS = {
+    'jsonl': JSONLinesSink,
+    'csv': CSVSink,
+    'markdown': MarkdownSink
+}
+
+def open_sink(format: str, target: Target, **options) -> OutputSink:
+    """
+    Create a sink for an output format.
+    
+    Args:
+        format: One of ``jsonl``, ``csv``, ``markdown``, ``parquet`` or ``feather``
+        target: Path or stream to write to
+        options: Sink-specific options such as ``buffer_size``
+    """
+    if format in ('parquet', 'feather'):
+        # Columnar sinks need pyarrow, which is optional
+        from .columnar import ArrowSink
+        return ArrowSink(target, format=format, **options)
+    
+    if format not in SINKS:
+        raise ValueError(f"Unsupported format: {format}")
+    return SINKS[format](target, **options)
@@ -1,7 +1,16 @@
 # src/rufus/processors/synthesizer.py
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
 import json
 from loguru import logger
+from .sinks import Target, open_sink
+
+# Extracted item types and the group each is processed in
+TYPE_GROUPS = {
+    'title': 'text', 'text': 'text', 'p': 'text',
+    'h1': 'text', 'h2': 'text', 'h3': 'text', 'h4': 'text', 'h5': 'text', 'h6': 'text',
+    'table': 'tables', 'list': 'lists', 'form': 'forms'
+}
 
 class ContentSynthesizer:
     """Synthesize extracted content into structured documents."""
@@ -28,11 +37,36 @@ class ContentSynthesizer:
                 return self._format_markdown(processed)
             else:
                 raise ValueError(f"Unsupported format: {format}")
-                
+        
         except Exception as e:
             logger.error(f"Content synthesis failed: {str(e)}")
             return {"error": str(e), "raw_content": content}
     
+    def export(
+        self,
+        content: Iterable[Dict],
+        target: Target,
+        format: str = "jsonl",
+        **options
+    ) -> int:
+        """
+        Stream content items to a file or text stream.
+        
+        Unlike ``synthesize``, items are written as they are consumed, so a
+        generator over a large crawl is exported in constant memory.
+        
+        Args:
+            content: Content items, in output order
+            target: Path or text stream
+            format: jsonl, csv, markdown, parquet or feather
+            options: Sink options such as ``buffer_size`` or CSV ``fields``
+        
+        Returns:
+            Number of items written
+        """
+        with open_sink(format, target, **options) as sink:
+            return sink.write_many(content)
+    
     def _group_content(self, content: List[Dict]) -> Dict:
         """Group content by type and structure."""
         groups = {
@@ -45,10 +79,8 @@ class ContentSynthesizer:
         
         for item in content:
             content_type = item.get("type", "other")
-            if content_type in groups:
-                groups[content_type].append(item)
-            else:
-                groups["other"].append(item)
+            group = TYPE_GROUPS.get(content_type, content_type)
+            groups[group if group in groups else "other"].append(item)
         
         return groups
     
@@ -101,6 +133,41 @@ class ContentSynthesizer:
             "full_text": "\n\n".join(item["content"] for item in text_content)
         }
     
+    def _process_tables(self, tables: List[Dict]) -> List[Dict]:
+        """Process tables, keeping their typed columns."""
+        processed = []
+        for table in tables:
+            columns = table.get("columns")
+            processed.append({
+                "url": table.get("url"),
+                "heading_path": table.get("heading_path", []),
+                "headers": table.get("headers", []),
+                "rows": table.get("rows", []),
+                "columns": [
+                    column.to_dict() if hasattr(column, "to_dict") else column
+                    for column in columns
+                ] if columns else []
+            })
+        return processed
+    
+    def _process_lists(self, lists: List[Dict]) -> List[Dict]:
+        """Process lists."""
+        return [{
+            "url": item.get("url"),
+            "heading_path": item.get("heading_path", []),
+            "list_type": item.get("list_type", "ul"),
+            "items": item.get("items", [])
+        } for item in lists]
+    
+    def _process_forms(self, forms: List[Dict]) -> List[Dict]:
+        """Process forms."""
+        return [{
+            "url": form.get("url"),
+            "action": form.get("action", ""),
+            "method": form.get("method", "get"),
+            "fields": form.get("fields", [])
+        } for form in forms]
+    
     def _format_json(self, processed: Dict) -> Dict:
         """Format content as JSON."""
         return {
@@ -154,4 +221,20 @@ class ContentSynthesizer:
         return {
             "format": "markdown",
             "content": "\n".join(md_content)
-        }
\ No newline at end of file
+        }
+    
+    def _table_to_markdown(self, table: Dict) -> str:
+        """Render a table as a Markdown pipe table."""
+        headers = table.get("headers") or []
+        rows = table.get("rows") or []
+        width = max([len(headers)] + [len(row) for row in rows])
+        if not width:
+            return ""
+        
+        def line(cells: List[str]) -> str:
+            cells = [cell.replace("|", "\\|") for cell in cells] + [""] * (width - len(cells))
+            return "| " + " | ".join(cells) + " |"
+        
+        lines = [line(headers), "|" + " --- |" * width]
+        lines.extend(line(row) for row in rows)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,12 @@
+# src/rufus/search/__init__.py
+from .bm25 import BM25Index, IndexSink, tokenize
+from .coverage import structured_coverage
+from .prefilter import RelevancePrefilter
+
+__all__ = [
+    'BM25Index',
+    'IndexSink',
+    'RelevancePrefilter',
+    'structured_coverage',
+    'tokenize'
+]
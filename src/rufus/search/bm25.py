@@ -0,0 +1,495 @@
+# src/rufus/search/bm25.py
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import uuid
+from array import array
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
+from ..extractors.item import item_text
+from ..processors.sinks import OutputSink
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+TOKEN_PATTERN = re.compile(r'\w+')
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have in is it its of on or that the
+their there this to was were will with
+""".split())
+
+FORMAT_VERSION = 3
+SEGMENT_FILES = (
+    'postings.{}.bin', 'terms.{}.json', 'lengths.{}.bin',
+    'documents.{}.jsonl', 'digests.{}.bin'
+)
+BYTEORDER = 'little' if array('I', [1]).tobytes()[0] == 1 else 'big'
+
+def stem(token: str) -> str:
+    """Fold English plurals with the S-stemmer (Harman, 1991)."""
+    if len(token) < 4 or token[-1] != 's':
+        return token
+    if token.endswith('ies') and not token.endswith(('eies', 'aies')):
+        return token[:-3] + 'y'
+    if token.endswith('es') and not token.endswith(('aes', 'ees', 'oes')):
+        return token[:-1]
+    if not token.endswith(('us', 'ss')):
+        return token[:-1]
+    return token
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase a text and split it into index terms, dropping stopwords."""
+    return [
+        stem(token) for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS
+    ]
+
+class BM25Index:
+    """
+    In-process inverted index with BM25 ranking.
+    
+    Documents are added incrementally. Each term's postings are two
+    ``array('I')`` columns of document ids and term frequencies, so the index
+    stays compact and is written to and read from disk as raw arrays.
+    Queries score only the postings of their own terms, using numpy when it
+    is installed. With ``deduplicate``, an item whose URL and text are
+    already indexed is skipped, so re-scraping a page does not add it twice.
+    """
+    
+    def __init__(self, k1: float = 1.5, b: float = 0.75, deduplicate: bool = False):
+        self.k1 = k1
+        self.b = b
+        self.deduplicate = deduplicate
+        self.postings: Dict[str, Tuple[array, array]] = {}
+        self.lengths = array('I')
+        self.documents: List[Dict] = []
+        self.total_length = 0
+        self._norms = None
+        self._digests: Set[bytes] = set()
+        # Generations of the stored segments this index was read from
+        self._segments: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.lengths)
+    
+    def add(self, item: Mapping[str, Any]) -> Optional[int]:
+        """
+        Index one content item.
+        
+        Returns:
+            Document id, or None if the item has no indexable text or is a
+            duplicate
+        """
+        text = item_text(item)
+        digest = None
+        if self.deduplicate:
+            digest = self._digest(item.get('url'), text)
+            if digest in self._digests:
+                return None
+        tokens = tokenize(text)
+        if not tokens:
+            return None
+        
+        doc_id = len(self.lengths)
+        frequencies: Dict[str, int] = {}
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + 1
+        
+        postings = self.postings
+        for term, tf in frequencies.items():
+            entry = postings.get(term)
+            if entry is None:
+                entry = postings[term] = (array('I'), array('I'))
+            entry[0].append(doc_id)
+            entry[1].append(tf)
+        
+        self.lengths.append(len(tokens))
+        self.total_length += len(tokens)
+        self._norms = None
+        self.documents.append({
+            'content': text,
+            'type': item.get('type'),
+            'url': item.get('url'),
+            'heading_path': list(item.get('heading_path') or [])
+        })
+        if digest is not None:
+            self._digests.add(digest)
+        return doc_id
+    
+    @staticmethod
+    def _digest(url: Optional[str], text: str) -> bytes:
+        return hashlib.blake2b(f"{url or ''}\0{text}".encode('utf-8'), digest_size=8).digest()
+    
+    def add_many(self, items: Iterable[Mapping[str, Any]]) -> int:
+        """Index items from any iterable and return how many were indexed."""
+        return sum(1 for item in items if self.add(item) is not None)
+    
+    def _idf(self, df: int) -> float:
+        count = len(self.lengths)
+        return math.log(1 + (count - df + 0.5) / (df + 0.5))
+    
+    def search(self, query: str, k: int = 10) -> List[Dict]:
+        """
+        Return the k best matching documents for a query.
+        
+        Returns:
+            Documents with their ``score`` and ``doc_id``, best first
+        """
+        weights = {term: 1.0 for term in tokenize(query) if term in self.postings}
+        if not weights or k <= 0:
+            return []
+        
+        if np is not None:
+            scores = self._numpy_scores(weights)
+            matched = np.flatnonzero(scores)
+            if len(matched) > k:
+                matched = matched[np.argpartition(scores[matched], -k)[-k:]]
+            order = matched[np.argsort(-scores[matched], kind='stable')]
+            ranked = [(int(doc_id), float(scores[doc_id])) for doc_id in order]
+        else:
+            ranked = heapq.nlargest(k, self._python_scores(weights).items(), key=lambda pair: pair[1])
+        
+        return [
+            {**self.documents[doc_id], 'score': round(score, 4), 'doc_id': doc_id}
+            for doc_id, score in ranked
+        ]
+    
+    def score_terms(self, weights: Dict[str, float]) -> List[float]:
+        """
+        Score every document against weighted query terms.
+        
+        Args:
+            weights: Query term weights; each term's BM25 contribution is
+                multiplied by its weight
+        
+        Returns:
+            One score per document id, 0 for documents matching no term
+        """
+        weights = {term: w for term, w in weights.items() if term in self.postings}
+        if not weights:
+            return [0.0] * len(self)
+        if np is not None:
+            return self._numpy_scores(weights).tolist()
+        
+        scores = [0.0] * len(self)
+        for doc_id, score in self._python_scores(weights).items():
+            scores[doc_id] = score
+        return scores
+    
+    def _python_scores(self, weights: Dict[str, float]) -> Dict[int, float]:
+        k1, b = self.k1, self.b
+        average = self.total_length / len(self.lengths)
+        lengths = self.lengths
+        scores: Dict[int, float] = {}
+        
+        for term, weight in weights.items():
+            doc_ids, tfs = self.postings[term]
+            idf = weight * self._idf(len(doc_ids))
+            for doc_id, tf in zip(doc_ids, tfs):
+                norm = k1 * (1 - b + b * lengths[doc_id] / average)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        
+        return scores
+    
+    def _numpy_scores(self, weights: Dict[str, float]) -> "np.ndarray":
+        k1 = self.k1
+        if self._norms is None:
+            # Length normalization only changes when documents are added
+            lengths = np.frombuffer(self.lengths, dtype=np.uint32)
+            average = self.total_length / len(lengths)
+            self._norms = k1 * (1 - self.b + self.b * lengths / average)
+        norms = self._norms
+        scores = np.zeros(len(norms))
+        
+        for term, weight in weights.items():
+            doc_ids, tfs = self.postings[term]
+            ids = np.frombuffer(doc_ids, dtype=np.uint32)
+            tf = np.frombuffer(tfs, dtype=np.uint32).astype(np.float64)
+            # Document ids are unique within a term's postings
+            scores[ids] += weight * self._idf(len(ids)) * tf * (k1 + 1) / (tf + norms[ids])
+        
+        return scores
+    
+    def _clear(self) -> None:
+        self.postings = {}
+        self.lengths = array('I')
+        self.documents = []
+        self.total_length = 0
+        self._norms = None
+        self._digests = set()
+        self._segments = []
+    
+    def _write_segment(self, path: Union[str, os.PathLike]) -> Dict:
+        """
+        Write every document of this index as one segment.
+        
+        Returns:
+            The segment's entry in ``meta.json``
+        """
+        generation = uuid.uuid4().hex[:12]
+        terms = {}
+        offset = 0
+        
+        with open(os.path.join(path, f"postings.{generation}.bin"), 'wb') as f:
+            for term, (doc_ids, tfs) in self.postings.items():
+                doc_ids.tofile(f)
+                tfs.tofile(f)
+                terms[term] = [offset, len(doc_ids)]
+                offset += len(doc_ids)
+        
+        with open(os.path.join(path, f"terms.{generation}.json"), 'w', encoding='utf-8') as f:
+            json.dump(terms, f, ensure_ascii=False)
+        
+        with open(os.path.join(path, f"lengths.{generation}.bin"), 'wb') as f:
+            self.lengths.tofile(f)
+        
+        with open(os.path.join(path, f"documents.{generation}.jsonl"), 'w', encoding='utf-8') as f:
+            for document in self.documents:
+                f.write(json.dumps(document, ensure_ascii=False))
+                f.write('\n')
+        
+        if self.deduplicate:
+            with open(os.path.join(path, f"digests.{generation}.bin"), 'wb') as f:
+                f.write(b''.join(sorted(self._digests)))
+        
+        return {
+            'generation': generation,
+            'documents': len(self.lengths),
+            'total_length': self.total_length
+        }
+    
+    def _read_segment(self, path: Union[str, os.PathLike], segment: Dict, swap: bool) -> None:
+        """Append a stored segment's documents after the ones already loaded."""
+        generation = segment['generation']
+        base = len(self.lengths)
+        
+        lengths = array('I')
+        with open(os.path.join(path, f"lengths.{generation}.bin"), 'rb') as f:
+            lengths.frombytes(f.read())
+        
+        data = array('I')
+        with open(os.path.join(path, f"postings.{generation}.bin"), 'rb') as f:
+            data.frombytes(f.read())
+        if swap:
+            lengths.byteswap()
+            data.byteswap()
+        
+        with open(os.path.join(path, f"terms.{generation}.json"), encoding='utf-8') as f:
+            terms = json.load(f)
+        
+        postings = self.postings
+        for term, (offset, count) in terms.items():
+            start = offset * 2
+            doc_ids = data[start:start + count]
+            if base:
+                doc_ids = array('I', [doc_id + base for doc_id in doc_ids])
+            entry = postings.get(term)
+            if entry is None:
+                postings[term] = (doc_ids, data[start + count:start + 2 * count])
+            else:
+                entry[0].extend(doc_ids)
+                entry[1].extend(data[start + count:start + 2 * count])
+        
+        with open(os.path.join(path, f"documents.{generation}.jsonl"), encoding='utf-8') as f:
+            documents = [json.loads(line) for line in f]
+        
+        self.lengths.extend(lengths)
+        self.total_length += segment['total_length']
+        self.documents.extend(documents)
+        self._norms = None
+        self._segments.append(generation)
+        if self.deduplicate:
+            self._digests.update(
+                self._digest(document.get('url'), document['content'])
+                for document in documents
+            )
+    
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Write the whole index to a directory, replacing any index there.
+        
+        An index directory holds ``meta.json`` and a list of segments, each
+        stored as a postings file with every term's document ids followed by
+        its frequencies as uint32 in the byte order recorded in the meta
+        file, a term dictionary with offsets into it, document lengths and a
+        JSON lines file of documents. ``save`` writes one segment; ``append``
+        adds segments without rewriting the existing ones. Segments are
+        written before ``meta.json`` is atomically replaced to point at
+        them, so a crash mid-write leaves the previous index readable.
+        """
+        with _locked(path):
+            previous = _read_meta(path)
+            segment = self._write_segment(path)
+            _write_meta(path, self._meta([segment]))
+            if previous is not None:
+                # Only the segments of the replaced meta file are unreferenced
+                for old in previous['segments']:
+                    _remove_segment(path, old['generation'])
+        self._segments = [segment['generation']]
+    
+    def _meta(self, segments: List[Dict]) -> Dict:
+        return {
+            'version': FORMAT_VERSION,
+            'k1': self.k1,
+            'b': self.b,
+            'deduplicate': self.deduplicate,
+            'byteorder': BYTEORDER,
+            'segments': segments
+        }
+    
+    @classmethod
+    def append(
+        cls,
+        path: Union[str, os.PathLike],
+        items: Iterable[Mapping[str, Any]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        deduplicate: bool = True
+    ) -> int:
+        """
+        Index items into a new segment of the index stored in a directory.
+        
+        Only the new items are written, so each crawl adds work proportional
+        to its own content. With ``deduplicate``, items already stored are
+        checked against the segments' digest files without loading them.
+        Writers hold a lock on the directory, so processes can share it.
+        ``k1`` and ``b`` apply only when the directory has no index yet.
+        
+        Returns:
+            Number of items indexed
+        """
+        with _locked(path):
+            meta = _read_meta(path)
+            segment = cls(k1=k1, b=b, deduplicate=deduplicate)
+            if meta is None:
+                meta = segment._meta([])
+            else:
+                segment.k1, segment.b = meta['k1'], meta['b']
+            
+            stored: Set[bytes] = set()
+            if deduplicate:
+                for entry in meta['segments']:
+                    stored.update(_read_digests(path, entry['generation']))
+            
+            segment._digests = set(stored)
+            count = segment.add_many(items)
+            if not count:
+                return 0
+            
+            segment._digests -= stored
+            meta['segments'].append(segment._write_segment(path))
+            _write_meta(path, meta)
+            return count
+    
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], deduplicate: Optional[bool] = None) -> "BM25Index":
+        """
+        Read an index written by ``save`` or ``append``.
+        
+        The loaded index can keep growing afterwards. ``deduplicate``
+        overrides the setting the index was saved with.
+        """
+        with _locked(path, shared=True):
+            meta = _read_meta(path)
+            if meta is None:
+                raise FileNotFoundError(f"No index in {path}")
+            
+            index = cls(
+                k1=meta['k1'],
+                b=meta['b'],
+                deduplicate=meta['deduplicate'] if deduplicate is None else deduplicate
+            )
+            swap = meta['byteorder'] != BYTEORDER
+            for segment in meta['segments']:
+                index._read_segment(path, segment, swap)
+        return index
+    
+    def refresh(self, path: Union[str, os.PathLike]) -> int:
+        """
+        Read the segments appended to a directory since this index was loaded.
+        
+        If the directory was rewritten by ``save`` in the meantime, the whole
+        index is read again.
+        
+        Returns:
+            Number of documents read
+        """
+        with _locked(path, shared=True):
+            meta = _read_meta(path)
+            if meta is None:
+                return 0
+            
+            generations = [segment['generation'] for segment in meta['segments']]
+            if generations[:len(self._segments)] != self._segments:
+                self._clear()
+            
+            before = len(self)
+            swap = meta['byteorder'] != BYTEORDER
+            for segment in meta['segments'][len(self._segments):]:
+                self._read_segment(path, segment, swap)
+        return len(self) - before
+
+@contextmanager
+def _locked(path: Union[str, os.PathLike], shared: bool = False) -> Iterator[None]:
+    """Hold a lock on an index directory across processes where fcntl exists."""
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, 'lock'), 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+def _read_meta(path: Union[str, os.PathLike]) -> Optional[Dict]:
+    try:
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        return None
+    if meta.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported index version: {meta.get('version')}")
+    return meta
+
+def _write_meta(path: Union[str, os.PathLike], meta: Dict) -> None:
+    meta_path = os.path.join(path, 'meta.json')
+    tmp_path = f"{meta_path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp_path, meta_path)
+
+def _read_digests(path: Union[str, os.PathLike], generation: str) -> Set[bytes]:
+    try:
+        with open(os.path.join(path, f"digests.{generation}.bin"), 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return set()
+    return {data[i:i + 8] for i in range(0, len(data), 8)}
+
+def _remove_segment(path: Union[str, os.PathLike], generation: str) -> None:
+    for name in SEGMENT_FILES:
+        try:
+            os.remove(os.path.join(path, name.format(generation)))
+        except FileNotFoundError:
+            pass
+
+class IndexSink(OutputSink):
+    """Sink that indexes crawl output as it streams in."""
+    
+    def __init__(self, index: Optional[BM25Index] = None):
+        super().__init__()
+        self.index = index if index is not None else BM25Index()
+    
+    def _write_item(self, item: Mapping[str, Any]) -> None:
+        self.index.add(item)
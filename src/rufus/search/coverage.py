@@ -0,0 +1,52 @@
+# src/rufus/search/coverage.py
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Set
+from ..extractors.item import flatten_data
+from .bm25 import tokenize
+
+# Instruction words that ask for something rather than name what is wanted
+REQUEST_TERMS = frozenset(tokenize("""
+extract find get list show give collect scrape retrieve pull return gather
+information info detail data all any each every page site website about me
+please what which who where when how
+"""))
+
+CAMEL_CASE = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+
+def field_terms(items: Iterable[Mapping[str, Any]]) -> Set[str]:
+    """Index terms of the schema types and field names of structured items."""
+    terms: Set[str] = set()
+    for item in items:
+        data = item.get('data') or {}
+        names = [str(item.get('schema_type') or '')]
+        for key, value in flatten_data(data):
+            names.append(key.replace('.', ' ').replace('@', ''))
+            if key.endswith('@type'):
+                names.append(value)
+        for name in names:
+            terms.update(tokenize(CAMEL_CASE.sub(' ', name)))
+    return terms
+
+def structured_coverage(items: Iterable[Mapping[str, Any]], instructions: str) -> Dict[str, object]:
+    """
+    Measure how much of a request structured data can answer.
+    
+    The instructions' content terms, without request words such as
+    "extract" or "information", are matched against the schema types and
+    field names of the items, e.g. ``offers.price`` covers "prices".
+    
+    Returns:
+        ``coverage`` as the share of matched terms, plus the ``matched``
+        and ``missing`` terms
+    """
+    wanted: List[str] = [
+        term for term in dict.fromkeys(tokenize(instructions))
+        if term not in REQUEST_TERMS and len(term) > 1
+    ]
+    available = field_terms(items)
+    matched = [term for term in wanted if term in available]
+    return {
+        'coverage': len(matched) / len(wanted) if wanted else 0.0,
+        'matched': matched,
+        'missing': [term for term in wanted if term not in available]
+    }
@@ -0,0 +1,90 @@
+# src/rufus/search/prefilter.py
+from typing import Dict, List, Optional, Sequence
+from .bm25 import BM25Index, tokenize
+
+class RelevancePrefilter:
+    """
+    Cheap lexical relevance stage in front of LLM evaluation.
+    
+    Blocks are indexed with BM25 and scored against the instructions, with
+    the strategy's relevance criteria weighted more heavily. Scores are
+    scaled so the best block scores 1. Blocks below ``prefilter_reject``, or
+    outside the ``prefilter_top_k`` best, are dropped; blocks at or above
+    ``prefilter_accept`` are kept on their lexical score alone; only the
+    ambiguous blocks in between are left for the model.
+    """
+    
+    def __init__(self, config: Optional[Dict] = None):
+        config = config or {}
+        self.accept = config.get('prefilter_accept', 0.8)
+        self.reject = config.get('prefilter_reject', 0.1)
+        self.top_k = config.get('prefilter_top_k')
+        self.criteria_weight = config.get('prefilter_criteria_weight', 2.0)
+        
+        if self.accept is not None and self.accept < self.reject:
+            raise ValueError("prefilter_accept must not be below prefilter_reject")
+    
+    def _weights(self, instructions: str, criteria: Optional[Sequence[str]]) -> Dict[str, float]:
+        weights = {term: 1.0 for term in tokenize(instructions)}
+        for criterion in criteria or []:
+            for term in tokenize(criterion):
+                weights[term] = max(weights.get(term, 0.0), self.criteria_weight)
+        return weights
+    
+    def score(
+        self,
+        blocks: Sequence[str],
+        instructions: str,
+        criteria: Optional[Sequence[str]] = None
+    ) -> List[float]:
+        """
+        Score blocks against the instructions and relevance criteria.
+        
+        Returns:
+            One score per block between 0 and 1, relative to the best block
+        """
+        index = BM25Index()
+        positions = [i for i, text in enumerate(blocks) if index.add({'content': text}) is not None]
+        
+        scores = [0.0] * len(blocks)
+        for i, score in zip(positions, index.score_terms(self._weights(instructions, criteria))):
+            scores[i] = score
+        
+        best = max(scores, default=0.0)
+        if best <= 0:
+            return scores
+        return [score / best for score in scores]
+    
+    def triage(
+        self,
+        blocks: Sequence[str],
+        instructions: str,
+        criteria: Optional[Sequence[str]] = None
+    ) -> Dict[str, List]:
+        """
+        Split blocks into accepted, ambiguous and rejected positions.
+        
+        Returns:
+            ``scores`` per block and the block positions ``accepted`` on
+            their lexical score, ``ambiguous`` for the model to judge and
+            ``rejected``
+        """
+        scores = self.score(blocks, instructions, criteria)
+        ranked = sorted(range(len(blocks)), key=lambda i: -scores[i])
+        candidates = set(ranked[:self.top_k] if self.top_k is not None else ranked)
+        
+        accepted, ambiguous, rejected = [], [], []
+        for i, score in enumerate(scores):
+            if i not in candidates or score <= 0 or score < self.reject:
+                rejected.append(i)
+            elif self.accept is not None and score >= self.accept:
+                accepted.append(i)
+            else:
+                ambiguous.append(i)
+        
+        return {
+            'scores': scores,
+            'accepted': accepted,
+            'ambiguous': ambiguous,
+            'rejected': rejected
+        }
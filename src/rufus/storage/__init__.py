@@ -0,0 +1,12 @@
+# src/rufus/storage/__init__.py
+from .archive import ArchiveRecord, ArchiveWriter, read_archive, reprocess
+from .docstore import DocumentStore, StoreSink
+
+__all__ = [
+    'ArchiveRecord',
+    'ArchiveWriter',
+    'DocumentStore',
+    'StoreSink',
+    'read_archive',
+    'reprocess'
+]
@@ -0,0 +1,300 @@
+# src/rufus/storage/archive.py
+import asyncio
+import gzip
+import os
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Deque, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, Union
+from ..extractors.base import BaseExtractor
+from ..extractors.item import ContentItem
+
+# Bodies are archived as delivered to the crawler, after transfer decoding,
+# so headers describing the encoded form are dropped
+DROPPED_HEADERS = frozenset(['content-encoding', 'transfer-encoding', 'content-length'])
+
+class ArchiveRecord:
+    """A raw response read back from an archive."""
+    
+    __slots__ = ('url', 'status', 'headers', 'body', 'date')
+    
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        date: Optional[str] = None
+    ):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.date = date
+    
+    @property
+    def charset(self) -> str:
+        """Charset declared in the Content-Type header, defaulting to UTF-8."""
+        for key, value in self.headers.items():
+            if key.lower() == 'content-type':
+                for param in value.split(';')[1:]:
+                    name, _, charset = param.strip().partition('=')
+                    if name.lower() == 'charset' and charset:
+                        return charset.strip('"\'')
+        return 'utf-8'
+    
+    def text(self) -> str:
+        """Decode the body with its declared charset."""
+        try:
+            return self.body.decode(self.charset, errors='replace')
+        except LookupError:
+            return self.body.decode('utf-8', errors='replace')
+
+class ArchiveWriter:
+    """
+    Append raw HTTP responses to a WARC-style archive.
+    
+    Every response becomes a WARC/1.1 ``response`` record holding the status
+    line, headers and body, compressed as its own gzip member like a
+    ``.warc.gz`` file, so archives can be concatenated and read by standard
+    WARC tools.
+    """
+    
+    def __init__(self, path: Union[str, os.PathLike], compresslevel: int = 6):
+        self.path = os.fspath(path)
+        self.compresslevel = compresslevel
+        self.records_written = 0
+        self.closed = False
+        self._file = open(self.path, 'ab')
+        if self._file.tell() == 0:
+            self._write_record(
+                'warcinfo',
+                None,
+                b'software: rufus\r\nformat: WARC File Format 1.1\r\n',
+                'application/warc-fields'
+            )
+    
+    def _write_record(
+        self,
+        record_type: str,
+        url: Optional[str],
+        block: bytes,
+        content_type: str
+    ) -> None:
+        headers = [
+            'WARC/1.1',
+            f'WARC-Type: {record_type}',
+            f'WARC-Date: {datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")}',
+            f'WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>'
+        ]
+        if url:
+            headers.append(f'WARC-Target-URI: {url}')
+        headers.append(f'Content-Type: {content_type}')
+        headers.append(f'Content-Length: {len(block)}')
+        
+        record = '\r\n'.join(headers).encode('utf-8') + b'\r\n\r\n' + block + b'\r\n\r\n'
+        self._file.write(gzip.compress(record, compresslevel=self.compresslevel))
+    
+    def write_response(
+        self,
+        url: str,
+        status: int,
+        headers: Mapping[str, str],
+        body: Union[bytes, str]
+    ) -> None:
+        """Archive one response."""
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        
+        lines = [f'HTTP/1.1 {status}']
+        lines.extend(
+            f'{key}: {value}' for key, value in headers.items()
+            if key.lower() not in DROPPED_HEADERS
+        )
+        lines.append(f'Content-Length: {len(body)}')
+        block = '\r\n'.join(lines).encode('utf-8', errors='replace') + b'\r\n\r\n' + body
+        
+        self._write_record('response', url, block, 'application/http;msgtype=response')
+        self.records_written += 1
+    
+    def flush(self) -> None:
+        self._file.flush()
+    
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._file.close()
+    
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+def _parse_headers(block: bytes) -> Tuple[str, Dict[str, str]]:
+    """Split a header block into its first line and a header dict."""
+    lines = block.decode('utf-8', errors='replace').split('\r\n')
+    headers = {}
+    for line in lines[1:]:
+        key, sep, value = line.partition(':')
+        if sep:
+            headers[key.strip()] = value.strip()
+    return lines[0], headers
+
+def read_archive(path: Union[str, os.PathLike]) -> Iterator[ArchiveRecord]:
+    """
+    Iterate over the response records of an archive in the order they were written.
+    
+    Other record types are skipped. A truncated final record, e.g. from an
+    interrupted crawl, ends the iteration.
+    """
+    with gzip.open(path, 'rb') as f:
+        while True:
+            try:
+                head = b''
+                while not head.endswith(b'\r\n\r\n'):
+                    line = f.readline()
+                    if not line:
+                        return
+                    if line == b'\r\n' and not head:
+                        continue
+                    head += line
+            except EOFError:
+                return
+            
+            version, warc_headers = _parse_headers(head[:-4])
+            if not version.startswith('WARC/'):
+                raise ValueError(f"Invalid WARC record in {path}")
+            
+            length = int(warc_headers.get('Content-Length', 0))
+            try:
+                block = f.read(length)
+            except EOFError:
+                return
+            if len(block) < length:
+                return
+            
+            if warc_headers.get('WARC-Type') != 'response':
+                continue
+            
+            http_head, _, body = block.partition(b'\r\n\r\n')
+            status_line, headers = _parse_headers(http_head)
+            parts = status_line.split()
+            yield ArchiveRecord(
+                warc_headers.get('WARC-Target-URI', ''),
+                int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0,
+                headers,
+                body,
+                warc_headers.get('WARC-Date')
+            )
+
+class _Extraction:
+    """Extraction stack built once per worker process."""
+    
+    def __init__(
+        self,
+        extractors: Optional[Sequence[Type[BaseExtractor]]],
+        config: Dict,
+        selectors: Optional[List[str]]
+    ):
+        self.selectors = selectors
+        if extractors is None:
+            # Imported here because the crawlers import this package
+            from ..crawler.async_crawler import AsyncCrawler
+            self.crawler = AsyncCrawler(config)
+            self.extractors = []
+        else:
+            self.crawler = None
+            self.extractors = [extractor(config) for extractor in extractors]
+            self.loop = asyncio.new_event_loop()
+    
+    def __call__(self, url: str, html: str) -> List[ContentItem]:
+        if self.crawler is not None:
+            return self.crawler._extract_content(html, self.selectors, url)
+        
+        content = []
+        for extractor in self.extractors:
+            for item in self.loop.run_until_complete(extractor.extract(html, self.selectors)):
+                item['url'] = url
+                content.append(item)
+        return content
+
+_worker: Optional[_Extraction] = None
+
+def _init_worker(extractors, config, selectors) -> None:
+    global _worker
+    _worker = _Extraction(extractors, config, selectors)
+
+def _extract_batch(batch: List[Tuple[str, str]]) -> List[List[ContentItem]]:
+    return [_worker(url, html) for url, html in batch]
+
+def _batches(
+    records: Iterator[ArchiveRecord],
+    batch_size: int
+) -> Iterator[List[Tuple[str, str]]]:
+    batch = []
+    for record in records:
+        if record.status != 200:
+            continue
+        batch.append((record.url, record.text()))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def reprocess(
+    archive: Union[str, os.PathLike],
+    extractors: Optional[Sequence[Type[BaseExtractor]]] = None,
+    config: Optional[Dict] = None,
+    selectors: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    batch_size: int = 16
+) -> Iterator[ContentItem]:
+    """
+    Re-run extraction over an archived crawl without touching the network.
+    
+    Archived pages are read in the parent process and extracted in batches
+    across a process pool. Only a bounded number of batches is in flight, so
+    memory stays flat however large the archive is, and items are yielded in
+    archive order so results are deterministic.
+    
+    Args:
+        archive: Archive written by ``ArchiveWriter``
+        extractors: Extractor classes to run on every page; by default the
+            crawler extraction stack configured by ``config`` is used
+        config: Crawler or extractor configuration
+        selectors: Optional CSS selectors, as passed to ``crawl``
+        workers: Worker processes; defaults to the CPU count, 1 extracts
+            in the calling process
+        batch_size: Pages sent to a worker at a time
+    
+    Yields:
+        Extracted content items, each carrying the ``url`` of its page
+    """
+    config = config or {}
+    workers = workers or os.cpu_count() or 1
+    batches = _batches(read_archive(archive), batch_size)
+    
+    if workers <= 1:
+        extraction = _Extraction(extractors, config, selectors)
+        for batch in batches:
+            for url, html in batch:
+                yield from extraction(url, html)
+        return
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(extractors, config, selectors)
+    ) as pool:
+        pending: Deque = deque()
+        for batch in batches:
+            pending.append(pool.submit(_extract_batch, batch))
+            if len(pending) >= workers * 2:
+                for page in pending.popleft().result():
+                    yield from page
+        while pending:
+            for page in pending.popleft().result():
+                yield from page
@@ -0,0 +1,320 @@
+# src/rufus/storage/docstore.py
+import json
+import mmap
+import os
+import struct
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+from ..extractors.item import ContentItem
+from ..processors.sinks import OutputSink
+from ..utils.hashing import url_hash
+from ..utils.serialization import json_default
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+SEGMENT_FILE = 'segment.dat'
+INDEX_FILE = 'index.bin'
+MAGIC = b'RUFDOC1\n'
+
+# Every record is a little-endian payload length and a flags byte, then the payload
+RECORD_HEADER = struct.Struct('<IB')
+FLAG_ZSTD = 1
+
+COMPRESSIONS = (None, 'zstd')
+
+def _require_zstandard():
+    if zstandard is None:
+        raise ImportError(
+            "zstd compression requires zstandard. Install it with "
+            "`pip install rufus[zstd]` or open the store without compression."
+        )
+    return zstandard
+
+class DocumentStore:
+    """
+    Append-only on-disk store of crawled content items.
+    
+    Items are written as length-prefixed JSON records to a single segment
+    file, optionally zstd-compressed. ``index.bin`` holds one entry of three
+    uint64 values per item: the payload offset, the hash of the item's url,
+    and the payload length with the record flags in the high bits. The item
+    id is the entry's position.
+    
+    Reads go through a read-only memory map of the segment, so reopening a
+    store only loads the index, and random access touches only the pages of
+    the requested record. The segment is authoritative: records appended
+    after the index was last written are recovered on open.
+    """
+    
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        mode: str = 'r',
+        compression: Optional[str] = None,
+        level: int = 3,
+        compress_min_size: int = 256
+    ):
+        """
+        Open or create a store.
+        
+        Args:
+            path: Store directory
+            mode: ``r`` to read or ``a`` to read and append
+            compression: ``zstd`` to compress new records, or None
+            level: zstd compression level
+            compress_min_size: Records smaller than this many bytes are
+                stored uncompressed
+        """
+        if mode not in ('r', 'a'):
+            raise ValueError(f"Unsupported mode: {mode}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        
+        self.path = os.fspath(path)
+        self.mode = mode
+        self.compress_min_size = compress_min_size
+        self._compressor = (
+            _require_zstandard().ZstdCompressor(level=level)
+            if compression == 'zstd' else None
+        )
+        self._decompressor = None
+        
+        segment = os.path.join(self.path, SEGMENT_FILE)
+        if mode == 'a':
+            os.makedirs(self.path, exist_ok=True)
+            if not os.path.exists(segment):
+                with open(segment, 'wb') as f:
+                    f.write(MAGIC)
+        
+        with open(segment, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a document store segment: {segment}")
+        
+        self.index = array('Q')
+        index_file = os.path.join(self.path, INDEX_FILE)
+        if os.path.exists(index_file):
+            with open(index_file, 'rb') as f:
+                data = f.read()
+            entry_size = 3 * self.index.itemsize
+            self.index.frombytes(data[:len(data) - len(data) % entry_size])
+            self._index_bytes = len(data)
+        else:
+            self._index_bytes = 0
+        
+        self._segment = open(segment, 'r+b' if mode == 'a' else 'rb')
+        self._size = self._segment.seek(0, os.SEEK_END)
+        self._recover()
+        
+        self._map: Optional[mmap.mmap] = None
+        self._mapped = 0
+        self._by_url: Optional[Dict[int, array]] = None
+        self.closed = False
+    
+    def _recover(self) -> None:
+        """Reconcile the index with the segment after an interrupted write."""
+        index = self.index
+        end = len(MAGIC)
+        
+        # Drop entries pointing past the end of the segment
+        while len(index) >= 3:
+            last_end = index[-3] + (index[-1] & 0xFFFFFFFF)
+            if last_end <= self._size:
+                end = last_end
+                break
+            del index[-3:]
+        
+        stored = len(index) * index.itemsize
+        if stored != self._index_bytes and self.mode == 'a':
+            with open(os.path.join(self.path, INDEX_FILE), 'wb') as f:
+                index.tofile(f)
+        self._indexed = len(self)
+        
+        # Index records written after the last index flush
+        self._segment.seek(end)
+        while end + RECORD_HEADER.size <= self._size:
+            length, flags = RECORD_HEADER.unpack(self._segment.read(RECORD_HEADER.size))
+            start = end + RECORD_HEADER.size
+            if start + length > self._size:
+                break
+            payload = self._segment.read(length)
+            item = self._decode(payload, flags)
+            index.extend((start, url_hash(item.get('url')), length | flags << 32))
+            end = start + length
+        
+        if end < self._size and self.mode == 'a':
+            # A torn record at the tail is discarded
+            self._segment.truncate(end)
+        self._size = end
+    
+    def __len__(self) -> int:
+        return len(self.index) // 3
+    
+    def append(self, item: Mapping[str, Any]) -> int:
+        """
+        Append a content item.
+        
+        Returns:
+            Item id
+        """
+        if self.mode != 'a':
+            raise IOError("Document store is open read-only")
+        
+        payload = json.dumps(
+            item, ensure_ascii=False, separators=(',', ':'), default=json_default
+        ).encode('utf-8')
+        flags = 0
+        if self._compressor is not None and len(payload) >= self.compress_min_size:
+            payload = self._compressor.compress(payload)
+            flags = FLAG_ZSTD
+        
+        self._segment.seek(self._size)
+        self._segment.write(RECORD_HEADER.pack(len(payload), flags))
+        self._segment.write(payload)
+        
+        start = self._size + RECORD_HEADER.size
+        self._size = start + len(payload)
+        item_id = len(self)
+        key = url_hash(item.get('url'))
+        self.index.extend((start, key, len(payload) | flags << 32))
+        if self._by_url is not None:
+            self._by_url.setdefault(key, array('I')).append(item_id)
+        return item_id
+    
+    def extend(self, items: Iterable[Mapping[str, Any]]) -> int:
+        """Append items from any iterable and return how many were written."""
+        count = 0
+        for item in items:
+            self.append(item)
+            count += 1
+        return count
+    
+    def flush(self) -> None:
+        """Write appended records and their index entries to disk."""
+        if self.mode != 'a':
+            return
+        self._segment.flush()
+        if self._indexed < len(self):
+            with open(os.path.join(self.path, INDEX_FILE), 'ab') as f:
+                self.index[self._indexed * 3:].tofile(f)
+            self._indexed = len(self)
+    
+    def close(self) -> None:
+        """Flush and release the segment file and its memory map."""
+        if self.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self.closed = True
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._segment.close()
+    
+    def __enter__(self) -> "DocumentStore":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def _view(self, end: int) -> mmap.mmap:
+        """Return a memory map of the segment covering at least ``end`` bytes."""
+        if self._map is None or end > self._mapped:
+            self._segment.flush()
+            # The previous map is left to close itself once no view uses it
+            self._map = mmap.mmap(self._segment.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped = len(self._map)
+        return self._map
+    
+    def raw(self, item_id: int) -> memoryview:
+        """
+        Return a record's stored payload without copying it.
+        
+        The view points into the memory map and is only valid until the
+        store is closed or grows.
+        """
+        if not 0 <= item_id < len(self):
+            raise IndexError(f"Item id out of range: {item_id}")
+        start = self.index[item_id * 3]
+        end = start + (self.index[item_id * 3 + 2] & 0xFFFFFFFF)
+        return memoryview(self._view(end))[start:end]
+    
+    def _decode(self, payload, flags: int) -> ContentItem:
+        if flags & FLAG_ZSTD:
+            if self._decompressor is None:
+                self._decompressor = _require_zstandard().ZstdDecompressor()
+            payload = self._decompressor.decompress(payload)
+        return ContentItem.from_dict(json.loads(bytes(payload)))
+    
+    def get(self, item_id: int) -> ContentItem:
+        """Read one item by id."""
+        view = self.raw(item_id)
+        try:
+            return self._decode(view, self.index[item_id * 3 + 2] >> 32)
+        finally:
+            view.release()
+    
+    def __getitem__(self, item_id: int) -> ContentItem:
+        return self.get(item_id)
+    
+    def __iter__(self) -> Iterator[ContentItem]:
+        """Iterate over all items in the order they were written."""
+        for item_id in range(len(self)):
+            yield self.get(item_id)
+    
+    def ids_for_url(self, url: str) -> List[int]:
+        """Return the ids of items extracted from a url, in write order."""
+        if self._by_url is None:
+            by_url: Dict[int, array] = {}
+            index = self.index
+            for item_id in range(len(self)):
+                key = index[item_id * 3 + 1]
+                ids = by_url.get(key)
+                if ids is None:
+                    ids = by_url[key] = array('I')
+                ids.append(item_id)
+            self._by_url = by_url
+        
+        # Hash collisions are resolved by checking the stored url
+        return [
+            item_id for item_id in self._by_url.get(url_hash(url), ())
+            if self.get(item_id).get('url') == url
+        ]
+    
+    def by_url(self, url: str) -> List[ContentItem]:
+        """Read every item extracted from a url."""
+        return [self.get(item_id) for item_id in self.ids_for_url(url)]
+    
+    def stats(self) -> Dict:
+        """Summarize the store."""
+        compressed = sum(1 for i in range(2, len(self.index), 3) if self.index[i] >> 32 & FLAG_ZSTD)
+        return {
+            'items': len(self),
+            'segment_bytes': self._size,
+            'compressed_items': compressed
+        }
+
+class StoreSink(OutputSink):
+    """Sink that appends crawl output to a document store."""
+    
+    def __init__(self, store: Union[DocumentStore, str, os.PathLike], **options):
+        super().__init__()
+        if isinstance(store, DocumentStore):
+            self.store = store
+            self._owns_store = False
+        else:
+            self.store = DocumentStore(store, mode='a', **options)
+            self._owns_store = True
+    
+    def _write_item(self, item: Mapping[str, Any]) -> None:
+        self.store.append(item)
+    
+    def flush(self) -> None:
+        self.store.flush()
+    
+    def _close_target(self) -> None:
+        if self._owns_store:
+            self.store.close()
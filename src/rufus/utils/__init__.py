@@ -1,6 +1,9 @@
 # src/rufus/utils/__init__.py
 from .cache import Cache
+from .hashing import block_hash, hamming_distance, normalize_block, simhash, url_hash
+from .llm_cache import LLMCache
 from .rate_limiter import RateLimiter
+from .serialization import json_default
 from .validators import Validators
 
-__all__ = ['Cache', 'RateLimiter', 'Validators']
\ No newline at end of file
+__all__ = ['Cache', 'LLMCache', 'RateLimiter', 'Validators', 'block_hash', 'hamming_distance', 'json_default', 'normalize_block', 'simhash', 'url_hash']
\ No newline at end of file
@@ -4,6 +4,7 @@ from typing import Optional, Any
 import json
 import os
 from loguru import logger
+from .serialization import json_default
 
 class Cache:
     """Redis-based caching system for Rufus."""
@@ -44,7 +45,7 @@ class Cache:
             self.redis.setex(
                 key,
                 expires_in,
-                json.dumps(value)
+                json.dumps(value, default=json_default)
             )
             return True
         except Exception as e:
@@ -0,0 +1,42 @@
+import hashlib
+from typing import Iterable, Optional
+
+def normalize_block(text: str) -> str:
+    """Normalize a text block for duplicate detection."""
+    return " ".join(text.lower().split())
+
+def block_hash(text: str) -> int:
+    """Return a stable 64-bit hash of a normalized text block."""
+    digest = hashlib.blake2b(
+        normalize_block(text).encode("utf-8"),
+        digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little")
+
+def url_hash(url: Optional[str]) -> int:
+    """Return a stable 64-bit hash of a URL, or 0 for a missing URL."""
+    if not url:
+        return 0
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+def simhash(features: Iterable[str], bits: int = 64) -> int:
+    """
+    Return the SimHash of a set of features.
+    
+    Similar feature sets produce hashes that differ in few bits; compare
+    them with ``hamming_distance``.
+    """
+    counts = [0] * bits
+    for feature in features:
+        value = int.from_bytes(
+            hashlib.blake2b(feature.encode("utf-8"), digest_size=bits // 8).digest(),
+            "little"
+        )
+        for bit in range(bits):
+            counts[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, count in enumerate(counts) if count > 0)
+
+def hamming_distance(a: int, b: int) -> int:
+    """Count the bits that differ between two hashes."""
+    return bin(a ^ b).count("1")
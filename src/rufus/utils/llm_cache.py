@@ -0,0 +1,273 @@
+# src/rufus/utils/llm_cache.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from loguru import logger
+from .serialization import json_default
+
+def cache_key(
+    model: str,
+    template: str,
+    variables: Dict[str, Any],
+    temperature: float
+) -> str:
+    """
+    Content address of an LLM call.
+    
+    Two calls share a key only if they use the same model, prompt template,
+    rendered variables and temperature.
+    """
+    payload = json.dumps(
+        [model, template, variables, temperature],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=json_default
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class MemoryTier:
+    """In-process LRU of cached responses, bounded by entry count."""
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], str]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: str, expires_at: Optional[float]) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+
+class DiskTier:
+    """
+    SQLite file of cached responses, bounded by total size.
+    
+    When the stored responses exceed ``max_bytes``, expired entries are
+    removed first and then the least recently used ones.
+    """
+    
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, '
+            'expires_at REAL, accessed_at REAL NOT NULL)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_lru ON responses (accessed_at)')
+        self._size = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+    
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                'SELECT value, expires_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._delete(key)
+                return None
+            self._db.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+            return value
+    
+    def set(self, key: str, value: str, expires_at: Optional[float]) -> None:
+        size = len(value.encode('utf-8'))
+        with self._lock:
+            self._delete(key)
+            self._db.execute(
+                'INSERT INTO responses VALUES (?, ?, ?, ?, ?)',
+                (key, value, size, expires_at, time.time())
+            )
+            self._size += size
+            if self._size > self.max_bytes:
+                self._evict()
+    
+    def _delete(self, key: str) -> None:
+        row = self._db.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+        if row is not None:
+            self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self._size -= row[0]
+    
+    def _evict(self) -> None:
+        self._db.execute('DELETE FROM responses WHERE expires_at <= ?', (time.time(),))
+        self._size = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        
+        # Evict down to 90% of the limit so eviction does not run on every write
+        target = self.max_bytes * 0.9
+        rows = self._db.execute('SELECT key, size FROM responses ORDER BY accessed_at').fetchall()
+        for key, size in rows:
+            if self._size <= target:
+                break
+            self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self._size -= size
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+            self._size = 0
+
+class RedisTier:
+    """Redis-backed cached responses; expiry and eviction are left to Redis."""
+    
+    def __init__(self, client=None, url: Optional[str] = None, prefix: str = 'rufus:llm:'):
+        if client is None:
+            import redis
+            client = redis.from_url(url or os.getenv('REDIS_URL', 'redis://localhost:6379'))
+        self.redis = client
+        self.prefix = prefix
+    
+    def get(self, key: str) -> Optional[str]:
+        value = self.redis.get(self.prefix + key)
+        if value is None:
+            return None
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+    
+    def set(self, key: str, value: str, expires_at: Optional[float]) -> None:
+        if expires_at is None:
+            self.redis.set(self.prefix + key, value)
+        else:
+            ttl = max(1, int(expires_at - time.time()))
+            self.redis.setex(self.prefix + key, ttl, value)
+    
+    def clear(self) -> None:
+        keys = list(self.redis.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self.redis.delete(*keys)
+
+class LLMCache:
+    """
+    Two-tier cache of LLM responses.
+    
+    Lookups check an in-memory LRU first and fall back to an optional
+    persistent tier on disk or in Redis; persistent hits are promoted into
+    memory. Errors in the persistent tier are logged and treated as misses,
+    so a broken cache never fails a scrape.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = 7 * 24 * 3600,
+        store=None
+    ):
+        self.memory = MemoryTier(max_entries)
+        self.store = store
+        self.ttl = ttl
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict] = None) -> Optional["LLMCache"]:
+        """
+        Build a cache from ``llm_cache`` config keys.
+        
+        ``llm_cache`` selects the persistent tier: ``memory`` (the default)
+        for none, ``disk`` for a SQLite file at ``llm_cache_path``, ``redis``
+        for ``REDIS_URL``, or False to disable caching. ``llm_cache_ttl``,
+        ``llm_cache_max_entries`` and ``llm_cache_max_bytes`` bound it.
+        """
+        config = config or {}
+        kind = config.get('llm_cache', 'memory')
+        if not kind:
+            return None
+        if kind not in ('memory', 'disk', 'redis'):
+            raise ValueError(f"Unsupported LLM cache: {kind}")
+        
+        store = None
+        try:
+            if kind == 'disk':
+                store = DiskTier(
+                    config.get('llm_cache_path', os.path.join('.rufus', 'llm_cache.sqlite')),
+                    config.get('llm_cache_max_bytes', 256 * 1024 * 1024)
+                )
+            elif kind == 'redis':
+                store = RedisTier(url=config.get('redis_url'))
+        except Exception as e:
+            # Fall back to the memory tier alone
+            logger.warning(f"LLM cache store initialization failed: {e}")
+        
+        return cls(
+            max_entries=config.get('llm_cache_max_entries', 1024),
+            ttl=config.get('llm_cache_ttl', 7 * 24 * 3600),
+            store=store
+        )
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None on a miss."""
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+        
+        if self.store is not None:
+            try:
+                value = self.store.get(key)
+            except Exception as e:
+                logger.error(f"LLM cache get error: {e}")
+                value = None
+            if value is not None:
+                self.store_hits += 1
+                self.memory.set(key, value, self._expires_at())
+                return value
+        
+        self.misses += 1
+        return None
+    
+    def set(self, key: str, value: str) -> None:
+        """Cache a response in both tiers."""
+        expires_at = self._expires_at()
+        self.memory.set(key, value, expires_at)
+        if self.store is not None:
+            try:
+                self.store.set(key, value, expires_at)
+            except Exception as e:
+                logger.error(f"LLM cache set error: {e}")
+    
+    def _expires_at(self) -> Optional[float]:
+        return time.time() + self.ttl if self.ttl else None
+    
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self.memory.clear()
+        if self.store is not None:
+            self.store.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return hit and miss counters."""
+        lookups = self.memory_hits + self.store_hits + self.misses
+        return {
+            'memory_hits': self.memory_hits,
+            'store_hits': self.store_hits,
+            'misses': self.misses,
+            'hit_rate': round((lookups - self.misses) / lookups, 4) if lookups else 0.0,
+            'memory_entries': len(self.memory)
+        }
@@ -0,0 +1,15 @@
+from typing import Any
+
+def json_default(obj: Any) -> Any:
+    """
+    ``json.dumps`` fallback for objects that convert themselves to plain data.
+    
+    Content items and similar compact types expose ``to_dict``; pass this as
+    ``default=json_default`` wherever extracted content is serialized.
+    """
+    to_dict = getattr(obj, 'to_dict', None)
+    if callable(to_dict):
+        return to_dict()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
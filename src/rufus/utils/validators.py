@@ -4,6 +4,11 @@ from urllib.parse import urlparse
 import re
 from loguru import logger
 
+# Control characters removed from extracted text, except tab, newline and CR
+CONTROL_CHARS = str.maketrans(
+    {c: None for c in [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]}
+)
+
 class Validators:
     """Input validation utilities."""
     
@@ -35,7 +40,5 @@ class Validators:
     @staticmethod
     def sanitize_text(text: str) -> str:
         """Sanitize extracted text content."""
-        # Remove special characters and normalize whitespace
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
\ No newline at end of file
+        # Remove control characters and normalize whitespace in two C-level passes
+        return " ".join(text.translate(CONTROL_CHARS).split())
\ No newline at end of file
@@ -1,6 +1,9 @@
 # tests/test_agent/test_ai_agent.py
+import json
+import re
 import pytest
-from rufus.agent import RufusAgent
+from types import SimpleNamespace
+from rufus.agent import ChatModelBackend, FakeBackend, RufusAgent
 
 @pytest.mark.asyncio
 async def test_agent_strategy_generation():
@@ -28,4 +31,122 @@ async def test_agent_content_evaluation():
     
     assert isinstance(evaluation, dict)
     assert "score" in evaluation
-    assert 0 <= evaluation["score"] <= 1
\ No newline at end of file
+    assert 0 <= evaluation["score"] <= 1
+
+class FakeBatchLLM:
+    """Scores numbered blocks, but drops the last block of large batches."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def agenerate(self, batches):
+        self.calls += 1
+        prompt = batches[0][0].content
+        ids = [int(i) for i in re.findall(r"^\[(\d+)\] ", prompt, re.MULTILINE)]
+        if len(ids) > 2:
+            ids = ids[:-1]
+        text = json.dumps([{"id": i, "score": 0.8, "explanation": "match"} for i in ids])
+        return SimpleNamespace(generations=[[SimpleNamespace(text=text)]])
+
+@pytest.mark.asyncio
+async def test_agent_evaluate_many_batches_and_resplits():
+    """Test batched evaluation, including re-splitting an incomplete reply."""
+    llm = FakeBatchLLM()
+    agent = RufusAgent("test-key", config={"llm_rate_limit": 100}, backend=ChatModelBackend(llm))
+    blocks = ["Tuition costs", "Financial aid", "Campus map", "Tuition costs"]
+    
+    evaluations = await agent.evaluate_many(blocks, "Extract financial information")
+    
+    assert len(evaluations) == 4
+    assert all(e["score"] == 0.8 for e in evaluations)
+    assert llm.calls == 3
+
+class FakeSynthesisLLM:
+    """Lists the pages covered by content groups and merged partials."""
+    
+    def __init__(self):
+        self.prompts = []
+    
+    async def agenerate(self, batches):
+        prompt = batches[0][0].content
+        self.prompts.append(prompt)
+        if prompt.startswith("Merge"):
+            partials = json.loads(prompt.split("Partial syntheses: ", 1)[1].split("\nInstructions:")[0])
+            pages = sorted({page for partial in partials for page in partial["pages"]})
+        else:
+            items = json.loads(prompt.split("Content: ", 1)[1].split("\nInstructions:")[0])
+            pages = sorted({item["url"] for item in items})
+        return SimpleNamespace(generations=[[SimpleNamespace(text=json.dumps({"pages": pages}))]])
+
+@pytest.mark.asyncio
+async def test_agent_synthesis_map_reduces_large_crawls():
+    """Test that content over the token budget is synthesized in groups and merged."""
+    llm = FakeSynthesisLLM()
+    agent = RufusAgent(
+        "test-key",
+        config={"synthesis_chunk_tokens": 200, "llm_rate_limit": 1000},
+        backend=ChatModelBackend(llm)
+    )
+    contents = [
+        {"type": "p", "content": f"Paragraph {n} " + "text " * 40, "url": f"https://example.com/{n // 2}"}
+        for n in range(20)
+    ]
+    
+    synthesis = await agent.synthesize_documents(contents, "Summarize the site")
+    merges = [p for p in llm.prompts if p.startswith("Merge")]
+    
+    assert synthesis == {"pages": [f"https://example.com/{n}" for n in range(10)]}
+    assert len(llm.prompts) - len(merges) == 10
+    assert 3 <= len(merges) < 10
+
+@pytest.mark.asyncio
+async def test_agent_synthesis_survives_failed_groups():
+    """Test that a failed map call drops its group instead of the whole synthesis."""
+    def synthesize(prompt):
+        if "https://example.com/0" in prompt and not prompt.startswith("Merge"):
+            raise RuntimeError("model unavailable")
+        return json.dumps({"pages": sorted(set(re.findall(r"https://example.com/\d", prompt)))})
+    
+    agent = RufusAgent(
+        "test-key",
+        config={"synthesis_chunk_tokens": 200, "llm_rate_limit": 1000},
+        backend=FakeBackend(responses={"synthesis": synthesize})
+    )
+    contents = [
+        {"type": "p", "content": f"Paragraph {n} " + "text " * 40, "url": f"https://example.com/{n // 2}"}
+        for n in range(20)
+    ]
+    
+    synthesis = await agent.synthesize_documents(contents, "Summarize the site")
+    
+    assert "error" not in synthesis
+    assert synthesis["pages"] == [f"https://example.com/{n}" for n in range(1, 10)]
+    assert agent.llm_stats()["synthesis"]["errors"] == 1
+
+@pytest.mark.asyncio
+async def test_agent_answers_from_structured_data():
+    """Test that pages whose structured data covers the instructions skip the model."""
+    prompts = []
+    backend = FakeBackend(responses={"synthesis": lambda prompt: prompts.append(prompt) or '{"merged": true}'})
+    agent = RufusAgent("test-key", config={"llm_rate_limit": 1000}, backend=backend)
+    product = {
+        "type": "structured",
+        "url": "https://shop.example/widget",
+        "format": "json-ld",
+        "schema_type": "Product",
+        "data": {"@type": "Product", "name": "Widget", "offers": {"price": "19.99", "availability": "InStock"}}
+    }
+    about = {"type": "p", "content": "Acme has sold widgets since 1990.", "url": "https://shop.example/about"}
+    
+    synthesis = await agent.synthesize_documents([product], "Extract product prices and availability")
+    
+    assert backend.calls == 0
+    assert synthesis["source"] == "structured_data"
+    assert synthesis["items"][0]["data"] == product["data"]
+    
+    synthesis = await agent.synthesize_documents([product, about], "Extract product prices and availability")
+    
+    assert synthesis == {"merged": True}
+    assert len(prompts) == 2
+    assert "19.99" not in prompts[0] and "1990" in prompts[0]
+    assert prompts[1].startswith("Merge") and "19.99" in prompts[1]
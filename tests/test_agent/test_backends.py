@@ -0,0 +1,46 @@
+import json
+import pytest
+from rufus.agent import FakeBackend, RufusAgent
+
+@pytest.mark.asyncio
+async def test_fake_backend_is_deterministic():
+    """Test that the fake backend gives the same replies for the same prompts."""
+    blocks = [f"Block {n} about tuition and fees" for n in range(6)]
+    results = []
+    for _ in range(2):
+        agent = RufusAgent("test-key", config={"llm_backend": "fake", "llm_cache": False})
+        results.append(await agent.evaluate_many(blocks, "Extract tuition"))
+    
+    assert results[0] == results[1]
+    assert all(0 <= evaluation["score"] <= 1 for evaluation in results[0])
+
+def drop_last_block(prompt):
+    """Score numbered blocks, but drop the last block of large batches."""
+    ids = [line.split("]")[0][1:] for line in prompt.splitlines() if line.startswith("[") and "] " in line]
+    if len(ids) > 2:
+        ids = ids[:-1]
+    return json.dumps([{"id": int(i), "score": 0.5, "explanation": "fake"} for i in ids])
+
+@pytest.mark.asyncio
+async def test_agent_records_calls_by_type():
+    """Test that calls, retries, tokens and cache hits are recorded per call type."""
+    backend = FakeBackend(responses={"relevance": drop_last_block}, latency=0.001)
+    agent = RufusAgent("test-key", config={"llm_rate_limit": 1000, "llm_burst": 100}, backend=backend)
+    
+    await agent.plan_extraction("https://example.com/a", "Extract tuition")
+    await agent.plan_extraction("https://example.org/b", "Extract tuition")
+    await agent.evaluate_many(["Tuition", "Fees", "Aid", "Housing"], "Extract tuition")
+    await agent.synthesize_documents([{"type": "p", "content": "Tuition is $10"}], "Extract tuition")
+    stats = agent.llm_stats()
+    
+    assert stats["strategy"]["calls"] == 2
+    assert stats["relevance"]["calls"] == 3
+    assert stats["relevance"]["retries"] == 2
+    assert stats["synthesis"]["calls"] == 1
+    assert stats["total"]["calls"] == backend.calls == 6
+    assert stats["total"]["prompt_tokens"] > stats["total"]["completion_tokens"] > 0
+    assert stats["strategy"]["latency_ms_p50"] >= 1
+    
+    await agent.evaluate_content("Tuition", "Extract tuition")
+    await agent.evaluate_content("Tuition", "Extract tuition")
+    assert agent.llm_stats()["relevance"]["cache_hits"] == 1
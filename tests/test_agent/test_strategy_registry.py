@@ -0,0 +1,53 @@
+import json
+import pytest
+from types import SimpleNamespace
+from rufus.agent import ChatModelBackend, RufusAgent, StrategyRegistry
+
+STRATEGY = {"content_patterns": ["article"], "ignore_patterns": ["nav"]}
+
+def test_registry_reuses_similar_templates_until_expiry(tmp_path):
+    """Test template matching, expiry and persistence."""
+    path = tmp_path / "strategies.json"
+    registry = StrategyRegistry({"strategy_registry_path": str(path), "strategy_max_distance": 4})
+    
+    registry.store("https://www.example.com/a", "Extract news", 0b1011, STRATEGY)
+    
+    assert registry.lookup("https://example.com/b", "Extract  news", 0b0011) == STRATEGY
+    assert registry.lookup("https://example.com/b", "Extract news", 0xFF00) is None
+    assert registry.lookup("https://other.com/a", "Extract news", 0b1011) is None
+    
+    reloaded = StrategyRegistry({"strategy_registry_path": str(path), "strategy_max_distance": 4})
+    assert reloaded.lookup("https://example.com/c", "Extract news", 0b1011) == STRATEGY
+    
+    reloaded.ttl = 1
+    for entry in reloaded._entries[StrategyRegistry.key("https://example.com", "Extract news")]:
+        entry["created_at"] -= 10
+    assert reloaded.lookup("https://example.com/c", "Extract news", 0b1011) is None
+
+class FakeStrategyLLM:
+    """Returns a fixed strategy and counts calls."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def agenerate(self, batches):
+        self.calls += 1
+        text = json.dumps(STRATEGY)
+        return SimpleNamespace(generations=[[SimpleNamespace(text=text)]])
+
+@pytest.mark.asyncio
+async def test_agent_plans_once_per_template():
+    """Test that pages of one template share a single planning call."""
+    llm = FakeStrategyLLM()
+    agent = RufusAgent("test-key", config={"llm_cache": False}, backend=ChatModelBackend(llm))
+    page = "<html><body><main><article><h1>{}</h1><p>Body</p></article></main></body></html>"
+    listing = "<html><body><table><tr><td>{}</td></tr></table><form><input></form></body></html>"
+    
+    for i in range(5):
+        strategy = await agent.plan_extraction(f"https://example.com/news/{i}", "Extract news", page.format(i))
+        assert strategy == STRATEGY
+    assert llm.calls == 1
+    
+    await agent.plan_extraction("https://example.com/list", "Extract news", listing.format(1))
+    assert llm.calls == 2
+    assert agent.strategies.stats()["hits"] == 4
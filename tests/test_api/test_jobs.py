@@ -0,0 +1,127 @@
+import asyncio
+import httpx
+import pytest
+from src.api.jobs import FileJobStore, JobManager, MemoryJobStore
+from src.api.main import app, get_job_manager
+
+class SlowClient:
+    """Client whose crawl visits a page every ``delay`` seconds."""
+    
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.visited_urls = set()
+    
+    async def scrape(self, url, instructions, max_depth=2, output_format="json", deadline=None):
+        for n in range(max_depth):
+            await asyncio.sleep(self.delay)
+            self.visited_urls.add(f"{url}page/{n}")
+        return {"url": url, "content": {"paragraphs": [instructions]}, "metadata": {}}
+
+async def wait_for(manager, job_id, statuses=("completed", "failed", "cancelled")):
+    for _ in range(500):
+        job = await manager.get(job_id)
+        if job["status"] in statuses:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+def request(max_depth=3):
+    return {
+        "url": "https://example.com/",
+        "instructions": "Find FAQs",
+        "max_depth": max_depth,
+        "output_format": "json",
+        "deadline": None
+    }
+
+@pytest.mark.asyncio
+async def test_jobs_run_in_background_and_persist(tmp_path):
+    """Test that workers complete queued jobs and their records survive a restart."""
+    manager = JobManager(FileJobStore(str(tmp_path)), SlowClient, workers=2, progress_interval=0.01)
+    await manager.start()
+    try:
+        jobs = [await manager.submit(request()) for _ in range(3)]
+        assert all(job["status"] == "queued" for job in jobs)
+        
+        for job in jobs:
+            done = await wait_for(manager, job["job_id"])
+            assert done["status"] == "completed"
+            assert done["progress"] == 100
+            assert done["pages_crawled"] == 3
+            assert done["result"]["content"]["paragraphs"] == ["Find FAQs"]
+    finally:
+        await manager.stop()
+    
+    reopened = FileJobStore(str(tmp_path))
+    assert await reopened.recover() == 0
+    assert (await reopened.load(jobs[0]["job_id"]))["status"] == "completed"
+
+@pytest.mark.asyncio
+async def test_cancel_running_and_queued_jobs():
+    """Test that cancelling stops a running crawl and skips a queued one."""
+    manager = JobManager(
+        MemoryJobStore(),
+        lambda: SlowClient(delay=0.05),
+        workers=1,
+        progress_interval=0.01
+    )
+    await manager.start()
+    try:
+        running = await manager.submit(request(max_depth=100))
+        queued = await manager.submit(request())
+        await wait_for(manager, running["job_id"], ("running",))
+        
+        assert (await manager.cancel(queued["job_id"]))["status"] == "cancelled"
+        await manager.cancel(running["job_id"])
+        
+        job = await wait_for(manager, running["job_id"])
+        assert job["status"] == "cancelled"
+        assert job["pages_crawled"] < 100
+        assert job["result"] is None
+        assert (await manager.get(queued["job_id"]))["started_at"] is None
+    finally:
+        await manager.stop()
+
+@pytest.mark.asyncio
+async def test_jobs_endpoints():
+    """Test submitting, polling and cancelling jobs over the API."""
+    manager = JobManager(MemoryJobStore(), SlowClient, workers=1, progress_interval=0.01)
+    await manager.start()
+    app.dependency_overrides[get_job_manager] = lambda: manager
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/jobs", json={
+                "url": "https://example.com",
+                "instructions": "Find FAQs",
+                "max_depth": 2
+            })
+            assert response.status_code == 202
+            job_id = response.json()["job_id"]
+            
+            await wait_for(manager, job_id)
+            response = await client.get(f"/jobs/{job_id}")
+            assert response.json()["status"] == "completed"
+            assert response.json()["result"]["url"] == "https://example.com/"
+            
+            assert (await client.get("/jobs/missing")).status_code == 404
+            assert (await client.delete("/jobs/missing")).status_code == 404
+            assert (await client.delete(f"/jobs/{job_id}")).json()["status"] == "completed"
+    finally:
+        app.dependency_overrides.clear()
+        await manager.stop()
+
+@pytest.mark.asyncio
+async def test_finished_jobs_expire(tmp_path):
+    """Test that finished jobs are dropped after the TTL and unfinished ones are kept."""
+    for store in (MemoryJobStore(ttl=0.05), FileJobStore(str(tmp_path), ttl=0.05)):
+        finished = dict(request(), job_id="a1", status="completed")
+        waiting = dict(request(), job_id="b2", status="queued")
+        await store.save(finished)
+        await store.save(waiting)
+        assert (await store.load("a1"))["status"] == "completed"
+        
+        await asyncio.sleep(0.1)
+        assert await store.load("a1") is None
+        assert await store.evict() == 1
+        assert (await store.load("b2"))["status"] == "queued"
@@ -0,0 +1,64 @@
+import json
+import httpx
+import pytest
+from aiohttp import web
+from rufus import RufusClient
+from src.api.main import app, get_rufus_client
+
+@pytest.fixture
+async def site():
+    """Serve two linked pages."""
+    async def index(request):
+        return web.Response(
+            text='<html><body><h1>Index</h1><p>Index content</p><a href="/about">About</a></body></html>',
+            content_type='text/html'
+        )
+    
+    async def about(request):
+        return web.Response(text='<html><body><p>About content</p></body></html>', content_type='text/html')
+    
+    app = web.Application()
+    app.router.add_get('/', index)
+    app.router.add_get('/about', about)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    server = web.TCPSite(runner, '127.0.0.1', 0)
+    await server.start()
+    port = server._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+@pytest.fixture
+async def api():
+    """API client using a Rufus client that needs no configured key."""
+    app.dependency_overrides[get_rufus_client] = lambda: RufusClient(api_key="test-key")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+@pytest.mark.asyncio
+async def test_stream_ndjson(site, api):
+    """Test that the stream sends one JSON event per line."""
+    response = await api.post("/scrape/stream", json={"url": f"{site}/", "instructions": "Extract content"})
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["event"] for event in events] == ["page", "progress", "page", "progress", "done"]
+    assert events[2]["url"] == f"{site}/about"
+    assert events[-1]["metadata"]["pages_crawled"] == 2
+
+@pytest.mark.asyncio
+async def test_stream_sse(site, api):
+    """Test that clients accepting event streams get Server-Sent Events."""
+    response = await api.post(
+        "/scrape/stream",
+        json={"url": f"{site}/", "instructions": "Extract content", "max_depth": 1},
+        headers={"Accept": "text/event-stream"}
+    )
+    
+    assert response.headers["content-type"].startswith("text/event-stream")
+    messages = response.text.strip().split("\n\n")
+    assert [message.splitlines()[0] for message in messages] == ["event: page", "event: progress", "event: done"]
+    assert json.loads(messages[-1].splitlines()[1][len("data: "):])["metadata"]["pages_crawled"] == 1
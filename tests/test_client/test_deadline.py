@@ -0,0 +1,55 @@
+import asyncio
+import pytest
+from aiohttp import web
+from rufus import RufusClient
+
+@pytest.fixture
+async def slow_site():
+    """Serve a fast index page that links to a page that never answers in time."""
+    async def index(request):
+        return web.Response(
+            text='<html><body><h1>Index</h1><p>Fast content</p>'
+                 '<a href="/slow">Slow</a></body></html>',
+            content_type='text/html'
+        )
+    
+    async def slow(request):
+        await asyncio.sleep(2)
+        return web.Response(text='<p>Too late</p>', content_type='text/html')
+    
+    app = web.Application()
+    app.router.add_get('/', index)
+    app.router.add_get('/slow', slow)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+@pytest.mark.asyncio
+async def test_scrape_returns_partial_results_at_deadline(slow_site):
+    """Test that a deadline returns the content gathered so far."""
+    client = RufusClient(api_key="test-key")
+    
+    results = await client.scrape(
+        f"{slow_site}/",
+        "Extract content",
+        max_depth=3,
+        deadline=0.3
+    )
+    
+    assert results["metadata"]["partial"] is True
+    assert results["metadata"]["unfetched"] == [f"{slow_site}/slow"]
+    assert "Fast content" in results["content"]["paragraphs"]
+
+@pytest.mark.asyncio
+async def test_scrape_without_deadline_is_complete(slow_site):
+    """Test that scrapes finishing in time are not marked partial."""
+    client = RufusClient(api_key="test-key")
+    
+    results = await client.scrape(f"{slow_site}/", "Extract content", max_depth=1)
+    
+    assert results["metadata"]["partial"] is False
+    assert results["metadata"]["unfetched"] == []
@@ -0,0 +1,115 @@
+import asyncio
+import pytest
+from aiohttp import web
+from rufus import RufusClient
+
+@pytest.fixture
+async def chain_site():
+    """Serve an endless chain of pages, each linking to the next."""
+    async def page(request):
+        # The client appends root-relative links to the page URL
+        n = request.path.count('/next')
+        return web.Response(
+            text=f'<html><body><h1>Page {n}</h1><p>Content of page {n}</p>'
+                 f'<p>Subscribe to our newsletter for weekly campus updates</p>'
+                 f'<a href="/next">Next</a></body></html>',
+            content_type='text/html'
+        )
+    
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+@pytest.mark.asyncio
+async def test_scrape_stream_yields_pages_then_metadata(chain_site):
+    """Test that pages stream as they are crawled and the stream ends with metadata."""
+    client = RufusClient(api_key="test-key")
+    
+    events = [event async for event in client.scrape_stream(f"{chain_site}/", "Extract content", max_depth=3)]
+    
+    assert [event["event"] for event in events] == ["page", "progress"] * 3 + ["done"]
+    assert events[0]["url"] == f"{chain_site}/"
+    assert {"type": "p", "content": "Content of page 0"}.items() <= events[0]["items"][1].items()
+    assert events[-1]["metadata"]["pages_crawled"] == 3
+    assert events[-1]["metadata"]["partial"] is False
+    assert client.session is None
+
+@pytest.mark.asyncio
+async def test_scrape_stream_backpressure_and_cancel(chain_site):
+    """Test that a slow consumer pauses the crawl and closing the stream cancels it."""
+    client = RufusClient(api_key="test-key", config={"stream_buffer": 1})
+    events = client.scrape_stream(f"{chain_site}/", "Extract content", max_depth=50)
+    
+    first = await events.__anext__()
+    assert first["event"] == "page"
+    await asyncio.sleep(0.3)
+    # One page handed over, one buffered and one waiting for room
+    assert len(client.visited_urls) <= 3
+    
+    await events.aclose()
+    visited = len(client.visited_urls)
+    await asyncio.sleep(0.1)
+    assert len(client.visited_urls) == visited
+    assert client.session is None
+
+@pytest.mark.asyncio
+async def test_scrape_stream_suppresses_boilerplate_like_scrape(chain_site):
+    """Test that streamed pages drop repeated blocks, including pages held for warm-up."""
+    config = {"boilerplate_threshold": 0.5, "boilerplate_warmup": 3}
+    client = RufusClient(api_key="test-key", config=config)
+    
+    events = [event async for event in client.scrape_stream(f"{chain_site}/", "Extract content", max_depth=4)]
+    texts = [item["content"] for event in events if event["event"] == "page" for item in event["items"]]
+    batch = await RufusClient(api_key="test-key", config=config).scrape(f"{chain_site}/", "Extract content", max_depth=4)
+    
+    assert texts.count("Subscribe to our newsletter for weekly campus updates") == 1
+    assert [text for text in texts if text.startswith("Content of page")] == [f"Content of page {n}" for n in range(4)]
+    assert batch["content"]["paragraphs"].count("Subscribe to our newsletter for weekly campus updates") == 1
+    assert events[-1]["metadata"]["boilerplate"]["suppressed"] == 3
+
+@pytest.mark.asyncio
+async def test_scraped_content_is_indexed_only_when_asked(chain_site, tmp_path):
+    """Test that indexing is opt-in and an index_path is shared by appending segments."""
+    client = RufusClient(api_key="test-key")
+    await client.scrape(f"{chain_site}/", "Extract content", max_depth=2)
+    
+    assert client.index is None
+    with pytest.raises(ValueError):
+        client.search("content")
+    
+    config = {"index_path": str(tmp_path / "index")}
+    reader = RufusClient(api_key="test-key", config=config)
+    assert reader.search("content") == []
+    
+    await RufusClient(api_key="test-key", config=config).scrape(f"{chain_site}/", "Extract content", max_depth=2)
+    assert "Content of page 1" in [hit["content"] for hit in reader.search("content page")]
+    
+    await RufusClient(api_key="test-key", config=config).scrape(f"{chain_site}/next/next", "Extract content", max_depth=1)
+    assert "Content of page 2" in [hit["content"] for hit in reader.search("content page")]
+    assert len(reader.search("newsletter")) == 3
+
+@pytest.mark.asyncio
+async def test_client_crawls_are_independent(chain_site):
+    """Test that a reused client crawls again and concurrent scrapes keep their own results."""
+    client = RufusClient(api_key="test-key")
+    first = await client.scrape(f"{chain_site}/", "Extract content", max_depth=2)
+    again = await client.scrape(f"{chain_site}/", "Extract content", max_depth=2)
+    
+    assert again["content"] == first["content"]
+    assert again["metadata"]["pages_crawled"] == 2
+    
+    results = await asyncio.gather(
+        client.scrape(f"{chain_site}/", "Extract content", max_depth=1),
+        client.scrape(f"{chain_site}/next/next", "Extract content", max_depth=1)
+    )
+    
+    assert [result["content"]["paragraphs"][0] for result in results] == [
+        "Content of page 0", "Content of page 2"
+    ]
+    assert [result["metadata"]["pages_crawled"] for result in results] == [1, 1]
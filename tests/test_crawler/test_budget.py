@@ -0,0 +1,35 @@
+from rufus.crawler.budget import CrawlBudget, NoveltyMonitor
+
+def test_budget_page_limit():
+    """Test that page reservations stop at max_pages."""
+    budget = CrawlBudget(max_pages=2)
+    
+    assert budget.reserve_page()
+    assert budget.reserve_page()
+    assert not budget.reserve_page()
+    assert budget.stats()["stop_reason"] == "max_pages"
+
+def test_budget_byte_and_time_limits():
+    """Test byte and deadline limits."""
+    budget = CrawlBudget(max_bytes=100)
+    budget.record_bytes(150)
+    assert budget.exhausted()
+    
+    budget = CrawlBudget(time_limit=0)
+    assert budget.exhausted()
+    assert budget.stop_reason == "deadline"
+
+def test_novelty_monitor_saturation():
+    """Test that repeated pages end the crawl."""
+    monitor = NoveltyMonitor(threshold=0.2, window=3, min_pages=1)
+    
+    assert monitor.observe(["intro", "pricing"]) == 1.0
+    assert monitor.observe(["intro", "careers"]) == 0.5
+    assert not monitor.saturated()
+    
+    for _ in range(3):
+        novelty = monitor.observe(["intro", "pricing"])
+    
+    assert novelty == 0.0
+    assert not monitor.is_novel(novelty)
+    assert monitor.saturated()
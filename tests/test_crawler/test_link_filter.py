@@ -0,0 +1,49 @@
+from rufus.crawler import LinkFilter
+
+def test_link_filter_same_domain_default():
+    """Test default domain scoping, resolution and deduplication."""
+    link_filter = LinkFilter("https://example.com/docs/")
+    
+    links = link_filter.filter(
+        [
+            "/about",
+            "guide#install",
+            "guide",
+            "https://other.com/page",
+            "mailto:team@example.com",
+            "https://example.com/contact",
+        ],
+        "https://example.com/docs/"
+    )
+    
+    assert links == [
+        "https://example.com/about",
+        "https://example.com/docs/guide",
+        "https://example.com/contact",
+    ]
+
+def test_link_filter_rules():
+    """Test allow/deny rules, extensions and URL-shaped ignore patterns."""
+    link_filter = LinkFilter.from_config(
+        "https://example.com/",
+        {
+            "link_scope": "subdomains",
+            "allow_patterns": ["/blog/*", "re:/news/\\d+"],
+            "deny_extensions": ["pdf"],
+            "ignore_patterns": ["nav", "/blog/drafts/"],
+        }
+    )
+    
+    assert link_filter.accept("https://www.example.com/blog/post")
+    assert link_filter.accept("https://example.com/news/42")
+    assert not link_filter.accept("https://example.com/about")
+    assert not link_filter.accept("https://example.com/blog/report.pdf")
+    assert not link_filter.accept("https://example.com/blog/drafts/wip")
+    assert not link_filter.accept("https://badexample.com/blog/post")
+
+def test_link_filter_prefix_scope():
+    """Test prefix scoping relative to the crawl root."""
+    link_filter = LinkFilter("https://example.com/docs/index.html", scope="prefix")
+    
+    assert link_filter.accept("https://example.com/docs/api")
+    assert not link_filter.accept("https://example.com/blog")
@@ -0,0 +1,57 @@
+from rufus.extractors.fingerprint import skeleton_paths, template_fingerprint
+from rufus.utils.hashing import hamming_distance
+
+ARTICLE = """
+<html><body>
+<header class="site-header"><nav><a href="/">Home</a> <a href="/news">News</a></nav></header>
+<main>
+    <article class="post post-{id}">
+        <h1>{title}</h1>
+        <p class="byline">By {author}</p>
+        {paragraphs}
+    </article>
+    <aside class="related"><ul><li><a href="/1">Related</a></li></ul></aside>
+</main>
+<footer><p>Copyright Example</p></footer>
+<script>var id = {id};</script>
+</body></html>
+"""
+
+LISTING = """
+<html><body>
+<header class="site-header"><nav><a href="/">Home</a></nav></header>
+<main>
+    <form class="search"><input name="q"><button>Go</button></form>
+    <table class="results">
+        <thead><tr><th>Name</th><th>Price</th></tr></thead>
+        <tbody>{rows}</tbody>
+    </table>
+    <div class="pager"><span>1</span><a href="?page=2">Next</a></div>
+</main>
+</body></html>
+"""
+
+def article(page_id, paragraphs):
+    return ARTICLE.format(
+        id=page_id,
+        title=f"Story {page_id}",
+        author="Staff",
+        paragraphs="".join(f"<p>Paragraph {i} of story {page_id}.</p>" for i in range(paragraphs))
+    )
+
+def test_skeleton_ignores_text_repetition_and_scripts():
+    """Test that skeleton paths depend only on structure."""
+    paths = skeleton_paths(article(17, 3))
+    
+    assert paths == skeleton_paths(article(2048, 12))
+    assert '/html/body/main/article.post.post-#/p' in paths
+    assert not any('script' in path for path in paths)
+
+def test_fingerprint_separates_templates():
+    """Test that pages of one template are closer than pages of different templates."""
+    first = template_fingerprint(article(1, 2))
+    second = template_fingerprint(article(2, 9))
+    listing = template_fingerprint(LISTING.format(rows="<tr><td>A</td><td>1</td></tr>" * 5))
+    
+    assert hamming_distance(first, second) == 0
+    assert hamming_distance(first, listing) > 8
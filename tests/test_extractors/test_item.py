@@ -0,0 +1,42 @@
+import json
+from bs4 import BeautifulSoup
+from rufus.extractors.item import ContentItem, ElementMeta
+from rufus.utils import json_default
+
+def test_content_item_behaves_like_dict():
+    """Test that items keep the plain dict shape and interface."""
+    element = BeautifulSoup('<div><p class="lead" id="intro" data-x="1">Hi</p></div>', 'html.parser').p
+    item = ContentItem("p", "Hi", ElementMeta.from_element(element), selectors=["p.lead"])
+    
+    assert item["content"] == "Hi"
+    assert item.get("url") is None
+    assert "selectors" in item and "url" not in item
+    assert item["metadata"] == {
+        "tag": "p",
+        "classes": ["lead"],
+        "id": "intro",
+        "attributes": {},
+        "parent_tag": "div"
+    }
+    
+    item["metadata"]["relevance"] = 0.9
+    assert item["metadata"]["relevance"] == 0.9
+    assert item == {**item.to_dict()}
+
+def test_attributes_are_opt_in():
+    """Test that attributes are only copied when requested."""
+    element = BeautifulSoup('<p data-x="1">Hi</p>', 'html.parser').p
+    
+    assert ElementMeta.from_element(element).attributes is None
+    assert ElementMeta.from_element(element, attributes=True).attributes == {"data-x": "1"}
+
+def test_items_serialize_with_json_default():
+    """Test that items serialize to JSON through json_default."""
+    item = ContentItem("h1", "Title", url="https://example.com", heading_path=("Docs",))
+    
+    assert json.loads(json.dumps([item], default=json_default)) == [{
+        "type": "h1",
+        "content": "Title",
+        "url": "https://example.com",
+        "heading_path": ["Docs"]
+    }]
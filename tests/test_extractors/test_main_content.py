@@ -0,0 +1,59 @@
+from rufus import RufusClient
+from rufus.crawler.async_crawler import AsyncCrawler
+from rufus.extractors.main_content import MainContentDetector
+
+PAGE = """
+<html><body>
+<header class="site-header"><nav><a href="/">Home</a> <a href="/about">About us</a></nav></header>
+<div class="cookie-banner"><p>We use cookies to improve your experience, please accept them.</p></div>
+<div id="content">
+    <article class="post">
+        <h1>Launch Day</h1>
+        <p>The first paragraph of the story has plenty of text, commas, and detail.</p>
+        <div class="share"><a href="/x">Share on X</a> <a href="/f">Share on Facebook</a></div>
+        <p>A second paragraph continues the story with more context, quotes, and facts.</p>
+    </article>
+    <aside class="related"><ul><li><a href="/1">Related article one</a></li></ul></aside>
+</div>
+<footer><p>Copyright 2024 Example Corp, all rights reserved, terms apply here.</p></footer>
+</body></html>
+"""
+
+def test_detects_main_region_and_prunes_boilerplate():
+    """Test that the article is kept and share links are pruned."""
+    region, skip, report = MainContentDetector().detect_html(PAGE)
+    
+    assert region.name == 'article'
+    assert report['detected']
+    assert report['pruned_blocks'] == 1
+    assert 0 < report['kept_ratio'] < 1
+
+def test_crawler_extracts_only_main_content():
+    """Test that crawler extraction skips navigation, banners and footers."""
+    crawler = AsyncCrawler({'main_content': True})
+    items = crawler._extract_from_html(PAGE, None, url="https://example.com/post")
+    texts = " ".join(item['content'] for item in items)
+    
+    assert "first paragraph" in texts and "second paragraph" in texts
+    assert "cookies" not in texts and "Copyright" not in texts
+    assert items[-1]['heading_path'] == ['Launch Day']
+    assert "https://example.com/post" in crawler.main_content_reports
+
+def test_headings_before_the_region_are_kept():
+    """Test that a title placed next to the content block is not dropped."""
+    html = """
+    <html><body>
+    <div class="post">
+        <h1>Release notes for version two</h1>
+        <div class="entry-content">
+            <p>Version two rewrites the parser, adds streaming output, and fixes many bugs.</p>
+            <p>Upgrading is simple: install the new release, rerun your crawls, and compare.</p>
+        </div>
+    </div>
+    <div class="sidebar"><a href="/a">Archive</a> <a href="/b">Tags</a></div>
+    </body></html>
+    """
+    items = RufusClient('k')._extract_content(html)
+    
+    assert ('h1', 'Release notes for version two') in [(item['type'], item['content']) for item in items]
+    assert not any('Archive' in item['content'] for item in items)
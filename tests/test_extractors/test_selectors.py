@@ -0,0 +1,42 @@
+from bs4 import BeautifulSoup
+from rufus.extractors.selectors import compile_selector, get_selector_plan
+
+def test_selector_plans_are_cached():
+    """Test that plans and compiled selectors are shared across pages."""
+    assert get_selector_plan(["p.price", "h2"]) is get_selector_plan(["p.price", "h2"])
+    assert compile_selector("p.price") is compile_selector("p.price")
+    assert compile_selector("p{color:red}") is None
+
+def test_selector_plan_tags_matches():
+    """Test that one traversal tags each match with its selectors."""
+    soup = BeautifulSoup(
+        "<h1>Shop</h1><div class='card'><h2>Lamp</h2>"
+        "<p class='price'>$20</p><p>Bright</p></div>",
+        "html.parser"
+    )
+    plan = get_selector_plan([".card p", "p.price", "bad{"])
+    
+    items = plan.extract(soup, str.strip, lambda element: {})
+    
+    assert plan.selectors == (".card p", "p.price")
+    assert [item["content"] for item in items] == ["$20", "Bright"]
+    assert items[0]["selectors"] == [".card p", "p.price"]
+    assert items[1]["selectors"] == [".card p"]
+    assert items[0]["heading_path"] == ["Shop", "Lamp"]
+
+def test_selector_plan_falls_back_to_public_matching(monkeypatch):
+    """Test that an incompatible private soupsieve matcher falls back to the public API."""
+    from rufus.extractors import selectors
+    
+    def broken_matcher(*args):
+        raise TypeError("unexpected signature")
+    
+    monkeypatch.setattr(selectors, "CSSMatch", broken_matcher)
+    monkeypatch.setattr(selectors, "_use_private_matcher", True)
+    soup = BeautifulSoup("<div class='card'><p class='price'>$20</p><p>Bright</p></div>", "html.parser")
+    plan = get_selector_plan([".card p", "p.price"])
+    
+    items = plan.extract(soup, str.strip, lambda element: {})
+    
+    assert [item["selectors"] for item in items] == [[".card p", "p.price"], [".card p"]]
+    assert selectors._use_private_matcher is False
@@ -0,0 +1,90 @@
+import pytest
+from rufus.extractors import StructuredExtractor, extract_structured_data
+from rufus.extractors.item import item_text
+
+PRODUCT_PAGE = """
+<html><head>
+<title>Widget</title>
+<meta property="og:title" content="Acme Widget">
+<meta property="og:type" content="product">
+<meta property="og:image" content="/a.png"><meta property="og:image" content="/b.png">
+<meta name="description" content="The best   widget">
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@graph": [
+    {"@type": "Product", "name": "Widget",
+     "offers": {"@type": "Offer", "price": "19.99", "availability": "https://schema.org/InStock"}},
+    {"@type": "Organization", "name": "Acme"}
+]}
+</script>
+<script type="application/ld+json">{not json</script>
+</head><body>
+<div itemscope itemtype="https://schema.org/Event">
+    <h2 itemprop="name">Launch</h2>
+    <time itemprop="startDate" datetime="2024-05-01T10:00">May 1</time>
+    <div itemprop="location" itemscope itemtype="https://schema.org/Place"><span itemprop="name">Hall A</span></div>
+    <a itemprop="url" href="/launch">Details</a>
+</div>
+<div vocab="https://schema.org/" typeof="Person">
+    <span property="name">Ada</span> <span property="jobTitle">Engineer</span>
+    <meta property="birthDate" content="1815-12-10">
+</div>
+<table><tr><th>Plan</th></tr><tr><td>Pro</td></tr></table>
+</body></html>
+"""
+
+def structured(items):
+    return {(item["format"], item["schema_type"]): item["data"] for item in items if item["type"] == "structured"}
+
+@pytest.mark.asyncio
+async def test_structured_extractor_normalizes_embedded_data():
+    """Test JSON-LD, microdata, RDFa and meta extraction alongside tables."""
+    results = await StructuredExtractor().extract(PRODUCT_PAGE)
+    data = structured(results)
+    
+    assert data[("json-ld", "Product")]["offers"] == {"@type": "Offer", "price": "19.99", "availability": "InStock"}
+    assert data[("json-ld", "Organization")] == {"@type": "Organization", "name": "Acme"}
+    assert data[("microdata", "Event")] == {
+        "@type": "Event",
+        "name": "Launch",
+        "startDate": "2024-05-01T10:00",
+        "location": {"@type": "Place", "name": "Hall A"},
+        "url": "/launch"
+    }
+    assert data[("rdfa", "Person")] == {"@type": "Person", "name": "Ada", "jobTitle": "Engineer", "birthDate": "1815-12-10"}
+    assert data[("meta", "product")]["image"] == ["/a.png", "/b.png"]
+    assert data[("meta", "product")]["description"] == "The best widget"
+    assert len(data) == 5
+    assert [r["rows"] for r in results if r["type"] == "table"] == [[["Pro"]]]
+
+@pytest.mark.asyncio
+async def test_structured_data_can_be_disabled():
+    """Test that the structured_data config key turns embedded data off."""
+    results = await StructuredExtractor({"structured_data": False}).extract(PRODUCT_PAGE)
+    
+    assert [r["type"] for r in results] == ["table"]
+
+def test_extract_structured_data_tags_url():
+    """Test standalone extraction and the searchable text of structured items."""
+    items = extract_structured_data(PRODUCT_PAGE, "https://example.com/widget")
+    
+    assert {item["url"] for item in items} == {"https://example.com/widget"}
+    assert "offers.price: 19.99" in item_text(items[0]).splitlines()
+
+def test_json_ld_keeps_links_and_embedded_markup():
+    """Test that only types and enumeration members lose the schema.org namespace."""
+    script = """<!--<![CDATA[
+    {"@context": "https://schema.org", "@type": "https://schema.org/Organization",
+     "url": "https://schema.org/", "sameAs": ["https://schema.org/Acme"],
+     "slogan": "Comments look like <!-- this -->", "status": "https://schema.org/Active"}
+    ]]>-->"""
+    page = f'<script type="application/ld+json">{script}</script>'
+    
+    data = extract_structured_data(page)[0]["data"]
+    
+    assert data == {
+        "@type": "Organization",
+        "url": "https://schema.org/",
+        "sameAs": ["https://schema.org/Acme"],
+        "slogan": "Comments look like <!-- this -->",
+        "status": "Active"
+    }
@@ -0,0 +1,50 @@
+import pytest
+from bs4 import BeautifulSoup
+from rufus.extractors import StructuredExtractor
+from rufus.extractors.tables import TableColumn, TableGrid
+
+PRICING = """
+<table>
+    <thead>
+        <tr><th rowspan="2">Plan</th><th colspan="2">Price</th><th rowspan="2">Launched</th><th rowspan="2">Share</th></tr>
+        <tr><th>Monthly</th><th>Yearly</th></tr>
+    </thead>
+    <tbody>
+        <tr><td>Basic</td><td>$9</td><td>$90</td><td>2021-03-01</td><td>12.5%</td></tr>
+        <tr><td rowspan="2">Pro</td><td>$1,299.50/mo</td><td>Free</td><td>May 1, 2022</td><td>(3)%</td></tr>
+        <tr><td>$49</td><td>$490</td><td>1/15/2023</td><td>40 %</td></tr>
+    </tbody>
+</table>
+"""
+
+def test_grid_expands_spans_and_stacks_headers():
+    """Test colspan/rowspan expansion and multi-row header labels."""
+    grid = TableGrid.from_element(BeautifulSoup(PRICING, "html.parser").table, lambda cell: cell.get_text(strip=True))
+    
+    assert grid.header_rows == 2
+    assert grid.headers == ["Plan", "Price / Monthly", "Price / Yearly", "Launched", "Share"]
+    assert [row[0] for row in grid.body] == ["Basic", "Pro", "Pro"]
+    assert all(len(row) == 5 for row in grid.body)
+
+@pytest.mark.asyncio
+async def test_table_columns_are_typed():
+    """Test currency, date and percent columns, and columns left as strings."""
+    table = (await StructuredExtractor().extract(PRICING))[0]
+    columns = {column.name: column for column in table["columns"]}
+    
+    assert columns["Plan"].type == "string"
+    assert (columns["Price / Monthly"].type, columns["Price / Monthly"].unit) == ("currency", "USD")
+    assert columns["Price / Monthly"].to_list() == [9.0, 1299.5, 49.0]
+    assert columns["Price / Yearly"].type == "string"
+    assert columns["Launched"].to_list() == ["2021-03-01", "2022-05-01", "2023-01-15"]
+    assert columns["Share"].to_list() == [0.125, -0.03, 0.4]
+
+def test_integer_columns_and_missing_values():
+    """Test integer inference and missing cells in numeric columns."""
+    assert TableColumn.infer("Count", ["1,200", "35", "-4"]).to_dict() == {
+        "name": "Count", "type": "integer", "unit": None, "values": [1200, 35, -4]
+    }
+    column = TableColumn.infer("Score", ["1.5", "", "2", "n/a", "3", "4", "5"])
+    
+    assert column.type == "number"
+    assert column.to_list() == [1.5, None, 2.0, None, 3.0, 4.0, 5.0]
@@ -0,0 +1,44 @@
+import pytest
+from rufus.extractors import ContentExtractor, StructuredExtractor
+
+NESTED_HTML = """
+<html>
+    <body>
+        <h1>Guide</h1>
+        <p>Intro</p>
+        <h2>Setup</h2>
+        <ul>
+            <li>Install</li>
+            <li>Configure<ul><li>Set key</li></ul></li>
+        </ul>
+        <table>
+            <tr><th>Plan</th></tr>
+            <tr><td>Pro<table><tr><td>Nested</td></tr></table></td></tr>
+        </table>
+        <h2>Usage</h2>
+        <p>Run it</p>
+    </body>
+</html>
+"""
+
+@pytest.mark.asyncio
+async def test_content_extraction_keeps_order_and_headings():
+    """Test document order and heading context of extracted text."""
+    results = await ContentExtractor().extract(NESTED_HTML)
+    
+    assert [r["content"] for r in results] == ["Guide", "Intro", "Setup", "Usage", "Run it"]
+    assert results[1]["heading_path"] == ["Guide"]
+    assert results[4]["heading_path"] == ["Guide", "Usage"]
+
+@pytest.mark.asyncio
+async def test_structured_extraction_does_not_double_count():
+    """Test that nested lists and tables are extracted separately."""
+    results = await StructuredExtractor().extract(NESTED_HTML)
+    
+    lists = [r for r in results if r["type"] == "list"]
+    tables = [r for r in results if r["type"] == "table"]
+    
+    assert [l["items"] for l in lists] == [["Install", "Configure"], ["Set key"]]
+    assert [t["rows"] for t in tables] == [[["Pro"]], [["Nested"]]]
+    assert tables[0]["headers"] == ["Plan"]
+    assert lists[0]["heading_path"] == ["Guide", "Setup"]
@@ -0,0 +1,34 @@
+from rufus.extractors import ContentItem
+from rufus.processors import BlockFrequencyIndex
+
+def make_pages(count):
+    """Build pages that share a newsletter block but have unique bodies."""
+    items = []
+    for page in range(count):
+        url = f"https://example.com/{page}"
+        items.append(ContentItem("p", f"Unique article body number {page}", url=url))
+        items.append(ContentItem("p", "Subscribe to our newsletter", url=url))
+    return items
+
+def test_stream_suppresses_repeated_blocks_after_warmup():
+    """Test that a site-wide block is emitted once and then suppressed."""
+    index = BlockFrequencyIndex({"boilerplate_threshold": 0.5, "boilerplate_warmup": 3})
+    
+    output = list(index.stream(make_pages(6)))
+    texts = [item["content"] for item in output]
+    
+    assert texts.count("Subscribe to our newsletter") == 1
+    assert sum(text.startswith("Unique") for text in texts) == 6
+    assert index.stats()["suppressed"] == 5
+
+def test_reference_mode_links_repeats_to_first_block():
+    """Test that reference mode replaces repeats with block references."""
+    index = BlockFrequencyIndex({"boilerplate_threshold": 0.5, "boilerplate_mode": "reference"})
+    
+    output = index.filter(make_pages(4))
+    first = next(item for item in output if item.get("content") == "Subscribe to our newsletter")
+    refs = [item for item in output if item["type"] == "boilerplate_ref"]
+    
+    assert len(refs) == 3
+    assert all(ref["block"] == first["block"] for ref in refs)
+    assert refs[0]["url"] == "https://example.com/1"
@@ -0,0 +1,32 @@
+from rufus.extractors import ContentItem
+from rufus.processors import Chunker
+
+def test_chunks_respect_size_sections_and_pages():
+    """Test chunk sizing, heading breadcrumbs and page boundaries."""
+    items = [
+        ContentItem("h1", "Benefits", url="https://a.com", heading_path=()),
+        ContentItem("p", "Health insurance is included. " * 4, url="https://a.com", heading_path=("Benefits",)),
+        ContentItem("h2", "Dental", url="https://a.com", heading_path=("Benefits",)),
+        ContentItem("p", "Cleanings are covered twice a year.", url="https://a.com", heading_path=("Benefits", "Dental")),
+        ContentItem("p", "Other page.", url="https://b.com", heading_path=())
+    ]
+    
+    chunks = list(Chunker({"chunk_size": 50, "chunk_overlap": 10}).chunk(items))
+    
+    assert [chunk["heading_path"] for chunk in chunks] == [
+        ["Benefits"], ["Benefits", "Dental"], []
+    ]
+    assert chunks[1]["content"].startswith("Dental\n\nCleanings")
+    assert [chunk["chunk_index"] for chunk in chunks] == [0, 1, 0]
+    assert all(chunk["tokens"] <= 50 for chunk in chunks)
+
+def test_long_items_split_with_overlap_and_offsets():
+    """Test that oversized items become overlapping windows with exact offsets."""
+    text = " ".join(f"w{i:03d}" for i in range(100))
+    chunker = Chunker({"chunk_size": 30, "chunk_overlap": 6}, token_counter=lambda s: len(s.split()))
+    
+    chunks = list(chunker.chunk([ContentItem("p", text, url="https://a.com")]))
+    
+    assert len(chunks) == 4
+    assert all(chunk["content"] == text[chunk["start"]:chunk["end"]] for chunk in chunks)
+    assert chunks[1]["content"].startswith("w024")
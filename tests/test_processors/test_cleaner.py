@@ -0,0 +1,23 @@
+from rufus.processors.cleaner import ContentCleaner, clean_text, special_ratio
+
+def test_clean_text_fast_and_markup_paths():
+    """Test that plain text and markup are cleaned the same way."""
+    assert clean_text("  Pricing:\n  $49 / month!  ") == "Pricing 49 month!"
+    assert clean_text("<p>Fish &amp; <b>chips</b></p>") == "Fish chips"
+    assert clean_text("Café — naïve résumé") == "Café naïve résumé"
+
+def test_clean_batch_updates_tables_and_drops_noise():
+    """Test batch cleaning of text and table items."""
+    content = [
+        {"type": "p", "content": "<p>Open roles in HR</p>"},
+        {"type": "p", "content": "!!"},
+        {"type": "table", "headers": ["<b>Plan</b>"], "rows": [["Pro &amp; Team", "$49"]]}
+    ]
+    
+    cleaned = ContentCleaner().clean(content)
+    
+    assert [item["type"] for item in cleaned] == ["p", "table"]
+    assert cleaned[0]["content"] == "Open roles in HR"
+    assert cleaned[1]["headers"] == ["Plan"]
+    assert cleaned[1]["rows"] == [["Pro Team", "49"]]
+    assert special_ratio("a.b,c") == 0.4
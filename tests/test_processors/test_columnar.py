@@ -0,0 +1,51 @@
+import pytest
+from rufus.extractors import ContentItem, ElementMeta
+from rufus.processors import columnar
+from rufus.processors.sinks import open_sink
+
+ITEMS = [
+    ContentItem("h1", "Plans", ElementMeta("h1"), url="https://example.com", depth=0, heading_path=()),
+    ContentItem("p", "Pro is $49", ElementMeta("p"), url="https://example.com", depth=0, heading_path=("Plans",)),
+    {"type": "table", "headers": ["Plan"], "rows": [["Pro"]], "url": "https://example.com/b", "depth": 1}
+]
+
+@pytest.mark.parametrize("format", ["parquet", "feather"])
+def test_columnar_round_trip(tmp_path, format):
+    """Test that batches written incrementally read back with encoded columns."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / f"crawl.{format}"
+    
+    with open_sink(format, path, batch_size=2) as sink:
+        sink.write_many(ITEMS)
+    
+    table = columnar.read_columnar(path)
+    rows = table.to_pylist()
+    
+    assert table.schema.field("url").type.value_type == "string"
+    assert [row["tag"] for row in rows] == ["h1", "p", None]
+    assert rows[1]["heading_path"] == ["Plans"]
+    assert rows[2]["text"] == "Plan\nPro"
+    assert rows[2]["depth"] == 1
+    assert rows[0]["content_hash"] != rows[1]["content_hash"]
+
+def test_missing_pyarrow_raises_clear_error(tmp_path, monkeypatch):
+    """Test the error raised when pyarrow is not installed."""
+    monkeypatch.setattr(columnar, "pa", None)
+    
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        open_sink("parquet", tmp_path / "crawl.parquet")
+
+def test_parquet_size_grows_linearly(tmp_path):
+    """Test that Parquet row groups only carry their own dictionary values."""
+    pytest.importorskip("pyarrow")
+    
+    def export(count):
+        path = tmp_path / f"crawl-{count}.parquet"
+        with open_sink("parquet", path, batch_size=100) as sink:
+            sink.write_many(
+                {"type": "p", "content": f"Item {n}", "url": f"https://example.com/{n // 10}"}
+                for n in range(count)
+            )
+        return path.stat().st_size
+    
+    assert export(20000) < 15 * export(2000)
@@ -0,0 +1,47 @@
+import csv
+import io
+import json
+from rufus.extractors import ContentItem
+from rufus.processors import CSVSink, JSONLinesSink, MarkdownSink
+
+ITEMS = [
+    ContentItem("h1", "Plans", url="https://example.com", heading_path=()),
+    ContentItem("p", 'Say "hi", then\nleave', url="https://example.com", heading_path=("Plans",)),
+    {"type": "table", "headers": ["Plan", "Price"], "rows": [["Pro", "$49"]]}
+]
+
+def test_jsonl_sink_flushes_through_small_buffer():
+    """Test that JSON Lines output is written incrementally."""
+    stream = io.StringIO()
+    sink = JSONLinesSink(stream, buffer_size=16)
+    sink.write(ITEMS[0])
+    
+    assert stream.getvalue()
+    sink.write_many(ITEMS[1:])
+    sink.close()
+    
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert lines[1]["heading_path"] == ["Plans"]
+    assert sink.items_written == 3
+
+def test_csv_sink_writes_rfc4180():
+    """Test quoting, CRLF records and table rows in CSV output."""
+    stream = io.StringIO()
+    with CSVSink(stream) as sink:
+        sink.write_many(ITEMS)
+    
+    output = stream.getvalue()
+    assert output.startswith("type,content,url,heading_path\r\n")
+    rows = list(csv.reader(io.StringIO(output, newline="")))
+    assert rows[2][1] == 'Say "hi", then\nleave'
+    assert rows[3][:2] == ["table_row", '["Pro", "$49"]']
+
+def test_markdown_sink_renders_headings_and_tables():
+    """Test Markdown output for headings, paragraphs and tables."""
+    stream = io.StringIO()
+    with MarkdownSink(stream) as sink:
+        sink.write_many(ITEMS)
+    
+    output = stream.getvalue()
+    assert "# Plans\n" in output
+    assert "| Plan | Price |\n| --- | --- |\n| Pro | $49 |" in output
@@ -0,0 +1,32 @@
+import pytest
+from rufus.extractors import StructuredExtractor
+from rufus.processors.synthesizer import ContentSynthesizer
+
+PAGE = """
+<h1>Pricing</h1>
+<table>
+    <tr><th>Plan</th><th>Price</th></tr>
+    <tr><td>Basic</td><td>$9</td></tr>
+    <tr><td>Pro | Team</td><td>$49</td></tr>
+</table>
+<ul><li>Cancel anytime</li></ul>
+"""
+
+@pytest.mark.asyncio
+async def test_synthesizer_groups_tables_with_typed_columns():
+    """Test that extracted tables and lists reach their processors."""
+    content = await StructuredExtractor().extract(PAGE)
+    result = await ContentSynthesizer().synthesize(content)
+    tables = result["content"]["tables"]
+    
+    assert tables[0]["headers"] == ["Plan", "Price"]
+    assert tables[0]["columns"][1] == {"name": "Price", "type": "currency", "unit": "USD", "values": [9.0, 49.0]}
+    assert result["content"]["lists"][0]["items"] == ["Cancel anytime"]
+
+@pytest.mark.asyncio
+async def test_synthesizer_renders_markdown_tables():
+    """Test Markdown output for tables."""
+    content = await StructuredExtractor().extract(PAGE)
+    result = await ContentSynthesizer().synthesize(content, format="markdown")
+    
+    assert "| Plan | Price |\n| --- | --- |\n| Basic | $9 |\n| Pro \\| Team | $49 |" in result["content"]
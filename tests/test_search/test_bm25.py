@@ -0,0 +1,84 @@
+import os
+import rufus.search.bm25 as bm25
+from rufus.extractors import ContentItem
+from rufus.search import BM25Index, IndexSink
+
+ITEMS = [
+    ContentItem("p", "Apply for financial aid before the March deadline", url="https://example.com/aid",
+                heading_path=("Admissions", "Financial Aid")),
+    ContentItem("p", "Campus housing is assigned in the summer", url="https://example.com/housing"),
+    ContentItem("p", "Tuition and financial planning for graduate students", url="https://example.com/tuition"),
+    ContentItem("h1", "Welcome", url="https://example.com/")
+]
+
+def test_search_ranks_matching_blocks():
+    """Test that BM25 ranks the block matching more query terms first."""
+    index = BM25Index()
+    assert index.add_many(ITEMS) == 4
+    
+    results = index.search("financial aid deadline", k=2)
+    
+    assert [r["url"] for r in results] == ["https://example.com/aid", "https://example.com/tuition"]
+    assert results[0]["heading_path"] == ["Admissions", "Financial Aid"]
+    assert results[0]["score"] > results[1]["score"]
+    assert index.search("the", k=5) == []
+
+def test_numpy_and_python_scoring_agree(monkeypatch):
+    """Test that the pure-Python fallback returns the same ranking."""
+    index = BM25Index()
+    index.add_many(ITEMS)
+    expected = index.search("financial housing", k=3)
+    
+    monkeypatch.setattr(bm25, "np", None)
+    
+    assert index.search("financial housing", k=3) == expected
+
+def test_saved_index_loads_and_keeps_growing(tmp_path):
+    """Test that an index written to disk can be reloaded and extended."""
+    with IndexSink() as sink:
+        sink.write_many(ITEMS[:2])
+    sink.index.save(tmp_path / "index")
+    
+    loaded = BM25Index.load(tmp_path / "index")
+    loaded.add(ITEMS[2])
+    
+    assert len(loaded) == 3
+    assert loaded.search("housing")[0]["url"] == "https://example.com/housing"
+    assert loaded.search("tuition")[0]["doc_id"] == 2
+
+def test_rescraped_items_are_not_indexed_twice(tmp_path):
+    """Test that a deduplicating index skips repeated items across saves and reloads."""
+    index = BM25Index(deduplicate=True)
+    assert index.add_many(ITEMS) == 4
+    assert index.add_many(ITEMS) == 0
+    index.save(tmp_path / "index")
+    index.add(ITEMS[0])
+    index.save(tmp_path / "index")
+    
+    loaded = BM25Index.load(tmp_path / "index")
+    
+    assert len(loaded) == 4
+    assert loaded.add_many(ITEMS) == 0
+    assert sorted(name.split(".")[0] for name in os.listdir(tmp_path / "index")) == [
+        "digests", "documents", "lengths", "lock", "meta", "postings", "terms"
+    ]
+
+def test_appended_segments_are_shared_between_writers(tmp_path):
+    """Test that writers append segments to a shared directory and readers pick them up."""
+    path = tmp_path / "index"
+    assert BM25Index.append(path, ITEMS[:2]) == 2
+    reader = BM25Index.load(path)
+    
+    assert BM25Index.append(path, ITEMS) == 2
+    assert BM25Index.append(path, ITEMS[:3]) == 0
+    assert reader.refresh(path) == 2
+    
+    assert len(reader) == 4
+    assert reader.search("tuition")[0]["doc_id"] == 2
+    assert reader.search("financial aid deadline")[0]["url"] == "https://example.com/aid"
+    assert BM25Index.load(path).search("welcome") == reader.search("welcome")
+    assert not [name for name in os.listdir(path) if name.endswith(".tmp")]
+    
+    reader.save(path)
+    assert reader.refresh(path) == 0
+    assert len({name.split(".")[1] for name in os.listdir(path) if name.startswith("postings.")}) == 1
@@ -0,0 +1,31 @@
+from rufus.search import structured_coverage
+
+PRODUCT = {
+    "type": "structured",
+    "schema_type": "Product",
+    "data": {
+        "@type": "Product",
+        "name": "Widget",
+        "offers": {"@type": "Offer", "price": "19.99", "availability": "InStock"}
+    }
+}
+
+EVENT = {
+    "type": "structured",
+    "schema_type": "Event",
+    "data": {"@type": "Event", "name": "Launch", "startDate": "2024-05-01", "location": {"@type": "Place"}}
+}
+
+def test_field_names_and_types_cover_instructions():
+    """Test that request words are ignored and camelCase field names are split."""
+    assert structured_coverage([PRODUCT], "Extract all product prices and availability")["coverage"] == 1.0
+    assert structured_coverage([EVENT], "Find the event start dates and locations")["coverage"] == 1.0
+
+def test_missing_fields_lower_coverage():
+    """Test that terms no field answers are reported as missing."""
+    coverage = structured_coverage([PRODUCT, EVENT], "Get product reviews and the company's ratings")
+    
+    assert coverage["matched"] == ["product"]
+    assert coverage["missing"] == ["review", "company", "rating"]
+    assert coverage["coverage"] == 0.25
+    assert structured_coverage([], "Extract product prices")["coverage"] == 0.0
@@ -0,0 +1,29 @@
+from rufus.search import RelevancePrefilter
+
+BLOCKS = [
+    "Scholarships and grants cover tuition for eligible students",
+    "The dining hall opens at seven every morning",
+    "Submit the FAFSA before the financial aid deadline",
+    "",
+    "Parking permits are sold at the campus office"
+]
+
+def test_scores_are_relative_to_best_block():
+    """Test that lexical scores favor blocks sharing terms with the query."""
+    prefilter = RelevancePrefilter()
+    
+    scores = prefilter.score(BLOCKS, "Find financial aid and scholarship information", ["fafsa"])
+    
+    assert max(scores) == 1.0
+    assert scores[1] == scores[3] == scores[4] == 0.0
+    assert scores[0] > 0 and scores[2] > 0
+
+def test_triage_sends_only_ambiguous_blocks_to_the_model():
+    """Test the split into accepted, ambiguous and rejected blocks."""
+    prefilter = RelevancePrefilter({"prefilter_accept": 0.9, "prefilter_reject": 0.1})
+    
+    triage = prefilter.triage(BLOCKS, "financial aid scholarships", ["grant"])
+    
+    assert triage["accepted"] == [max(range(5), key=lambda i: triage["scores"][i])]
+    assert sorted(triage["accepted"] + triage["ambiguous"]) == [0, 2]
+    assert triage["rejected"] == [1, 3, 4]
@@ -0,0 +1,52 @@
+import gzip
+from rufus.extractors import ContentExtractor
+from rufus.storage import ArchiveWriter, read_archive, reprocess
+
+PAGES = {
+    f"https://example.com/{n}": (
+        f"<html><body><h1>Page {n}</h1><p>Body text of page {n}</p>"
+        f"<p>Café menu {n}</p></body></html>"
+    )
+    for n in range(6)
+}
+
+def write_archive(path):
+    """Archive every page plus a failed response."""
+    with ArchiveWriter(path) as archive:
+        for url, html in PAGES.items():
+            archive.write_response(
+                url, 200,
+                {"Content-Type": "text/html; charset=latin-1", "Content-Encoding": "gzip"},
+                html.encode("latin-1")
+            )
+        archive.write_response("https://example.com/missing", 404, {}, b"Not found")
+
+def test_archive_round_trips_raw_responses(tmp_path):
+    """Test that archived responses are read back with status, headers and body."""
+    path = tmp_path / "crawl.warc.gz"
+    write_archive(path)
+    
+    # An interrupted write leaves a truncated record at the end
+    with open(path, "ab") as f:
+        f.write(gzip.compress(b"WARC/1.1\r\nWARC-Type: response\r\n" * 4)[:30])
+    
+    records = list(read_archive(path))
+    
+    assert [r.url for r in records] == list(PAGES) + ["https://example.com/missing"]
+    assert records[0].status == 200 and records[-1].status == 404
+    assert "Content-Encoding" not in records[0].headers
+    assert records[2].text() == PAGES["https://example.com/2"]
+
+def test_reprocess_matches_across_worker_counts(tmp_path):
+    """Test that parallel re-extraction yields the same items in archive order."""
+    path = tmp_path / "crawl.warc.gz"
+    write_archive(path)
+    
+    serial = list(reprocess(path, workers=1))
+    parallel = list(reprocess(path, workers=2, batch_size=2))
+    custom = list(reprocess(path, extractors=[ContentExtractor], workers=1))
+    
+    assert len(serial) == 18
+    assert [item.to_dict() for item in parallel] == [item.to_dict() for item in serial]
+    assert serial[2] == {**serial[2], "url": "https://example.com/0", "content": "Café menu 0"}
+    assert {item["url"] for item in custom} == set(PAGES)
@@ -0,0 +1,47 @@
+from rufus.extractors import ContentItem
+from rufus.storage import DocumentStore, StoreSink
+
+def make_items(pages, per_page=3):
+    """Build items for several pages, with long bodies that compress."""
+    return [
+        ContentItem("p", f"Paragraph {n} of page {page}. " * 20,
+                    url=f"https://example.com/{page}", heading_path=("Docs",), depth=1)
+        for page in range(pages)
+        for n in range(per_page)
+    ]
+
+def test_reopened_store_supports_random_and_url_access(tmp_path):
+    """Test that a written store reopens with items addressable by id and url."""
+    items = make_items(4)
+    with StoreSink(tmp_path / "crawl", compression="zstd") as sink:
+        sink.write_many(items)
+    
+    with DocumentStore(tmp_path / "crawl") as store:
+        assert len(store) == 12
+        assert store[5] == items[5].to_dict()
+        assert store[5]["heading_path"] == ["Docs"]
+        assert [item["content"] for item in store.by_url("https://example.com/2")] == [
+            item["content"] for item in items[6:9]
+        ]
+        assert store.stats()["compressed_items"] == 12
+        assert bytes(store.raw(0))[:1] != b"{"
+
+def test_records_missing_from_index_are_recovered(tmp_path):
+    """Test that records written after the last index flush are recovered."""
+    items = make_items(2)
+    store = DocumentStore(tmp_path / "crawl", mode="a")
+    store.extend(items[:4])
+    store.flush()
+    store.extend(items[4:])
+    store._segment.flush()
+    
+    # Simulate a crash: a torn record follows and the index is never updated
+    store._segment.write(b"\x40\x00")
+    store._segment.flush()
+    
+    with DocumentStore(tmp_path / "crawl", mode="a") as reopened:
+        assert len(reopened) == 6
+        assert list(reopened) == [item.to_dict() for item in items]
+        reopened.append(items[0])
+    
+    assert len(DocumentStore(tmp_path / "crawl")) == 7
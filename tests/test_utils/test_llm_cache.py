@@ -0,0 +1,40 @@
+from rufus.utils.llm_cache import DiskTier, LLMCache, cache_key
+
+def test_cache_key_covers_every_input():
+    """Test that model, template, variables and temperature all change the key."""
+    base = cache_key("gpt-4", "Rate {content}", {"content": "a", "context": "b"}, 0.1)
+    
+    assert base == cache_key("gpt-4", "Rate {content}", {"context": "b", "content": "a"}, 0.1)
+    assert base != cache_key("gpt-4o", "Rate {content}", {"content": "a", "context": "b"}, 0.1)
+    assert base != cache_key("gpt-4", "Score {content}", {"content": "a", "context": "b"}, 0.1)
+    assert base != cache_key("gpt-4", "Rate {content}", {"content": "A", "context": "b"}, 0.1)
+    assert base != cache_key("gpt-4", "Rate {content}", {"content": "a", "context": "b"}, 0.0)
+
+def test_disk_tier_survives_restart_and_counts_hits(tmp_path):
+    """Test that a new cache over the same file answers from disk, then memory."""
+    path = str(tmp_path / "llm.sqlite")
+    first = LLMCache(store=DiskTier(path))
+    assert first.get("k") is None
+    first.set("k", '{"score": 1}')
+    
+    second = LLMCache(store=DiskTier(path))
+    
+    assert second.get("k") == '{"score": 1}'
+    assert second.get("k") == '{"score": 1}'
+    assert second.stats() == {
+        "memory_hits": 1, "store_hits": 1, "misses": 0, "hit_rate": 1.0, "memory_entries": 1
+    }
+
+def test_tiers_expire_and_evict(tmp_path):
+    """Test TTL expiry and size-bounded eviction of least recently used entries."""
+    expired = LLMCache(ttl=-1)
+    expired.set("k", "v")
+    assert expired.get("k") is None
+    
+    disk = DiskTier(str(tmp_path / "llm.sqlite"), max_bytes=250)
+    cache = LLMCache(max_entries=2, store=disk)
+    for n in range(5):
+        cache.set(f"k{n}", "x" * 100)
+    
+    assert len(cache.memory) == 2
+    assert disk.get("k0") is None and disk.get("k4") == "x" * 100